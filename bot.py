@@ -9,11 +9,14 @@
 """
 
 import asyncio
+import gc
 import sys
 from pathlib import Path
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder
@@ -36,12 +39,18 @@ from middlewares.logging_v2 import AsyncLoggingMiddleware  # CRIT-004 FIX: v2.0
 from middlewares.throttling_v2 import create_redis_throttling, RateLimitConfig  # CRIT-002 FIX: v2.0
 from middlewares.errors import ErrorHandlingMiddleware  # VERSION 2.0
 from middlewares.timeout import TimeoutMiddleware  # HIGH-004 FIX: Timeout protection
+from middlewares.callback_dedup import CallbackDedupMiddleware  # PERF: Схлопывание повторных нажатий
 from middlewares.input_sanitizer import InputSanitizerMiddleware  # TASK 1.3: Input validation
-from utils.logger import logger
+from utils.logger import logger, setup_logger
 # PRODUCTION MONITORING: Sentry integration for error tracking
 from utils.sentry_config import init_sentry
 
 
+def _orjson_dumps(value) -> str:
+    """orjson.dumps возвращает bytes, а aiogram ожидает str"""
+    return orjson.dumps(value).decode()
+
+
 async def main():
     """
     Главная функция запуска бота.
@@ -68,6 +77,8 @@ async def main():
     # Загружаем конфигурацию
     try:
         config = load_config()
+        # Применяем LOG_LEVEL и файловые логи из конфигурации
+        setup_logger(log_level=config.log_level, log_dir=config.paths.logs)
         logger.info("✅ Конфигурация загружена успешно")
     except Exception as e:
         logger.critical(f"❌ Ошибка загрузки конфигурации: {e}")
@@ -92,6 +103,8 @@ async def main():
     # Создаем экземпляр бота с настройками по умолчанию
     bot = Bot(
         token=config.tg_bot.token,
+        # PERF: orjson для ответов Bot API (включая getUpdates) и reply_markup
+        session=AiohttpSession(json_loads=orjson.loads, json_dumps=_orjson_dumps),
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML  # Используем HTML для форматирование
         )
@@ -174,6 +187,7 @@ async def main():
     #
     # Execution Order (outer → inner):
     # 0. Timeout         → Предотвращает зависание event loop (защита от DoS)
+    # 0a. CallbackDedup  → Отбрасывает дубли callback'ов (в обработке и 0.5 сек после)
     # 1. Throttling      → Блокирует спам ДО любой обработки (защита ресурсов)
     # 2. InputSanitizer  → Очищает пользовательский ввод (защита от XSS/injection)
     # 3. Auth            → Аутентифицирует пользователя (требует DB)
@@ -189,6 +203,11 @@ async def main():
     dp.callback_query.middleware(timeout_middleware)
     logger.info("✅ Timeout middleware registered (30s timeout)")
 
+    # 0a. PERF: Повторные нажатия той же кнопки (пока первое обрабатывается и
+    # 0.5 сек после) не доходят до handlers (callback'и не throttl'ятся, см. UX-003)
+    dp.callback_query.middleware(CallbackDedupMiddleware(window=0.5))
+    logger.info("✅ Callback dedup middleware registered")
+
     # 1. BLOCKER-001 & CRIT-002 & SEC-002 FIX: Redis Token Bucket Throttling с Sentinel support
     try:
         if config.redis.is_sentinel_mode:
@@ -360,6 +379,12 @@ async def main():
     # Пропускаем накопленные обновления
     await bot.delete_webhook(drop_pending_updates=True)
     logger.info("✅ Накопленные обновления пропущены")
+
+    # PERF: Контент, клавиатуры и роутеры живут до конца процесса - переносим
+    # их в постоянное поколение, чтобы GC не обходил их при каждой сборке
+    gc.collect()
+    gc.freeze()
+    logger.info(f"✅ {gc.get_freeze_count()} объектов исключено из сборки мусора")
     
     logger.info("=" * 50)
     logger.info("🤖 БОТ УСПЕШНО ЗАПУЩЕН И ГОТОВ К РАБОТЕ")
@@ -404,6 +429,15 @@ if __name__ == "__main__":
     Использует asyncio.run() для запуска асинхронной главной функции.
     """
     try:
+        # PERF: uvloop (если установлен) - более быстрый цикл событий на libuv.
+        # На Windows uvloop недоступен, остаемся на стандартном asyncio
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("⚡ Используется uvloop")
+        except ImportError:
+            pass
+
         # Запускаем асинхронную главную функцию
         asyncio.run(main())
     except KeyboardInterrupt:
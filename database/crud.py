@@ -2,9 +2,10 @@
 CRUD операции для работы с базой данных
 """
 
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy import select, update, delete, func, and_, or_, desc
+from sqlalchemy import select, update, delete, func, and_, or_, desc, case
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +23,7 @@ from database.database import get_db_session
 from utils.logger import logger, log_database_operation
 from utils.timezone import format_msk_datetime, utc_to_msk
 import json
+import time
 
 
 class UserCRUD:
@@ -227,6 +229,42 @@ class UserCRUD:
             logger.error(f"Ошибка при получении списка пользователей: {e}")
             return []
     
+    @staticmethod
+    async def search_user(session: AsyncSession, query: str) -> Optional[User]:
+        """
+        Найти пользователя по Telegram ID, username или части имени одним запросом.
+
+        Приоритет совпадений: Telegram ID → точный username → подстрока в имени.
+        """
+        try:
+            username = query.lstrip('@').lower()
+            conditions = [func.lower(User.username) == username]
+            priority = [(func.lower(User.username) == username, 1)]
+
+            if query.isdigit():
+                telegram_id_match = User.telegram_id == int(query)
+                conditions.append(telegram_id_match)
+                priority.insert(0, (telegram_id_match, 0))
+
+            # SQLite приводит к нижнему регистру только ASCII, поэтому для
+            # кириллицы дополнительно проверяем типичные варианты регистра.
+            # autoescape: "%" и "_" в запросе ищутся буквально, как в имени
+            for variant in {query, query.lower(), query.capitalize()}:
+                conditions.append(User.first_name.icontains(variant, autoescape=True))
+
+            stmt = (
+                select(User)
+                .where(or_(*conditions))
+                .order_by(case(*priority, else_=2), User.id)
+                .limit(1)
+            )
+            result = await session.execute(stmt)
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            logger.error(f"Ошибка при поиске пользователя: {e}")
+            raise
+
     @staticmethod
     async def get_users_count(
         session: AsyncSession,
@@ -537,6 +575,46 @@ class ContentCRUD:
             logger.error(f"Ошибка при создании/обновлении контента {key}: {e}")
             raise
     
+    @staticmethod
+    async def set_media_file_id(
+        session: AsyncSession,
+        key: str,
+        section: str,
+        media_file_id: Optional[str],
+        media_path: Optional[str] = None,
+        media_type: Optional[str] = None
+    ) -> None:
+        """
+        Сохранить (или сбросить при None) Telegram file_id медиа контента.
+
+        В отличие от create_or_update_content позволяет очистить file_id,
+        когда Telegram перестал его принимать.
+        """
+        try:
+            stmt = select(Content).where(Content.key == key)
+            result = await session.execute(stmt)
+            content = result.scalar_one_or_none()
+
+            if content:
+                content.media_file_id = media_file_id
+                content.media_path = media_path or content.media_path
+                content.media_type = media_type or content.media_type
+                content.updated_at = datetime.utcnow()
+            else:
+                session.add(Content(
+                    key=key,
+                    section=section,
+                    media_path=media_path,
+                    media_type=media_type,
+                    media_file_id=media_file_id
+                ))
+
+            await session.commit()
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Ошибка при сохранении file_id контента {key}: {e}")
+
     @staticmethod
     async def delete_content(
         session: AsyncSession,
@@ -660,6 +738,43 @@ class AdminLogCRUD:
 # These functions provide backward compatibility for handlers that expect
 # standalone functions instead of CRUD classes.
 
+@dataclass(slots=True)
+class UserListRow:
+    """Строка списка пользователей в админке (фиксированная схема вместо dict)"""
+    telegram_id: int
+    username: Optional[str]
+    first_name: Optional[str]
+    is_blocked: bool
+    registration_date_str: str
+
+
+def _format_registration_date(registration_date: Optional[datetime]) -> str:
+    """Дата (регистрации / активности) для UI в МСК"""
+    if not registration_date:
+        return "неизвестно"
+    return format_msk_datetime(registration_date, "%d.%m.%Y %H:%M") + " (МСК)"
+
+
+def _user_to_dict(u: User) -> Dict:
+    """Преобразует User в словарь для отображения в админке"""
+    return {
+        "id": u.id,
+        "telegram_id": u.telegram_id,
+        "username": u.username,
+        "first_name": u.first_name,
+        "last_name": u.last_name,
+        "is_blocked": u.is_blocked,
+        "block_reason": u.block_reason,
+        # ИСПРАВЛЕНИЕ: Возвращаем datetime объект для корректной фильтрации
+        "registration_date": u.registration_date,
+        # ИСПРАВЛЕНИЕ: Добавлено отсутствующее поле last_activity
+        "last_activity": u.last_activity,
+        # Для отображения в UI - форматированные строки в МСК
+        "registration_date_str": _format_registration_date(u.registration_date),
+        "last_activity_str": format_msk_datetime(u.last_activity, "%d.%m.%Y %H:%M") + " (МСК)" if u.last_activity else "неизвестно"
+    }
+
+
 async def get_all_users(limit: int = 100) -> List[Dict]:
     """Wrapper: Get all users as dict list
 
@@ -669,27 +784,125 @@ async def get_all_users(limit: int = 100) -> List[Dict]:
     """
     async for session in get_db_session():
         users = await UserCRUD.get_all_users(session, limit=limit)
+        return [_user_to_dict(u) for u in users]
+    return []
+
+
+async def get_all_users_page(offset: int, limit: int) -> List[UserListRow]:
+    """Wrapper: Get one page of users (SQL LIMIT/OFFSET) as typed rows
+
+    PERF: Для пагинации в админке загружается только текущая страница,
+    а не весь список пользователей. Строки - slots-dataclass с доступом
+    по атрибутам вместо dict.get().
+    """
+    async for session in get_db_session():
+        users = await UserCRUD.get_all_users(session, limit=limit, offset=offset)
         return [
-            {
-                "id": u.id,
-                "telegram_id": u.telegram_id,
-                "username": u.username,
-                "first_name": u.first_name,
-                "last_name": u.last_name,
-                "is_blocked": u.is_blocked,
-                # ИСПРАВЛЕНИЕ: Возвращаем datetime объект для корректной фильтрации
-                "registration_date": u.registration_date,
-                # ИСПРАВЛЕНИЕ: Добавлено отсутствующее поле last_activity
-                "last_activity": u.last_activity,
-                # Для отображения в UI - форматированные строки в МСК
-                "registration_date_str": format_msk_datetime(u.registration_date, "%d.%m.%Y %H:%M") + " (МСК)" if u.registration_date else "неизвестно",
-                "last_activity_str": format_msk_datetime(u.last_activity, "%d.%m.%Y %H:%M") + " (МСК)" if u.last_activity else "неизвестно"
-            }
+            UserListRow(
+                telegram_id=u.telegram_id,
+                username=u.username,
+                first_name=u.first_name,
+                is_blocked=u.is_blocked,
+                registration_date_str=_format_registration_date(u.registration_date)
+            )
             for u in users
         ]
     return []
 
 
+async def get_users_count() -> int:
+    """Wrapper: Get total number of users"""
+    async for session in get_db_session():
+        return await UserCRUD.get_users_count(session)
+    return 0
+
+
+async def _get_users_since(column, since: datetime, limit: int, offset: int = 0) -> List[tuple]:
+    """
+    Пользователи, у которых column >= since (сначала самые свежие).
+
+    PERF: Выбираются только отображаемые колонки, строки возвращаются
+    кортежами (first_name, username, telegram_id, дата в МСК) без ORM-объектов и dict.
+    """
+    async for session in get_db_session():
+        stmt = (
+            select(User.first_name, User.username, User.telegram_id, column)
+            .where(column >= since)
+            # User.id - стабильный порядок OFFSET-страниц при равных датах
+            .order_by(desc(column), User.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return [
+            (first_name, username, telegram_id, _format_registration_date(value))
+            for first_name, username, telegram_id, value in result.all()
+        ]
+    return []
+
+
+async def _count_users_since(column, since: datetime) -> int:
+    """Количество пользователей, у которых column >= since"""
+    async for session in get_db_session():
+        stmt = select(func.count(User.id)).where(column >= since)
+        return await session.scalar(stmt) or 0
+    return 0
+
+
+async def get_users_active_since(since: datetime, limit: int = 50, offset: int = 0) -> List[tuple]:
+    """Wrapper: Get users with last_activity >= since as (first_name, username, telegram_id, last_activity_str) rows
+
+    PERF: Фильтрация выполняется в SQL (индекс по last_activity)
+    вместо загрузки 1000 пользователей и фильтрации в Python.
+    """
+    return await _get_users_since(User.last_activity, since, limit, offset)
+
+
+async def get_users_registered_since(since: datetime, limit: int = 50, offset: int = 0) -> List[tuple]:
+    """Wrapper: Get users with registration_date >= since as (first_name, username, telegram_id, registration_date_str) rows
+
+    PERF: Фильтрация выполняется в SQL (индекс по registration_date).
+    """
+    return await _get_users_since(User.registration_date, since, limit, offset)
+
+
+async def count_users_active_since(since: datetime) -> int:
+    """Wrapper: Count users with last_activity >= since"""
+    return await _count_users_since(User.last_activity, since)
+
+
+async def count_users_registered_since(since: datetime) -> int:
+    """Wrapper: Count users with registration_date >= since"""
+    return await _count_users_since(User.registration_date, since)
+
+
+async def search_user(query: str) -> Optional[Dict]:
+    """Wrapper: Search user by Telegram ID, username or first name as dict
+
+    PERF: Один индексируемый SQL-запрос с LIMIT 1 вместо загрузки
+    1000 пользователей и перебора в Python.
+    """
+    async for session in get_db_session():
+        user = await UserCRUD.search_user(session, query)
+        return _user_to_dict(user) if user else None
+    return None
+
+
+async def get_broadcast_recipients(active_only: bool = False) -> List[int]:
+    """Wrapper: Get telegram IDs of non-blocked users for a broadcast
+
+    PERF: Заблокированные отсекаются в SQL, выбирается только telegram_id
+    (без загрузки ORM-объектов и построения словарей).
+    """
+    async for session in get_db_session():
+        stmt = select(User.telegram_id).where(User.is_blocked == False)
+        if active_only:
+            stmt = stmt.where(User.is_active == True)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+    return []
+
+
 async def get_user_by_telegram_id(telegram_id: int) -> Optional[Dict]:
     """Wrapper: Get user by telegram ID as dict
 
@@ -719,17 +932,43 @@ async def get_user_by_telegram_id(telegram_id: int) -> Optional[Dict]:
 async def block_user(telegram_id: int, reason: Optional[str] = None) -> bool:
     """Wrapper: Block user"""
     async for session in get_db_session():
-        return await UserCRUD.block_user(session, telegram_id, reason)
+        result = await UserCRUD.block_user(session, telegram_id, reason)
+        invalidate_users_count_cache()
+        return result
     return False
 
 
 async def unblock_user(telegram_id: int) -> bool:
     """Wrapper: Unblock user"""
     async for session in get_db_session():
-        return await UserCRUD.unblock_user(session, telegram_id)
+        result = await UserCRUD.unblock_user(session, telegram_id)
+        invalidate_users_count_cache()
+        return result
     return False
 
 
+async def get_media_file_id(key: str) -> Optional[str]:
+    """Wrapper: Telegram file_id медиа контента по ключу"""
+    async for session in get_db_session():
+        content = await ContentCRUD.get_content(session, key)
+        return content.media_file_id if content else None
+    return None
+
+
+async def set_media_file_id(
+    key: str,
+    section: str,
+    media_file_id: Optional[str],
+    media_path: Optional[str] = None,
+    media_type: Optional[str] = None
+) -> None:
+    """Wrapper: Сохранить/сбросить Telegram file_id медиа контента"""
+    async for session in get_db_session():
+        await ContentCRUD.set_media_file_id(
+            session, key, section, media_file_id, media_path, media_type
+        )
+
+
 async def get_user_activity(user_id: int, limit: int = 50) -> List[Dict]:
     """Wrapper: Get user activity as dict list"""
     async for session in get_db_session():
@@ -748,9 +987,6 @@ async def get_user_activity(user_id: int, limit: int = 50) -> List[Dict]:
 async def get_statistics() -> Dict[str, Any]:
     """Wrapper: Get general statistics"""
     async for session in get_db_session():
-        from datetime import datetime, timedelta
-        from sqlalchemy import select, func
-
         # Total users
         total_users = await UserCRUD.get_users_count(session)
 
@@ -801,32 +1037,64 @@ async def get_active_users_count() -> int:
     return 0
 
 
+# PERF: Счётчик пользователей меняется редко, а админ часто переключает
+# аудитории рассылки - кэшируем ответ на несколько секунд
+ACTIVE_USERS_COUNT_TTL = 15.0
+_count_cache: Dict[str, tuple] = {}
+
+
+async def get_active_users_count_cached(ttl: float = ACTIVE_USERS_COUNT_TTL) -> int:
+    """Wrapper: get_active_users_count() with a short in-process TTL cache"""
+    now = time.monotonic()
+    cached = _count_cache.get("active")
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    count = await get_active_users_count()
+    _count_cache["active"] = (now, count)
+    return count
+
+
+def invalidate_users_count_cache() -> None:
+    """Сбрасывает кэш счётчиков пользователей (после блокировки/разблокировки)"""
+    _count_cache.clear()
+
+
 async def get_new_users_count(days: int = 7) -> int:
     """Wrapper: Get count of new users in last N days"""
     async for session in get_db_session():
-        from datetime import datetime, timedelta
         cutoff = datetime.utcnow() - timedelta(days=days)
         stmt = select(func.count(User.id)).where(User.registration_date >= cutoff)
         return await session.scalar(stmt) or 0
     return 0
 
 
-async def get_blocked_users() -> List[Dict]:
-    """Wrapper: Get blocked users"""
+async def get_blocked_users(limit: int = 100, offset: int = 0) -> List[tuple]:
+    """Wrapper: Get blocked users as (first_name, username, telegram_id, block_reason) rows
+
+    PERF: Выбираются только отображаемые колонки, без ORM-объектов и dict.
+    """
     async for session in get_db_session():
-        users = await UserCRUD.get_all_users(session, is_blocked=True, limit=100)
-        return [
-            {
-                "telegram_id": u.telegram_id,
-                "username": u.username,
-                "first_name": u.first_name,
-                "block_reason": u.block_reason
-            }
-            for u in users
-        ]
+        stmt = (
+            select(User.first_name, User.username, User.telegram_id, User.block_reason)
+            .where(User.is_blocked == True)
+            .order_by(desc(User.registration_date), User.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return [tuple(row) for row in result.all()]
     return []
 
 
+async def count_blocked_users() -> int:
+    """Wrapper: Count blocked users"""
+    async for session in get_db_session():
+        stmt = select(func.count(User.id)).where(User.is_blocked == True)
+        return await session.scalar(stmt) or 0
+    return 0
+
+
 async def get_section_statistics(days: int = 30) -> List[tuple]:
     """
     Wrapper: Get popular sections statistics
@@ -1151,16 +1419,30 @@ __all__ = [
     "ActivityCRUD",
     "ContentCRUD",
     "AdminLogCRUD",
+    "UserListRow",
     # Compatibility wrappers for admin.py
     "get_all_users",
+    "get_all_users_page",
+    "get_users_count",
+    "get_users_active_since",
+    "get_users_registered_since",
+    "count_users_active_since",
+    "count_users_registered_since",
+    "search_user",
+    "get_broadcast_recipients",
     "get_user_by_telegram_id",
     "block_user",
     "unblock_user",
+    "get_media_file_id",
+    "set_media_file_id",
     "get_user_activity",
     "get_statistics",
     "get_active_users_count",
+    "get_active_users_count_cached",
+    "invalidate_users_count_cache",
     "get_new_users_count",
     "get_blocked_users",
+    "count_blocked_users",
     "get_section_statistics",
     "log_user_activity",
     # MVP FEATURES: Activity logs
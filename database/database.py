@@ -134,6 +134,27 @@ class DatabaseManager:
             await self.engine.dispose()
             logger.info("Соединение с базой данных закрыто")
     
+    def get_pool_stats(self) -> dict:
+        """
+        Состояние пула соединений движка.
+
+        Все сессии (get_db_session) берут соединения из одного пула,
+        созданного в init(); новое подключение на каждый запрос не открывается.
+
+        Returns:
+            dict: size / checked_out / overflow / checked_in для QueuePool,
+                  пустой словарь для NullPool (SQLite) или до init()
+        """
+        pool = self.engine.pool if self.engine else None
+        if pool is None or not hasattr(pool, "checkedout"):
+            return {}
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checked_in": pool.checkedin()
+        }
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """
@@ -239,6 +260,13 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_db_pool_stats() -> dict:
+    """Состояние пула соединений глобального менеджера БД"""
+    if not db_manager:
+        return {}
+    return db_manager.get_pool_stats()
+
+
 async def close_db() -> None:
     """Закрытие глобального соединения с БД"""
     global db_manager
@@ -275,14 +303,15 @@ async def check_db_health() -> dict:
             users_count = await session.scalar(
                 select(func.count()).select_from(User)
             )
+            pool_stats = db_manager.get_pool_stats()
             
             return {
                 "status": "ok",
                 "message": "База данных работает нормально",
                 "stats": {
                     "users_count": users_count,
-                    "engine_pool_size": getattr(db_manager.engine.pool, "size", None),
-                    "engine_pool_checked_out": getattr(db_manager.engine.pool, "checked_out", None)
+                    "engine_pool_size": pool_stats.get("size"),
+                    "engine_pool_checked_out": pool_stats.get("checked_out")
                 }
             }
     except Exception as e:
@@ -294,6 +323,7 @@ __all__ = [
     "db_manager",
     "init_db",
     "get_db_session",
+    "get_db_pool_stats",
     "close_db",
     "check_db_health"
 ]
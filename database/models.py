@@ -69,11 +69,13 @@ class User(Base):
     block_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Timestamps
-    registration_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # PERF: индексы для выборок "активные сегодня" / "новые за неделю" в админке
+    registration_date: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
     last_activity: Mapped[datetime] = mapped_column(
         DateTime, 
         default=datetime.utcnow, 
-        onupdate=datetime.utcnow
+        onupdate=datetime.utcnow,
+        index=True
     )
     
     # Statistics
@@ -9,20 +9,24 @@ Handler для админ-панели.
 - Рассылку сообщений
 """
 
+import asyncio
 import csv
 import hashlib  # Deprecated: kept for backward compatibility
+import hmac
 import json
+import re
 import shutil
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 # SEC-001 FIX: bcrypt for secure password hashing
 import bcrypt
 
-from aiogram import Router, F
-from aiogram.types import CallbackQuery, Message, FSInputFile
+from aiogram import Bot, Router, F
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import CallbackQuery, Message, FSInputFile, LinkPreviewOptions
 from aiogram.fsm.context import FSMContext
 from aiogram.filters import StateFilter
 
@@ -38,26 +42,47 @@ from keyboards.admin_kb import (
     get_cancel_button,
     get_pagination_keyboard
 )
+from keyboards.inline import get_main_menu_keyboard
+from handlers.start import RETURN_TEXT
+from handlers.general_info import (
+    check_content as check_general_info_content,
+    reload_content as reload_general_info_content
+)
+from handlers.sales import reload_content as reload_sales_content
+from handlers.sport import (
+    check_content as check_sport_content,
+    reload_content as reload_sport_content
+)
 from states.admin_states import AdminStates
+from database.database import get_db_pool_stats
 from database.crud import (
-    get_all_users,
-    get_user_by_telegram_id,
+    get_all_users_page,
+    get_users_count,
+    get_users_active_since,
+    get_users_registered_since,
+    count_users_active_since,
+    count_users_registered_since,
+    search_user,
+    get_broadcast_recipients,
     block_user,
     unblock_user,
     get_user_activity,
     get_statistics,
-    get_active_users_count,
+    get_active_users_count_cached,
     get_new_users_count,
     get_blocked_users,
+    count_blocked_users,
     get_section_statistics,
     get_recent_activity,
     get_all_activity_for_export,
     get_date_statistics,
-    get_users_for_export
+    get_users_for_export,
+    UserListRow
 )
 # CRIT-005 FIX: Don't load config globally
 from utils.logger import logger
-from utils.timezone import get_msk_now, format_msk_datetime
+from utils.timezone import format_msk_now, format_msk_datetime
+from utils.task_manager import create_tracked_task
 # BLOCKER-002 FIX: Redis-backed password attempt tracking
 from utils.auth_security import get_auth_security, MAX_ATTEMPTS, BLOCK_DURATION_MINUTES
 # HIGH-003 FIX: Input sanitization and HTML escaping
@@ -74,6 +99,22 @@ import os
 # Создаем router для админки
 router = Router(name='admin')
 
+# callback_data раздела контента: content_<раздел>
+_CONTENT_SECTION_PREFIX = "content_"
+
+# Перезагрузка контента в памяти обработчиков после правки JSON из админки
+_CONTENT_RELOADERS = {
+    "general": reload_general_info_content,
+    "sales": reload_sales_content,
+    "sport": reload_sport_content
+}
+
+# Проверка рендеринга правки до записи файла (раздел продаж не рендерится заранее)
+_CONTENT_CHECKERS = {
+    "general": check_general_info_content,
+    "sport": check_sport_content
+}
+
 # SEC-001 FIX: bcrypt password hash from .env
 # ⚠️ MIGRATION NOTE: Old SHA-256 hashes still supported for backward compatibility
 # Generate new hash: python generate_admin_hash.py
@@ -82,6 +123,38 @@ router = Router(name='admin')
 DEFAULT_ADMIN_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5ViT8QJy4E6M6"  # bcrypt: admin123
 ADMIN_PASS_HASH = os.getenv("ADMIN_PASS_HASH", DEFAULT_ADMIN_HASH)
 
+# Пагинация списка пользователей
+USERS_PER_PAGE = 10
+# Пагинация списков заблокированных / активных / новых пользователей
+LIST_PAGE_SIZE = 50
+
+# PERF: Статические клавиатуры строятся один раз при импорте, а не на каждый callback.
+# Фабрики из keyboards.admin_kb без аргументов должны оставаться чистыми.
+_ADMIN_MAIN_MENU = get_admin_main_menu()
+_STATS_MENU = get_stats_menu()
+_USERS_MENU = get_users_menu()
+_CONTENT_MENU = get_content_menu()
+_BROADCAST_MENU = get_broadcast_menu()
+_BACK_TO_ADMIN = get_back_to_admin()
+_CANCEL_BUTTON = get_cancel_button()
+
+# Медали для топ-3 позиций в рейтингах
+_MEDALS = ("🥇", "🥈", "🥉")
+
+# PERF: Шаблоны строк списков пользователей разбираются один раз при импорте
+_BLOCKED_ROW = "🚫 <b>{0}</b> ({1})\n   ID: <code>{2}</code>\n   Причина: {3}\n\n"
+_ACTIVE_ROW = "✅ <b>{0}</b> ({1})\n   ID: <code>{2}</code>\n   Последняя активность: {3}\n\n"
+_NEW_ROW = "🆕 <b>{0}</b> ({1})\n   ID: <code>{2}</code>\n   Регистрация: {3}\n\n"
+
+# PERF: Рассылка отправляется пачками параллельно. Telegram допускает
+# ~30 сообщений в секунду в разные чаты, поэтому пачка = 30 сообщений,
+# и на каждую пачку отводится не меньше секунды.
+BROADCAST_BATCH_SIZE = 30
+BROADCAST_BATCH_INTERVAL = 1.0
+# Тихая доставка без превью ссылок: дешевле для Bot API и реже приводит к RetryAfter
+BROADCAST_SILENT = True
+_broadcast_semaphore = asyncio.Semaphore(BROADCAST_BATCH_SIZE)
+
 # BLOCKER-002 FIX: Password attempts now tracked in Redis via utils.auth_security
 # Removed in-memory password_attempts dict - now persists across bot restarts
 # Maximum attempts and block duration configured in utils.auth_security:
@@ -93,12 +166,35 @@ def hash_password(password: str) -> str:
     """
     Deprecated: Хеширует пароль с помощью SHA-256
 
-    SEC-001: Use bcrypt instead. This function kept for backward compatibility only.
+    SEC-001: Use bcrypt instead. This function kept for backward compatibility only
+    (CLI helpers); the verify path compares raw digests via _legacy_digest().
     """
     return hashlib.sha256(password.encode()).hexdigest()
 
 
-def check_password(input_password: str, correct_password_hash: str) -> bool:
+def _is_bcrypt_hash(password_hash: str) -> bool:
+    """Проверяет, что хеш в формате bcrypt ($2b$/$2a$)."""
+    return password_hash.startswith(("$2b$", "$2a$"))
+
+
+def _legacy_digest(password_hash: str) -> bytes | None:
+    """
+    Декодирует legacy SHA-256 hex-хеш в 32 байта.
+
+    Returns:
+        Raw digest, либо None если хеш не является валидным hex
+    """
+    try:
+        return bytes.fromhex(password_hash)
+    except ValueError:
+        return None
+
+
+# PERF: Legacy SHA-256 hash decoded once at import instead of on every login attempt
+_ADMIN_PASS_DIGEST = None if _is_bcrypt_hash(ADMIN_PASS_HASH) else _legacy_digest(ADMIN_PASS_HASH)
+
+
+def check_password(input_password: str, correct_password_hash: str = ADMIN_PASS_HASH) -> bool:
     """
     Проверяет правильность введенного пароля
 
@@ -112,7 +208,7 @@ def check_password(input_password: str, correct_password_hash: str) -> bool:
         True if password matches, False otherwise
     """
     # SEC-001: Check if hash is bcrypt format
-    if correct_password_hash.startswith("$2b$") or correct_password_hash.startswith("$2a$"):
+    if _is_bcrypt_hash(correct_password_hash):
         # New bcrypt verification (secure)
         try:
             return bcrypt.checkpw(
@@ -120,15 +216,158 @@ def check_password(input_password: str, correct_password_hash: str) -> bool:
                 correct_password_hash.encode('utf-8')
             )
         except Exception as e:
-            logger.error(f"bcrypt verification error: {e}")
+            logger.error("bcrypt verification error: {}", e)
             return False
+
+    # Legacy SHA-256 verification (insecure, backward compatibility)
+    logger.warning(
+        "⚠️ SECURITY WARNING: Using legacy SHA-256 password hash! "
+        "Please regenerate with bcrypt: python generate_admin_hash.py"
+    )
+    if correct_password_hash == ADMIN_PASS_HASH:
+        expected_digest = _ADMIN_PASS_DIGEST
     else:
-        # Legacy SHA-256 verification (insecure, backward compatibility)
-        logger.warning(
-            "⚠️ SECURITY WARNING: Using legacy SHA-256 password hash! "
-            "Please regenerate with bcrypt: python generate_admin_hash.py"
+        expected_digest = _legacy_digest(correct_password_hash)
+    if expected_digest is None:
+        return False
+
+    # Constant-time comparison of raw 32-byte digests (no hex encoding per call)
+    return hmac.compare_digest(
+        hashlib.sha256(input_password.encode('utf-8')).digest(),
+        expected_digest
+    )
+
+
+def _rank_label(position: int) -> str:
+    """Возвращает медаль для топ-3 или порядковый номер для остальных позиций."""
+    return _MEDALS[position - 1] if position <= len(_MEDALS) else f"{position}."
+
+
+def _format_users_page(page_users: List[UserListRow], page: int, total_pages: int) -> str:
+    """
+    Формирует текст страницы списка пользователей.
+
+    PERF: Строки собираются в список и склеиваются один раз через join.
+    """
+    parts = [f"📋 <b>Список пользователей</b> (стр. {page}/{total_pages})\n\n"]
+    # PERF: Связанные методы/функции поднимаются в локальные переменные один раз на страницу
+    append = parts.append
+    sanitize_name = sanitize_user_input
+    sanitize_login = sanitize_username
+
+    for user in page_users:
+        status = "🚫" if user.is_blocked else "✅"
+
+        # HIGH-003 FIX: Sanitize user data before display
+        first_name = sanitize_name(user.first_name or 'Без имени', max_length=50)
+        username_raw = user.username
+        if username_raw:
+            username = f"@{sanitize_login(username_raw)}"
+        else:
+            username = "нет username"
+
+        append(
+            f"{status} <b>{first_name}</b> ({username})\n"
+            f"   ID: <code>{user.telegram_id}</code>\n"
+            f"   Регистрация: {user.registration_date_str}\n\n"
+        )
+
+    return "".join(parts)
+
+
+def _parse_list_page(callback_data: str) -> int:
+    """Номер страницы из callback "<prefix>_page_N" (без суффикса - первая страница)."""
+    if "_page_" not in callback_data:
+        return 1
+    return max(int(callback_data.rsplit("_", 1)[-1]), 1)
+
+
+async def _fetch_list_page(fetch_rows, count_rows, page: int) -> tuple[list, int, int]:
+    """
+    Загружает страницу списка и общее количество строк.
+
+    PERF: Сначала дешёвый COUNT(*) по индексу - на пустом списке строки
+    не загружаются вовсе. fetch_rows(offset) запрашивает LIST_PAGE_SIZE строк.
+
+    Returns:
+        (строки, всего, номер страницы) - номер ограничен последней страницей,
+        чтобы устаревшая кнопка "вперед" не показывала пустой список
+    """
+    total = await count_rows()
+    if not total:
+        return [], 0, 1
+    page = min(page, (total + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE)
+    return await fetch_rows((page - 1) * LIST_PAGE_SIZE), total, page
+
+
+def _list_page_keyboard(page: int, total: int, callback_prefix: str):
+    """Меню пользователей для одной страницы, иначе клавиатура пагинации."""
+    total_pages = (total + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE
+    if total_pages <= 1:
+        return _USERS_MENU  # Кнопка "Назад к управлению пользователями"
+    return get_pagination_keyboard(page, total_pages, callback_prefix)
+
+
+async def _safe_delete(message: Message) -> None:
+    """Удаляет сообщение, игнорируя ошибки (best-effort)."""
+    try:
+        await message.delete()
+    except Exception:
+        pass
+
+
+async def _send_broadcast_message(bot: Bot, chat_id: int, payload: dict) -> bool:
+    """Отправляет одно сообщение рассылки. Возвращает True при успехе."""
+    async with _broadcast_semaphore:
+        try:
+            await bot.send_message(chat_id=chat_id, **payload)
+            return True
+        except TelegramRetryAfter as e:
+            # Flood control: ждём, сколько просит Telegram, и повторяем один раз
+            logger.warning("⚠️ Flood control при рассылке, ожидание {} сек", e.retry_after)
+            await asyncio.sleep(e.retry_after)
+            try:
+                await bot.send_message(chat_id=chat_id, **payload)
+                return True
+            except Exception as retry_error:
+                logger.error("Ошибка отправки пользователю {}: {}", chat_id, retry_error)
+                return False
+        except Exception as e:
+            logger.error("Ошибка отправки пользователю {}: {}", chat_id, e)
+            return False
+
+
+async def _send_broadcast(bot: Bot, chat_ids: List[int], text: str) -> tuple[int, int]:
+    """
+    Рассылает text по chat_ids пачками через asyncio.gather.
+
+    Returns:
+        tuple[int, int]: (успешно, ошибок)
+    """
+    # PERF: параметры сообщения собираются один раз на всю рассылку
+    payload = {
+        "text": text,
+        "disable_notification": BROADCAST_SILENT,
+        "link_preview_options": LinkPreviewOptions(is_disabled=True)
+    }
+    loop = asyncio.get_running_loop()
+    success_count = 0
+
+    for start in range(0, len(chat_ids), BROADCAST_BATCH_SIZE):
+        batch_started = loop.time()
+        batch = chat_ids[start:start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(_send_broadcast_message(bot, chat_id, payload) for chat_id in batch)
         )
-        return hash_password(input_password) == correct_password_hash
+        success_count += sum(results)
+
+        # Не превышаем лимит Telegram: одна пачка - не чаще раза в секунду
+        if start + BROADCAST_BATCH_SIZE < len(chat_ids):
+            elapsed = loop.time() - batch_started
+            if elapsed < BROADCAST_BATCH_INTERVAL:
+                await asyncio.sleep(BROADCAST_BATCH_INTERVAL - elapsed)
+
+    return success_count, len(chat_ids) - success_count
 
 
 # BLOCKER-002 FIX: Redis-backed password attempt tracking
@@ -219,11 +458,11 @@ async def request_admin_password(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_cancel_button()
+            reply_markup=_CANCEL_BUTTON
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка при запросе пароля: {e}")
+        logger.error("Ошибка при запросе пароля: {}", e)
         await callback.answer("Ошибка")
 
 
@@ -247,17 +486,16 @@ async def cancel_admin_action(callback: CallbackQuery, state: FSMContext):
 
         # Логируем отмену входа в админку
         logger.info(
-            f"👤 Пользователь {user_id} (@{callback.from_user.username}) "
-            f"отменил вход в админ-панель из состояния: {current_state}"
+            "👤 Пользователь {} (@{}) "
+            "отменил вход в админ-панель из состояния: {}",
+            user_id,
+            callback.from_user.username,
+            current_state
         )
 
         # Сбрасываем FSM состояние (безопасно даже если уже сброшено)
         await state.clear()
 
-        # Импортируем константы для главного меню
-        from handlers.start import RETURN_TEXT
-        from keyboards.inline import get_main_menu_keyboard
-
         # Возвращаем в главное меню
         await callback.message.edit_text(
             text=RETURN_TEXT,
@@ -267,12 +505,14 @@ async def cancel_admin_action(callback: CallbackQuery, state: FSMContext):
         # Отвечаем на callback
         await callback.answer("❌ Вход в админ-панель отменен")
 
-        logger.info(f"✅ Пользователь {user_id} успешно вернулся в главное меню после отмены")
+        logger.info("✅ Пользователь {} успешно вернулся в главное меню после отмены", user_id)
 
     except Exception as e:
         # ИСПРАВЛЕНИЕ: Расширенное логирование ошибок с полным traceback
         logger.error(
-            f"❌ Ошибка при отмене входа в админку для пользователя {callback.from_user.id}: {e}",
+            "❌ Ошибка при отмене входа в админку для пользователя {}: {}",
+            callback.from_user.id,
+            e,
             exc_info=True
         )
         # Даже при ошибке пытаемся уведомить пользователя
@@ -289,10 +529,13 @@ async def process_admin_password(message: Message, state: FSMContext):
     input_password = message.text.strip()
 
     # Удаляем сообщение с паролем для безопасности
+    # PERF: Удаление идет фоновой задачей параллельно с проверкой пароля
+    delete_coro = _safe_delete(message)
     try:
-        await message.delete()
-    except Exception:
-        pass
+        await create_tracked_task(delete_coro, name=f"admin_password_delete_{user_id}")
+    except RuntimeError:
+        # TaskManager переполнен - удаляем синхронно
+        await delete_coro
 
     # BLOCKER-002 FIX: Check Redis-backed block status
     is_blocked, blocked_until = await is_user_blocked_from_attempts(user_id)
@@ -315,17 +558,19 @@ async def process_admin_password(message: Message, state: FSMContext):
             await reset_password_attempts(user_id)
             await state.set_state(AdminStates.authorized)
 
-            logger.info(f"✅ Пользователь {user_id} (@{message.from_user.username}) успешно авторизован в админке")
+            logger.info("✅ Пользователь {} (@{}) успешно авторизован в админке", user_id, message.from_user.username)
 
             # Показываем админ-панель
             await show_admin_panel(message, state)
 
-            logger.info(f"✅ Админ-панель успешно показана пользователю {user_id}")
+            logger.debug("✅ Админ-панель успешно показана пользователю {}", user_id)
 
         except Exception as e:
             # ИСПРАВЛЕНИЕ: Полное логирование ошибок с traceback
             logger.error(
-                f"❌ Критическая ошибка при входе в админку для пользователя {user_id}: {e}",
+                "❌ Критическая ошибка при входе в админку для пользователя {}: {}",
+                user_id,
+                e,
                 exc_info=True
             )
             # Уведомляем пользователя о проблеме
@@ -345,8 +590,12 @@ async def process_admin_password(message: Message, state: FSMContext):
         attempts, blocked_until = await increment_password_attempts(user_id)
 
         logger.warning(
-            f"⚠️ Неверный пароль от {user_id} ({message.from_user.username}). "
-            f"Попытка {attempts}/{MAX_ATTEMPTS}"
+            "⚠️ Неверный пароль от {} ({}). "
+            "Попытка {}/{}",
+            user_id,
+            message.from_user.username,
+            attempts,
+            MAX_ATTEMPTS
         )
 
         if blocked_until:
@@ -376,15 +625,15 @@ async def show_admin_panel(message: Message, state: FSMContext):
     """
     try:
         # Логируем попытку показа админ-панели
-        logger.info(f"🔒 Загрузка админ-панели для пользователя {message.from_user.id}")
+        logger.info("🔒 Загрузка админ-панели для пользователя {}", message.from_user.id)
 
         # Получаем статистику для приветствия
         try:
             stats = await get_statistics()
-            logger.info(f"✅ Статистика загружена успешно")
+            logger.debug("✅ Статистика загружена успешно")
         except Exception as stats_error:
             # Если ошибка при получении статистики - используем заглушку
-            logger.error(f"⚠️ Ошибка при загрузке статистики: {stats_error}", exc_info=True)
+            logger.error("⚠️ Ошибка при загрузке статистики: {}", stats_error, exc_info=True)
             stats = {
                 'total_users': 0,
                 'active_today': 0,
@@ -398,7 +647,7 @@ async def show_admin_panel(message: Message, state: FSMContext):
             "🔒 <b>Админ-панель</b>\n\n"
             f"👤 Администратор: {admin_name}\n"
             # TIMEZONE: Используем московское время для отображения
-            f"🕐 Вход: {get_msk_now().strftime('%d.%m.%Y %H:%M')} (МСК)\n\n"
+            f"🕐 Вход: {format_msk_now('%d.%m.%Y %H:%M')} (МСК)\n\n"
             f"📊 <b>Быстрая статистика:</b>\n"
             f"• Всего пользователей: {stats.get('total_users', 0)}\n"
             f"• Активных сегодня: {stats.get('active_today', 0)}\n"
@@ -408,15 +657,17 @@ async def show_admin_panel(message: Message, state: FSMContext):
 
         await message.answer(
             text=text,
-            reply_markup=get_admin_main_menu()
+            reply_markup=_ADMIN_MAIN_MENU
         )
 
-        logger.info(f"✅ Админ-панель успешно отправлена пользователю {message.from_user.id}")
+        logger.debug("✅ Админ-панель успешно отправлена пользователю {}", message.from_user.id)
 
     except Exception as e:
         # ИСПРАВЛЕНИЕ: Полное логирование всех ошибок с traceback
         logger.error(
-            f"❌ Критическая ошибка в show_admin_panel для пользователя {message.from_user.id}: {e}",
+            "❌ Критическая ошибка в show_admin_panel для пользователя {}: {}",
+            message.from_user.id,
+            e,
             exc_info=True
         )
         # Пробрасываем исключение выше для обработки в process_admin_password
@@ -442,19 +693,21 @@ async def return_to_admin_panel(callback: CallbackQuery, state: FSMContext):
     # вместо жесткого списка конкретных состояний
     if current_state and not current_state.startswith("AdminStates:"):
         logger.warning(
-            f"⚠️ Пользователь {callback.from_user.id} пытается войти в админку из состояния {current_state}"
+            "⚠️ Пользователь {} пытается войти в админку из состояния {}",
+            callback.from_user.id,
+            current_state
         )
         await callback.answer("Доступ запрещен", show_alert=True)
         return
 
-    logger.info(f"🔙 Пользователь {callback.from_user.id} возвращается в главное меню админки")
+    logger.info("🔙 Пользователь {} возвращается в главное меню админки", callback.from_user.id)
 
     await state.set_state(AdminStates.authorized)
 
     try:
         stats = await get_statistics()
     except Exception as stats_error:
-        logger.error(f"❌ Ошибка при получении статистики: {stats_error}", exc_info=True)
+        logger.error("❌ Ошибка при получении статистики: {}", stats_error, exc_info=True)
         stats = {'total_users': 0, 'active_today': 0, 'new_this_week': 0}
     
     text = (
@@ -470,11 +723,11 @@ async def return_to_admin_panel(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_admin_main_menu()
+            reply_markup=_ADMIN_MAIN_MENU
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка возврата в админку: {e}")
+        logger.error("Ошибка возврата в админку: {}", e)
         await callback.answer("Ошибка")
 
 
@@ -492,7 +745,7 @@ async def return_to_admin_from_logs(callback: CallbackQuery, state: FSMContext):
     - Добавляет логирование для отладки
     - Обрабатывает ошибки с try-except
     """
-    logger.info(f"🔙 Пользователь {callback.from_user.id} возвращается из логов в главное меню админки")
+    logger.info("🔙 Пользователь {} возвращается из логов в главное меню админки", callback.from_user.id)
 
     try:
         # Сбрасываем состояние на authorized
@@ -502,7 +755,7 @@ async def return_to_admin_from_logs(callback: CallbackQuery, state: FSMContext):
         try:
             stats = await get_statistics()
         except Exception as stats_error:
-            logger.error(f"❌ Ошибка при получении статистики: {stats_error}", exc_info=True)
+            logger.error("❌ Ошибка при получении статистики: {}", stats_error, exc_info=True)
             stats = {'total_users': 0, 'active_today': 0, 'new_this_week': 0}
 
         text = (
@@ -517,13 +770,13 @@ async def return_to_admin_from_logs(callback: CallbackQuery, state: FSMContext):
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_admin_main_menu()
+            reply_markup=_ADMIN_MAIN_MENU
         )
         await callback.answer()
-        logger.info(f"✅ Пользователь успешно вернулся в главное меню")
+        logger.debug("✅ Пользователь успешно вернулся в главное меню")
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при возврате в админку из логов: {e}", exc_info=True)
+        logger.error("❌ Ошибка при возврате в админку из логов: {}", e, exc_info=True)
         await callback.answer("Ошибка возврата в меню", show_alert=True)
 
 
@@ -531,7 +784,7 @@ async def return_to_admin_from_logs(callback: CallbackQuery, state: FSMContext):
 async def admin_logout(callback: CallbackQuery, state: FSMContext):
     """Выход из админ-панели."""
     user_id = callback.from_user.id
-    logger.info(f"👋 Пользователь {user_id} вышел из админки")
+    logger.info("👋 Пользователь {} вышел из админки", user_id)
 
     await state.clear()
 
@@ -545,7 +798,7 @@ async def admin_logout(callback: CallbackQuery, state: FSMContext):
         await callback.message.edit_text(text=text)
         await callback.answer("Выход выполнен")
     except Exception as e:
-        logger.error(f"Ошибка при выходе: {e}")
+        logger.error("Ошибка при выходе: {}", e)
         await callback.answer("Выход выполнен")
 
 
@@ -561,11 +814,11 @@ async def show_stats_menu(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка показа меню статистики: {e}")
+        logger.error("Ошибка показа меню статистики: {}", e)
         await callback.answer("Ошибка")
 
 
@@ -580,16 +833,17 @@ async def show_general_stats(callback: CallbackQuery):
     """
     try:
         # Логируем запрос статистики
-        logger.info(f"📊 Пользователь {callback.from_user.id} запросил общую статистику")
+        logger.info("📊 Пользователь {} запросил общую статистику", callback.from_user.id)
 
         # Получаем статистику с обработкой ошибок
         try:
             stats = await get_statistics()
-            logger.info(f"✅ Общая статистика получена успешно")
+            logger.debug("✅ Общая статистика получена успешно")
         except Exception as stats_error:
             # Если ошибка при получении статистики - используем заглушку и логируем
             logger.error(
-                f"❌ Ошибка при получении статистики: {stats_error}",
+                "❌ Ошибка при получении статистики: {}",
+                stats_error,
                 exc_info=True
             )
             stats = {
@@ -622,19 +876,21 @@ async def show_general_stats(callback: CallbackQuery):
             f"• Среднее действий/день: {stats.get('avg_actions_per_day', 0):.1f}\n\n"
             # TIMEZONE: Время обновления отображается в МСК
             f"🕐 <b>Последнее обновление:</b>\n"
-            f"{get_msk_now().strftime('%d.%m.%Y %H:%M:%S')} (МСК)"
+            f"{format_msk_now('%d.%m.%Y %H:%M:%S')} (МСК)"
         )
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
         await callback.answer()
 
     except Exception as e:
         # ИСПРАВЛЕНИЕ: Полное логирование ошибок с traceback
         logger.error(
-            f"❌ Критическая ошибка в show_general_stats для пользователя {callback.from_user.id}: {e}",
+            "❌ Критическая ошибка в show_general_stats для пользователя {}: {}",
+            callback.from_user.id,
+            e,
             exc_info=True
         )
         await callback.answer("Ошибка загрузки статистики", show_alert=True)
@@ -660,20 +916,21 @@ async def show_section_stats(callback: CallbackQuery):
     }
 
     try:
-        logger.info(f"📊 Пользователь {callback.from_user.id} запросил топ популярных разделов")
+        logger.info("📊 Пользователь {} запросил топ популярных разделов", callback.from_user.id)
 
         try:
             # MVP: Получаем статистику за последние 7 дней (как требовал пользователь)
             section_stats = await get_section_statistics(days=7)
-            logger.info(f"✅ Получено {len(section_stats)} разделов со статистикой")
+            logger.debug("✅ Получено {} разделов со статистикой", len(section_stats))
 
-            # Дополнительное логирование для отладки
+            # Дополнительное логирование для отладки (срез строится только при DEBUG)
             if section_stats:
-                logger.debug(f"Топ-3 раздела: {section_stats[:3]}")
+                logger.opt(lazy=True).debug("Топ-3 раздела: {}", lambda: section_stats[:3])
 
         except Exception as stats_error:
             logger.error(
-                f"❌ Ошибка при получении статистики разделов: {stats_error}",
+                "❌ Ошибка при получении статистики разделов: {}",
+                stats_error,
                 exc_info=True
             )
             section_stats = []
@@ -683,40 +940,40 @@ async def show_section_stats(callback: CallbackQuery):
             )
 
         # MVP: Формируем красивый вывод
-        text = "📊 <b>Топ-5 разделов за 7 дней</b>\n\n"
+        parts = ["📊 <b>Топ-5 разделов за 7 дней</b>\n\n"]
 
         if section_stats:
             # Ограничиваем топ-5, как просил пользователь
             for i, (section, count) in enumerate(section_stats[:5], 1):
-                # Определяем эмодзи для топ-3
-                emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-
                 # Получаем человекочитаемое название раздела
                 section_name = SECTION_NAMES.get(section, f"❓ {section}")
 
                 # MVP: Форматируем вывод как просил пользователь
-                text += f"{emoji} {section_name} — {count} посещений\n"
+                parts.append(f"{_rank_label(i)} {section_name} — {count} посещений\n")
 
             # Добавляем общую информацию
             total_views = sum(count for _, count in section_stats)
-            text += f"\n📈 <b>Всего просмотров:</b> {total_views}"
+            parts.append(f"\n📈 <b>Всего просмотров:</b> {total_views}")
         else:
             # MVP: Информативное сообщение вместо "Данных пока нет"
-            text += (
+            parts.append(
                 "Данных пока нет. Сбор статистики начат.\n\n"
                 "ℹ️ Статистика собирается автоматически при переходах пользователей по разделам.\n\n"
                 "Данные появятся после первых посещений разделов бота."
             )
 
+        text = "".join(parts)
+
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
         await callback.answer()
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в show_section_stats: {e}",
+            "❌ Критическая ошибка в show_section_stats: {}",
+            e,
             exc_info=True
         )
         await callback.answer("Ошибка", show_alert=True)
@@ -733,33 +990,39 @@ async def show_users_stats(callback: CallbackQuery):
     Теперь обработчик быстро отвечает с информативным сообщением.
     """
     try:
-        logger.info(f"👤 Пользователь {callback.from_user.id} запросил статистику пользователей")
+        logger.info("👤 Пользователь {} запросил статистику пользователей", callback.from_user.id)
 
         try:
             # Получаем базовую статистику
             stats = await get_statistics()
 
+            # PERF: каждое значение читаем из словаря один раз
+            total = stats.get('total_users', 0)
+            today = stats.get('active_today', 0)
+            week = stats.get('active_week', 0)
+            denominator = total or 1
+
             text = (
                 "👤 <b>Статистика пользователей</b>\n\n"
                 f"📊 <b>Общие показатели:</b>\n"
-                f"• Всего зарегистрировано: {stats.get('total_users', 0)}\n"
-                f"• Активных сегодня: {stats.get('active_today', 0)}\n"
-                f"• Активных за неделю: {stats.get('active_week', 0)}\n"
+                f"• Всего зарегистрировано: {total}\n"
+                f"• Активных сегодня: {today}\n"
+                f"• Активных за неделю: {week}\n"
                 f"• Новых за неделю: {stats.get('new_this_week', 0)}\n"
                 f"• Заблокированных: {stats.get('blocked_users', 0)}\n\n"
                 f"📈 <b>Вовлеченность:</b>\n"
-                f"• Активность сегодня: {(stats.get('active_today', 0) / max(stats.get('total_users', 1), 1) * 100):.1f}%\n"
-                f"• Активность за неделю: {(stats.get('active_week', 0) / max(stats.get('total_users', 1), 1) * 100):.1f}%\n\n"
+                f"• Активность сегодня: {today / denominator * 100:.1f}%\n"
+                f"• Активность за неделю: {week / denominator * 100:.1f}%\n\n"
                 f"💡 <b>Подробная статистика по пользователям:</b>\n"
                 f"Используйте раздел \"Управление пользователями\" → \"Список всех пользователей\"\n\n"
                 # TIMEZONE: Время обновления в МСК
-                f"🕐 Обновлено: {get_msk_now().strftime('%H:%M:%S')} (МСК)"
+                f"🕐 Обновлено: {format_msk_now('%H:%M:%S')} (МСК)"
             )
 
-            logger.info(f"✅ Статистика пользователей успешно сформирована")
+            logger.debug("✅ Статистика пользователей успешно сформирована")
 
         except Exception as stats_error:
-            logger.error(f"❌ Ошибка при получении статистики пользователей: {stats_error}", exc_info=True)
+            logger.error("❌ Ошибка при получении статистики пользователей: {}", stats_error, exc_info=True)
             text = (
                 "👤 <b>Статистика пользователей</b>\n\n"
                 "⚠️ Временно недоступна из-за технической ошибки.\n\n"
@@ -769,12 +1032,12 @@ async def show_users_stats(callback: CallbackQuery):
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
         await callback.answer()
 
     except Exception as e:
-        logger.error(f"❌ Критическая ошибка в show_users_stats: {e}", exc_info=True)
+        logger.error("❌ Критическая ошибка в show_users_stats: {}", e, exc_info=True)
         await callback.answer("Ошибка", show_alert=True)
 
 
@@ -792,7 +1055,7 @@ async def show_dates_stats(callback: CallbackQuery):
     - Уникальные пользователи и действия
     """
     try:
-        logger.info(f"📅 Пользователь {callback.from_user.id} запросил статистику по датам")
+        logger.info("📅 Пользователь {} запросил статистику по датам", callback.from_user.id)
 
         # MVP: Получаем статистику за последние 30 дней
         stats = await get_date_statistics(days=30)
@@ -804,7 +1067,7 @@ async def show_dates_stats(callback: CallbackQuery):
                 "Статистика собирается автоматически при использовании бота.\n"
                 "Начните использовать различные разделы, и данные появятся здесь."
             )
-            logger.info(f"ℹ️ Нет данных для статистики по датам")
+            logger.info("ℹ️ Нет данных для статистики по датам")
         else:
             # MVP: Формируем красивый вывод
             # TIMEZONE: Все данные статистики рассчитаны по московскому времени
@@ -834,7 +1097,7 @@ async def show_dates_stats(callback: CallbackQuery):
             if top_days:
                 text += "🏆 <b>Топ-5 активных дней:</b>\n"
                 for i, day in enumerate(top_days, 1):
-                    emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
+                    emoji = _rank_label(i)
                     date_obj = datetime.strptime(day["date"], "%Y-%m-%d")
                     date_formatted = date_obj.strftime("%d.%m.%Y")
                     text += (
@@ -855,16 +1118,16 @@ async def show_dates_stats(callback: CallbackQuery):
                         f"{hour_stat['actions']} действий\n"
                     )
 
-            logger.info(f"✅ Статистика по датам успешно сформирована")
+            logger.debug("✅ Статистика по датам успешно сформирована")
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
         await callback.answer()
 
     except Exception as e:
-        logger.error(f"❌ Ошибка в show_dates_stats: {e}", exc_info=True)
+        logger.error("❌ Ошибка в show_dates_stats: {}", e, exc_info=True)
         await callback.answer("Ошибка загрузки статистики", show_alert=True)
 
 
@@ -881,7 +1144,7 @@ async def export_stats_to_excel(callback: CallbackQuery):
     - Статус блокировки, права администратора
     """
     try:
-        logger.info(f"📊 Пользователь {callback.from_user.id} запросил экспорт пользователей")
+        logger.info("📊 Пользователь {} запросил экспорт пользователей", callback.from_user.id)
 
         # Отправляем уведомление о начале экспорта
         await callback.answer("⏳ Формирую файл...", show_alert=False)
@@ -897,14 +1160,14 @@ async def export_stats_to_excel(callback: CallbackQuery):
             )
             await callback.message.edit_text(
                 text=text,
-                reply_markup=get_stats_menu()
+                reply_markup=_STATS_MENU
             )
-            logger.info(f"ℹ️ Нет пользователей для экспорта")
+            logger.info("ℹ️ Нет пользователей для экспорта")
             return
 
         # MVP: Создаем CSV файл
         # TIMEZONE: Используем московское время для имени файла
-        timestamp = get_msk_now().strftime("%Y%m%d_%H%M%S")
+        timestamp = format_msk_now("%Y%m%d_%H%M%S")
         filename = f"users_export_{timestamp}.csv"
 
         # Формируем CSV содержимое
@@ -939,7 +1202,7 @@ async def export_stats_to_excel(callback: CallbackQuery):
 
             temp_path = f.name
 
-        logger.info(f"✅ CSV файл создан: {temp_path}, записей: {len(users_data)}")
+        logger.info("✅ CSV файл создан: {}, записей: {}", temp_path, len(users_data))
 
         # Отправляем файл
         document = FSInputFile(temp_path, filename=filename)
@@ -949,7 +1212,7 @@ async def export_stats_to_excel(callback: CallbackQuery):
             f"📊 <b>Экспорт пользователей</b>\n\n"
             f"📁 Файл: <code>{filename}</code>\n"
             f"👥 Пользователей: {len(users_data)}\n"
-            f"📅 Сгенерировано: {get_msk_now().strftime('%d.%m.%Y %H:%M:%S')} (МСК)\n\n"
+            f"📅 Сгенерировано: {format_msk_now('%d.%m.%Y %H:%M:%S')} (МСК)\n\n"
             f"💡 Откройте файл в Excel для просмотра"
         )
 
@@ -960,7 +1223,7 @@ async def export_stats_to_excel(callback: CallbackQuery):
 
         # Удаляем временный файл
         Path(temp_path).unlink(missing_ok=True)
-        logger.info(f"✅ Файл отправлен и удален: {temp_path}")
+        logger.info("✅ Файл отправлен и удален: {}", temp_path)
 
         # Возвращаем в меню статистики
         text = (
@@ -971,11 +1234,11 @@ async def export_stats_to_excel(callback: CallbackQuery):
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_stats_menu()
+            reply_markup=_STATS_MENU
         )
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при экспорте пользователей: {e}", exc_info=True)
+        logger.error("❌ Ошибка при экспорте пользователей: {}", e, exc_info=True)
         await callback.answer("Ошибка при экспорте", show_alert=True)
         try:
             await callback.message.edit_text(
@@ -984,7 +1247,7 @@ async def export_stats_to_excel(callback: CallbackQuery):
                     "Произошла ошибка при создании файла.\n"
                     "Попробуйте позже или обратитесь к администратору."
                 ),
-                reply_markup=get_stats_menu()
+                reply_markup=_STATS_MENU
             )
         except:
             pass
@@ -1002,11 +1265,11 @@ async def show_users_menu(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_users_menu()
+            reply_markup=_USERS_MENU
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка показа меню пользователей: {e}")
+        logger.error("Ошибка показа меню пользователей: {}", e)
         await callback.answer("Ошибка")
 
 
@@ -1018,14 +1281,18 @@ async def show_users_list(callback: CallbackQuery):
     ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ #2: Добавлена обработка ошибок при получении пользователей.
     """
     try:
-        logger.info(f"👥 Пользователь {callback.from_user.id} запросил список пользователей")
+        logger.info("👥 Пользователь {} запросил список пользователей", callback.from_user.id)
 
+        # PERF: Считаем пользователей в SQL и загружаем только первую страницу
+        page = 1
         try:
-            users = await get_all_users()
-            logger.info(f"✅ Получено {len(users) if users else 0} пользователей")
+            total_users = await get_users_count()
+            page_users = await get_all_users_page(offset=0, limit=USERS_PER_PAGE)
+            logger.debug("✅ Получено {} из {} пользователей", len(page_users), total_users)
         except Exception as users_error:
             logger.error(
-                f"❌ Ошибка при получении списка пользователей: {users_error}",
+                "❌ Ошибка при получении списка пользователей: {}",
+                users_error,
                 exc_info=True
             )
             await callback.answer(
@@ -1034,37 +1301,13 @@ async def show_users_list(callback: CallbackQuery):
             )
             return
 
-        if not users:
+        if not total_users:
             await callback.answer("Пользователей пока нет", show_alert=True)
             return
 
-        # Пагинация: 10 пользователей на страницу
-        page = 1
-        per_page = 10
-        total_pages = (len(users) + per_page - 1) // per_page
-
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        page_users = users[start_idx:end_idx]
-
-        text = f"📋 <b>Список пользователей</b> (стр. {page}/{total_pages})\n\n"
-
-        for user in page_users:
-            status = "🚫" if user.get('is_blocked') else "✅"
-
-            # HIGH-003 FIX: Sanitize user data before display
-            first_name = sanitize_user_input(user.get('first_name') or 'Без имени', max_length=50)
-            username_raw = user.get('username')
-            if username_raw:
-                username = f"@{sanitize_username(username_raw)}"
-            else:
-                username = "нет username"
+        total_pages = (total_users + USERS_PER_PAGE - 1) // USERS_PER_PAGE
 
-            text += (
-                f"{status} <b>{first_name}</b> ({username})\n"
-                f"   ID: <code>{user.get('telegram_id')}</code>\n"
-                f"   Регистрация: {user.get('registration_date_str', 'неизвестно')}\n\n"
-            )
+        text = _format_users_page(page_users, page, total_pages)
 
         await callback.message.edit_text(
             text=text,
@@ -1074,7 +1317,8 @@ async def show_users_list(callback: CallbackQuery):
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в show_users_list: {e}",
+            "❌ Критическая ошибка в show_users_list: {}",
+            e,
             exc_info=True
         )
         await callback.answer("Ошибка показа списка", show_alert=True)
@@ -1093,15 +1337,16 @@ async def handle_users_list_pagination(callback: CallbackQuery):
     try:
         # Извлекаем номер страницы из callback_data
         page = int(callback.data.split("_")[-1])
-        logger.info(f"📄 Пользователь {callback.from_user.id} запросил страницу {page} списка пользователей")
+        logger.info("📄 Пользователь {} запросил страницу {} списка пользователей", callback.from_user.id, page)
 
-        # Получаем список пользователей
+        # PERF: Получаем только количество пользователей - страница загружается отдельно
         try:
-            users = await get_all_users()
-            logger.info(f"✅ Получено {len(users) if users else 0} пользователей для пагинации")
+            total_users = await get_users_count()
+            logger.debug("✅ Всего {} пользователей для пагинации", total_users)
         except Exception as users_error:
             logger.error(
-                f"❌ Ошибка при получении списка пользователей для пагинации: {users_error}",
+                "❌ Ошибка при получении списка пользователей для пагинации: {}",
+                users_error,
                 exc_info=True
             )
             await callback.answer(
@@ -1110,49 +1355,30 @@ async def handle_users_list_pagination(callback: CallbackQuery):
             )
             return
 
-        if not users:
+        if not total_users:
             await callback.answer("Пользователей пока нет", show_alert=True)
             return
 
         # Настройки пагинации
-        per_page = 10
-        total_pages = (len(users) + per_page - 1) // per_page
+        total_pages = (total_users + USERS_PER_PAGE - 1) // USERS_PER_PAGE
 
         # Проверяем корректность номера страницы
         if page < 1 or page > total_pages:
-            logger.warning(f"⚠️ Запрошена некорректная страница: {page} (доступно: 1-{total_pages})")
+            logger.warning("⚠️ Запрошена некорректная страница: {} (доступно: 1-{})", page, total_pages)
             await callback.answer(
                 f"Страница {page} не существует",
                 show_alert=True
             )
             return
 
-        # Вычисляем диапазон пользователей для текущей страницы
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        page_users = users[start_idx:end_idx]
+        # Загружаем из БД только пользователей текущей страницы (LIMIT/OFFSET)
+        start_idx = (page - 1) * USERS_PER_PAGE
+        page_users = await get_all_users_page(offset=start_idx, limit=USERS_PER_PAGE)
 
-        logger.info(f"📊 Страница {page}/{total_pages}: отображение пользователей {start_idx+1}-{min(end_idx, len(users))} из {len(users)}")
+        logger.debug("📊 Страница {}/{}: отображение пользователей {}-{} из {}", page, total_pages, start_idx+1, start_idx + len(page_users), total_users)
 
         # Формируем текст со списком пользователей на странице
-        text = f"📋 <b>Список пользователей</b> (стр. {page}/{total_pages})\n\n"
-
-        for user in page_users:
-            status = "🚫" if user.get('is_blocked') else "✅"
-
-            # HIGH-003 FIX: Sanitize user data before display
-            first_name = sanitize_user_input(user.get('first_name') or 'Без имени', max_length=50)
-            username_raw = user.get('username')
-            if username_raw:
-                username = f"@{sanitize_username(username_raw)}"
-            else:
-                username = "нет username"
-
-            text += (
-                f"{status} <b>{first_name}</b> ({username})\n"
-                f"   ID: <code>{user.get('telegram_id')}</code>\n"
-                f"   Регистрация: {user.get('registration_date_str', 'неизвестно')}\n\n"
-            )
+        text = _format_users_page(page_users, page, total_pages)
 
         # Обновляем сообщение с новой страницей
         await callback.message.edit_text(
@@ -1160,14 +1386,15 @@ async def handle_users_list_pagination(callback: CallbackQuery):
             reply_markup=get_pagination_keyboard(page, total_pages, "users_list")
         )
         await callback.answer()
-        logger.info(f"✅ Страница {page} списка пользователей успешно отображена для администратора {callback.from_user.id}")
+        logger.debug("✅ Страница {} списка пользователей успешно отображена для администратора {}", page, callback.from_user.id)
 
     except ValueError as ve:
-        logger.error(f"❌ Ошибка парсинга номера страницы из {callback.data}: {ve}")
+        logger.error("❌ Ошибка парсинга номера страницы из {}: {}", callback.data, ve)
         await callback.answer("❌ Некорректный номер страницы", show_alert=True)
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в handle_users_list_pagination: {e}",
+            "❌ Критическая ошибка в handle_users_list_pagination: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка переключения страницы", show_alert=True)
@@ -1185,7 +1412,7 @@ async def handle_users_search(callback: CallbackQuery, state: FSMContext):
     ИСПРАВЛЕНИЕ: Добавлен полностью отсутствующий обработчик.
     """
     try:
-        logger.info(f"🔍 Пользователь {callback.from_user.id} запросил поиск пользователя")
+        logger.info("🔍 Пользователь {} запросил поиск пользователя", callback.from_user.id)
 
         # Устанавливаем состояние ожидания ввода для поиска
         await state.set_state(AdminStates.waiting_user_search)
@@ -1201,37 +1428,46 @@ async def handle_users_search(callback: CallbackQuery, state: FSMContext):
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_users_menu()  # Кнопка "Назад к управлению пользователями"
+            reply_markup=_USERS_MENU  # Кнопка "Назад к управлению пользователями"
         )
         await callback.answer()
-        logger.info(f"✅ Отображено меню поиска пользователя для администратора {callback.from_user.id}")
+        logger.info("✅ Отображено меню поиска пользователя для администратора {}", callback.from_user.id)
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в handle_users_search: {e}",
+            "❌ Критическая ошибка в handle_users_search: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка открытия поиска", show_alert=True)
 
 
 @router.callback_query(F.data == "users_blocked")
+@router.callback_query(F.data.startswith("users_blocked_page_"))
 async def handle_users_blocked(callback: CallbackQuery):
     """
     Обработчик кнопки "Заблокированные пользователи".
 
     ИСПРАВЛЕНИЕ: Добавлен полностью отсутствующий обработчик.
     Получает список заблокированных пользователей из БД и отображает их.
+    PERF: Постраничная выборка через SQL LIMIT/OFFSET (users_blocked_page_N).
     """
     try:
-        logger.info(f"🚫 Пользователь {callback.from_user.id} запросил список заблокированных пользователей")
+        page = _parse_list_page(callback.data)
+        logger.info("🚫 Пользователь {} запросил список заблокированных пользователей (стр. {})", callback.from_user.id, page)
 
         try:
             # Получаем заблокированных пользователей из БД
-            blocked_users = await get_blocked_users()
-            logger.info(f"📊 Получено {len(blocked_users) if blocked_users else 0} заблокированных пользователей")
+            blocked_users, blocked_total, page = await _fetch_list_page(
+                lambda offset: get_blocked_users(limit=LIST_PAGE_SIZE, offset=offset),
+                count_blocked_users,
+                page
+            )
+            logger.info("📊 Получено {} заблокированных пользователей", blocked_total)
         except Exception as db_error:
             logger.error(
-                f"❌ Ошибка при получении заблокированных пользователей из БД: {db_error}",
+                "❌ Ошибка при получении заблокированных пользователей из БД: {}",
+                db_error,
                 exc_info=True
             )
             await callback.answer(
@@ -1249,81 +1485,70 @@ async def handle_users_blocked(callback: CallbackQuery):
             return
 
         # Формируем текст со списком заблокированных пользователей
-        text = f"🚫 <b>Заблокированные пользователи</b> ({len(blocked_users)})\n\n"
+        # PERF: строки собираются в список и склеиваются одним join
+        parts = [f"🚫 <b>Заблокированные пользователи</b> ({blocked_total})\n\n"]
 
-        for user in blocked_users:
-            username = f"@{user.get('username')}" if user.get('username') else "нет username"
-            reason = user.get('block_reason', 'не указана')
+        append = parts.append
+        # PERF: строки - кортежи (first_name, username, telegram_id, block_reason)
+        for first_name, username, telegram_id, reason in blocked_users:
+            append(_BLOCKED_ROW.format(
+                first_name or 'Без имени',
+                f"@{username}" if username else "нет username",
+                telegram_id,
+                reason or 'не указана'
+            ))
 
-            text += (
-                f"🚫 <b>{user.get('first_name', 'Без имени')}</b> ({username})\n"
-                f"   ID: <code>{user.get('telegram_id')}</code>\n"
-                f"   Причина: {reason}\n\n"
-            )
+        text = "".join(parts)
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_users_menu()  # Кнопка "Назад к управлению пользователями"
+            reply_markup=_list_page_keyboard(page, blocked_total, "users_blocked")
         )
         await callback.answer()
-        logger.info(f"✅ Список заблокированных пользователей отправлен администратору {callback.from_user.id}")
+        logger.debug("✅ Список заблокированных пользователей отправлен администратору {}", callback.from_user.id)
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в handle_users_blocked: {e}",
+            "❌ Критическая ошибка в handle_users_blocked: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка отображения списка", show_alert=True)
 
 
 @router.callback_query(F.data == "users_active")
+@router.callback_query(F.data.startswith("users_active_page_"))
 async def handle_users_active(callback: CallbackQuery):
     """
     Обработчик кнопки "Активные сегодня".
 
     ИСПРАВЛЕНИЕ: Добавлен полностью отсутствующий обработчик.
     Показывает пользователей, которые были активны сегодня.
+    PERF: Постраничная выборка через SQL LIMIT/OFFSET (users_active_page_N).
     """
     try:
-        logger.info(f"✅ Пользователь {callback.from_user.id} запросил список активных сегодня пользователей")
+        page = _parse_list_page(callback.data)
+        logger.info("✅ Пользователь {} запросил список активных сегодня пользователей (стр. {})", callback.from_user.id, page)
 
         try:
-            # Получаем всех пользователей
-            all_users = await get_all_users(limit=1000)
-            logger.info(f"📊 Получено {len(all_users) if all_users else 0} пользователей для фильтрации")
-
-            # ИСПРАВЛЕНИЕ v2: Фильтруем пользователей, активных сегодня
-            # Теперь работаем с datetime объектами напрямую
-            from datetime import datetime, timedelta
+            # PERF: Фильтрация по last_activity выполняется в SQL (индексный range scan),
+            # загружается одна страница вместо 1000 пользователей
             today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-            logger.info(f"🕐 Начало сегодняшнего дня (UTC): {today_start}")
-
-            active_today = []
-            for user in all_users:
-                # ИСПРАВЛЕНИЕ: Теперь last_activity - это datetime объект, а не строка
-                last_activity = user.get('last_activity')
-
-                # Логируем каждого пользователя для отладки
-                logger.debug(
-                    f"👤 Проверяем пользователя {user.get('telegram_id')}: "
-                    f"last_activity={last_activity}, type={type(last_activity)}"
-                )
+            logger.debug("🕐 Начало сегодняшнего дня (UTC): {}", today_start)
 
-                if last_activity and isinstance(last_activity, datetime):
-                    # Сравниваем datetime объекты напрямую
-                    if last_activity >= today_start:
-                        active_today.append(user)
-                        logger.info(
-                            f"✅ Найден активный пользователь: {user.get('first_name')} "
-                            f"(ID: {user.get('telegram_id')}), активность: {last_activity}"
-                        )
+            active_today, active_total, page = await _fetch_list_page(
+                lambda offset: get_users_active_since(today_start, limit=LIST_PAGE_SIZE, offset=offset),
+                lambda: count_users_active_since(today_start),
+                page
+            )
 
-            logger.info(f"📊 Найдено {len(active_today)} пользователей, активных сегодня")
+            logger.info("📊 Найдено {} пользователей, активных сегодня", active_total)
 
         except Exception as db_error:
             logger.error(
-                f"❌ Ошибка при получении активных пользователей из БД: {db_error}",
+                "❌ Ошибка при получении активных пользователей из БД: {}",
+                db_error,
                 exc_info=True
             )
             await callback.answer(
@@ -1341,85 +1566,70 @@ async def handle_users_active(callback: CallbackQuery):
             return
 
         # Формируем текст со списком активных пользователей
-        text = f"✅ <b>Активные сегодня</b> ({len(active_today)})\n\n"
-
-        for user in active_today[:50]:  # Показываем максимум 50 пользователей
-            username = f"@{user.get('username')}" if user.get('username') else "нет username"
-            # ИСПРАВЛЕНИЕ: Используем форматированную строку вместо datetime объекта
-            last_activity = user.get('last_activity_str', 'неизвестно')
+        # PERF: строки собираются в список и склеиваются одним join
+        parts = [f"✅ <b>Активные сегодня</b> ({active_total})\n\n"]
 
-            text += (
-                f"✅ <b>{user.get('first_name', 'Без имени')}</b> ({username})\n"
-                f"   ID: <code>{user.get('telegram_id')}</code>\n"
-                f"   Последняя активность: {last_activity}\n\n"
-            )
+        append = parts.append
+        # PERF: строки - кортежи (first_name, username, telegram_id, last_activity_str)
+        for first_name, username, telegram_id, last_activity in active_today:
+            append(_ACTIVE_ROW.format(
+                first_name or 'Без имени',
+                f"@{username}" if username else "нет username",
+                telegram_id,
+                last_activity
+            ))
 
-        if len(active_today) > 50:
-            text += f"\n... и ещё {len(active_today) - 50} пользователей"
+        text = "".join(parts)
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_users_menu()  # Кнопка "Назад к управлению пользователями"
+            reply_markup=_list_page_keyboard(page, active_total, "users_active")
         )
         await callback.answer()
-        logger.info(f"✅ Список активных пользователей ({len(active_today)}) отправлен администратору {callback.from_user.id}")
+        logger.debug("✅ Список активных пользователей ({}) отправлен администратору {}", active_total, callback.from_user.id)
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в handle_users_active: {e}",
+            "❌ Критическая ошибка в handle_users_active: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка отображения списка", show_alert=True)
 
 
 @router.callback_query(F.data == "users_new")
+@router.callback_query(F.data.startswith("users_new_page_"))
 async def handle_users_new(callback: CallbackQuery):
     """
     Обработчик кнопки "Новые пользователи".
 
     ИСПРАВЛЕНИЕ: Добавлен полностью отсутствующий обработчик.
     Показывает пользователей, зарегистрированных за последние 7 дней.
+    PERF: Постраничная выборка через SQL LIMIT/OFFSET (users_new_page_N).
     """
     try:
-        logger.info(f"🆕 Пользователь {callback.from_user.id} запросил список новых пользователей")
+        page = _parse_list_page(callback.data)
+        logger.info("🆕 Пользователь {} запросил список новых пользователей (стр. {})", callback.from_user.id, page)
 
         try:
-            # Получаем всех пользователей
-            all_users = await get_all_users(limit=1000)
-            logger.info(f"📊 Получено {len(all_users) if all_users else 0} пользователей для фильтрации")
-
-            # ИСПРАВЛЕНИЕ v2: Фильтруем новых пользователей (зарегистрированных за последние 7 дней)
-            # Теперь работаем с datetime объектами напрямую
-            from datetime import datetime, timedelta
+            # PERF: Фильтрация по registration_date выполняется в SQL (индексный range scan),
+            # загружается одна страница вместо 1000 пользователей
             week_ago = datetime.utcnow() - timedelta(days=7)
 
-            logger.info(f"🕐 7 дней назад (UTC): {week_ago}")
-
-            new_users = []
-            for user in all_users:
-                # ИСПРАВЛЕНИЕ: Теперь registration_date - это datetime объект, а не строка
-                registration_date = user.get('registration_date')
-
-                # Логируем каждого пользователя для отладки
-                logger.debug(
-                    f"👤 Проверяем пользователя {user.get('telegram_id')}: "
-                    f"registration_date={registration_date}, type={type(registration_date)}"
-                )
+            logger.debug("🕐 7 дней назад (UTC): {}", week_ago)
 
-                if registration_date and isinstance(registration_date, datetime):
-                    # Сравниваем datetime объекты напрямую
-                    if registration_date >= week_ago:
-                        new_users.append(user)
-                        logger.info(
-                            f"🆕 Найден новый пользователь: {user.get('first_name')} "
-                            f"(ID: {user.get('telegram_id')}), регистрация: {registration_date}"
-                        )
+            new_users, new_total, page = await _fetch_list_page(
+                lambda offset: get_users_registered_since(week_ago, limit=LIST_PAGE_SIZE, offset=offset),
+                lambda: count_users_registered_since(week_ago),
+                page
+            )
 
-            logger.info(f"📊 Найдено {len(new_users)} новых пользователей за последние 7 дней")
+            logger.info("📊 Найдено {} новых пользователей за последние 7 дней", new_total)
 
         except Exception as db_error:
             logger.error(
-                f"❌ Ошибка при получении новых пользователей из БД: {db_error}",
+                "❌ Ошибка при получении новых пользователей из БД: {}",
+                db_error,
                 exc_info=True
             )
             await callback.answer(
@@ -1437,32 +1647,32 @@ async def handle_users_new(callback: CallbackQuery):
             return
 
         # Формируем текст со списком новых пользователей
-        text = f"🆕 <b>Новые пользователи</b> (за последние 7 дней: {len(new_users)})\n\n"
-
-        for user in new_users[:50]:  # Показываем максимум 50 пользователей
-            username = f"@{user.get('username')}" if user.get('username') else "нет username"
-            # ИСПРАВЛЕНИЕ: Используем форматированную строку вместо datetime объекта
-            registration_date = user.get('registration_date_str', 'неизвестно')
+        # PERF: строки собираются в список и склеиваются одним join
+        parts = [f"🆕 <b>Новые пользователи</b> (за последние 7 дней: {new_total})\n\n"]
 
-            text += (
-                f"🆕 <b>{user.get('first_name', 'Без имени')}</b> ({username})\n"
-                f"   ID: <code>{user.get('telegram_id')}</code>\n"
-                f"   Регистрация: {registration_date}\n\n"
-            )
+        append = parts.append
+        # PERF: строки - кортежи (first_name, username, telegram_id, registration_date_str)
+        for first_name, username, telegram_id, registration_date in new_users:
+            append(_NEW_ROW.format(
+                first_name or 'Без имени',
+                f"@{username}" if username else "нет username",
+                telegram_id,
+                registration_date
+            ))
 
-        if len(new_users) > 50:
-            text += f"\n... и ещё {len(new_users) - 50} пользователей"
+        text = "".join(parts)
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_users_menu()  # Кнопка "Назад к управлению пользователями"
+            reply_markup=_list_page_keyboard(page, new_total, "users_new")
         )
         await callback.answer()
-        logger.info(f"✅ Список новых пользователей ({len(new_users)}) отправлен администратору {callback.from_user.id}")
+        logger.debug("✅ Список новых пользователей ({}) отправлен администратору {}", new_total, callback.from_user.id)
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в handle_users_new: {e}",
+            "❌ Критическая ошибка в handle_users_new: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка отображения списка", show_alert=True)
@@ -1479,58 +1689,31 @@ async def process_user_search(message: Message, state: FSMContext):
     try:
         # HIGH-003 FIX: Sanitize search query to prevent injection attacks
         search_query = sanitize_search_query(message.text.strip())
-        logger.info(f"🔍 Администратор {message.from_user.id} выполняет поиск: '{search_query}'")
+        logger.info("🔍 Администратор {} выполняет поиск: '{}'", message.from_user.id, search_query)
 
         # Возвращаем состояние в меню пользователей
         await state.set_state(AdminStates.users_menu)
 
-        user_found = None
-
-        # Пытаемся найти по Telegram ID (если это число)
-        if search_query.isdigit():
-            try:
-                telegram_id = int(search_query)
-                user_found = await get_user_by_telegram_id(telegram_id)
-                logger.info(f"🔍 Поиск по Telegram ID {telegram_id}: {'найден' if user_found else 'не найден'}")
-            except Exception as search_error:
-                logger.error(f"❌ Ошибка при поиске по ID: {search_error}")
-
-        # Если не нашли по ID или это не число - ищем по username/имени
-        if not user_found:
-            try:
-                all_users = await get_all_users(limit=1000)
-
-                # Убираем @ из username если есть
-                search_clean = search_query.lstrip('@').lower()
-
-                for user in all_users:
-                    # Поиск по username
-                    if user.get('username') and user.get('username').lower() == search_clean:
-                        user_found = user
-                        logger.info(f"🔍 Найден пользователь по username: @{user.get('username')}")
-                        break
-
-                    # Поиск по имени
-                    if user.get('first_name') and search_query.lower() in user.get('first_name', '').lower():
-                        user_found = user
-                        logger.info(f"🔍 Найден пользователь по имени: {user.get('first_name')}")
-                        break
-
-            except Exception as search_error:
-                logger.error(f"❌ Ошибка при поиске пользователя: {search_error}", exc_info=True)
-                await message.answer(
-                    "❌ Ошибка поиска. Попробуйте ещё раз.",
-                    reply_markup=get_users_menu()
-                )
-                return
+        # PERF: Поиск по Telegram ID, username и имени - один SQL-запрос с LIMIT 1
+        # вместо загрузки 1000 пользователей и перебора в Python
+        try:
+            user_found = await search_user(search_query)
+            logger.info("🔍 Поиск '{}': {}", search_query, 'найден' if user_found else 'не найден')
+        except Exception as search_error:
+            logger.error("❌ Ошибка при поиске пользователя: {}", search_error, exc_info=True)
+            await message.answer(
+                "❌ Ошибка поиска. Попробуйте ещё раз.",
+                reply_markup=_USERS_MENU
+            )
+            return
 
         # Если пользователь не найден
         if not user_found:
-            logger.info(f"ℹ️ Пользователь не найден по запросу: '{search_query}'")
+            logger.info("ℹ️ Пользователь не найден по запросу: '{}'", search_query)
             await message.answer(
                 f"❌ Пользователь '<code>{search_query}</code>' не найден.\n\n"
                 "Попробуйте другой запрос или вернитесь в меню.",
-                reply_markup=get_users_menu()
+                reply_markup=_USERS_MENU
             )
             return
 
@@ -1554,49 +1737,47 @@ async def process_user_search(message: Message, state: FSMContext):
 
         await message.answer(
             text=text,
-            reply_markup=get_users_menu()
+            reply_markup=_USERS_MENU
         )
-        logger.info(f"✅ Результаты поиска отправлены администратору {message.from_user.id}")
+        logger.info("✅ Результаты поиска отправлены администратору {}", message.from_user.id)
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в process_user_search: {e}",
+            "❌ Критическая ошибка в process_user_search: {}",
+            e,
             exc_info=True
         )
         await message.answer(
             "❌ Ошибка выполнения поиска",
-            reply_markup=get_users_menu()
+            reply_markup=_USERS_MENU
         )
         # Возвращаем состояние в меню
         await state.set_state(AdminStates.users_menu)
 
 
-@router.callback_query(F.data.startswith("user_block_"))
-async def block_user_action(callback: CallbackQuery):
-    """Блокирует пользователя."""
-    user_id = int(callback.data.replace("user_block_", ""))
+# PERF: блокировка и разблокировка - один обработчик с regexp-фильтром,
+# действие выбирается по словарю вместо двух startswith-фильтров
+_USER_BLOCK_ACTIONS = {
+    "block": (block_user, "🚫 Администратор {} заблокировал пользователя {}",
+              "✅ Пользователь заблокирован", "❌ Ошибка блокировки"),
+    "unblock": (unblock_user, "✅ Администратор {} разблокировал пользователя {}",
+                "✅ Пользователь разблокирован", "❌ Ошибка разблокировки"),
+}
 
-    success = await block_user(user_id)
 
-    if success:
-        logger.info(f"🚫 Администратор {callback.from_user.id} заблокировал пользователя {user_id}")
-        await callback.answer("✅ Пользователь заблокирован", show_alert=True)
-    else:
-        await callback.answer("❌ Ошибка блокировки", show_alert=True)
+@router.callback_query(F.data.regexp(r"^user_(block|unblock)_(\d+)$").as_("match"))
+async def user_block_action(callback: CallbackQuery, match: re.Match):
+    """Блокирует или разблокирует пользователя (user_block_N / user_unblock_N)."""
+    action, user_id = match.group(1), int(match.group(2))
+    handler, log_message, success_text, error_text = _USER_BLOCK_ACTIONS[action]
 
+    success = await handler(user_id)
 
-@router.callback_query(F.data.startswith("user_unblock_"))
-async def unblock_user_action(callback: CallbackQuery):
-    """Разблокирует пользователя."""
-    user_id = int(callback.data.replace("user_unblock_", ""))
-    
-    success = await unblock_user(user_id)
-    
     if success:
-        logger.info(f"✅ Администратор {callback.from_user.id} разблокировал пользователя {user_id}")
-        await callback.answer("✅ Пользователь разблокирован", show_alert=True)
+        logger.info(log_message, callback.from_user.id, user_id)
+        await callback.answer(success_text, show_alert=True)
     else:
-        await callback.answer("❌ Ошибка разблокировки", show_alert=True)
+        await callback.answer(error_text, show_alert=True)
 
 
 # ========== УПРАВЛЕНИЕ КОНТЕНТОМ ==========
@@ -1609,7 +1790,7 @@ async def show_content_menu(callback: CallbackQuery, state: FSMContext):
     ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ #4: Добавлено логирование.
     """
     try:
-        logger.info(f"✏️ Пользователь {callback.from_user.id} открывает меню редактирования контента")
+        logger.info("✏️ Пользователь {} открывает меню редактирования контента", callback.from_user.id)
 
         await state.set_state(AdminStates.content_management)
 
@@ -1620,16 +1801,16 @@ async def show_content_menu(callback: CallbackQuery, state: FSMContext):
 
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_content_menu()
+            reply_markup=_CONTENT_MENU
         )
         await callback.answer()
 
     except Exception as e:
-        logger.error(f"❌ Ошибка показа меню контента: {e}", exc_info=True)
+        logger.error("❌ Ошибка показа меню контента: {}", e, exc_info=True)
         await callback.answer("Ошибка", show_alert=True)
 
 
-@router.callback_query(F.data.startswith("content_"))
+@router.callback_query(F.data.startswith(_CONTENT_SECTION_PREFIX))
 async def handle_content_section(callback: CallbackQuery, state: FSMContext):
     """
     MVP FEATURE: Полноценная реализация редактирования контента.
@@ -1641,9 +1822,9 @@ async def handle_content_section(callback: CallbackQuery, state: FSMContext):
     - Редактировать отдельные разделы
     - Сохранять изменения
     """
-    section = callback.data.replace("content_", "")
+    section = callback.data[len(_CONTENT_SECTION_PREFIX):]
 
-    logger.info(f"📝 Пользователь {callback.from_user.id} открывает редактор контента '{section}'")
+    logger.info("📝 Пользователь {} открывает редактор контента '{}'", callback.from_user.id, section)
 
     section_names = {
         "general": "Общая информация",
@@ -1666,12 +1847,12 @@ async def handle_content_section(callback: CallbackQuery, state: FSMContext):
         try:
             await callback.message.edit_text(
                 text=text,
-                reply_markup=get_back_to_admin()
+                reply_markup=_BACK_TO_ADMIN
             )
             await callback.answer()
-            logger.info(f"✅ Показано сообщение о разработке для '{section}'")
+            logger.info("✅ Показано сообщение о разработке для '{}'", section)
         except Exception as e:
-            logger.error(f"❌ Ошибка показа сообщения: {e}", exc_info=True)
+            logger.error("❌ Ошибка показа сообщения: {}", e, exc_info=True)
             await callback.answer("Ошибка", show_alert=True)
         return
 
@@ -1694,7 +1875,7 @@ async def handle_content_section(callback: CallbackQuery, state: FSMContext):
         with open(file_path, 'r', encoding='utf-8') as f:
             content_data = json.load(f)
 
-        logger.info(f"✅ Загружен файл {file_name}, найдено {len(content_data)} разделов")
+        logger.info("✅ Загружен файл {}, найдено {} разделов", file_name, len(content_data))
 
         # Создаем клавиатуру с ключами
         from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
@@ -1740,10 +1921,10 @@ async def handle_content_section(callback: CallbackQuery, state: FSMContext):
             reply_markup=keyboard
         )
         await callback.answer()
-        logger.info(f"✅ Показано меню выбора ключей для '{section}'")
+        logger.info("✅ Показано меню выбора ключей для '{}'", section)
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при обработке content_{section}: {e}", exc_info=True)
+        logger.error("❌ Ошибка при обработке content_{}: {}", section, e, exc_info=True)
         await callback.answer(
             "Произошла ошибка при загрузке файла",
             show_alert=True
@@ -1767,7 +1948,7 @@ async def handle_edit_key(callback: CallbackQuery, state: FSMContext):
         section = parts[1]
         key = parts[2]
 
-        logger.info(f"✏️ Пользователь {callback.from_user.id} редактирует ключ '{key}' в разделе '{section}'")
+        logger.info("✏️ Пользователь {} редактирует ключ '{}' в разделе '{}'", callback.from_user.id, key, section)
 
         # Получаем данные из state
         user_data = await state.get_data()
@@ -1831,10 +2012,10 @@ async def handle_edit_key(callback: CallbackQuery, state: FSMContext):
             reply_markup=keyboard
         )
         await callback.answer()
-        logger.info(f"✅ Показано текущее значение ключа '{key}', ожидаем новое значение")
+        logger.info("✅ Показано текущее значение ключа '{}', ожидаем новое значение", key)
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при показе редактора ключа: {e}", exc_info=True)
+        logger.error("❌ Ошибка при показе редактора ключа: {}", e, exc_info=True)
         await callback.answer("Ошибка", show_alert=True)
 
 
@@ -1846,7 +2027,7 @@ async def handle_new_content(message: Message, state: FSMContext):
     Обрабатывает текстовое сообщение с новым значением для ключа.
     """
     try:
-        logger.info(f"📥 Получено новое содержимое от пользователя {message.from_user.id}")
+        logger.info("📥 Получено новое содержимое от пользователя {}", message.from_user.id)
 
         # Получаем данные из state
         user_data = await state.get_data()
@@ -1865,15 +2046,30 @@ async def handle_new_content(message: Message, state: FSMContext):
         # Пытаемся распарсить как JSON
         try:
             new_value = json.loads(new_value_text)
-            logger.info(f"✅ Новое значение успешно распарсено как JSON")
+            logger.info("✅ Новое значение успешно распарсено как JSON")
         except json.JSONDecodeError:
             # Если не JSON, берем как простую строку
             new_value = new_value_text
-            logger.info(f"ℹ️ Новое значение сохранено как обычный текст")
-
-        # Обновляем значение в словаре
-        old_value = content_data.get(key)
-        content_data[key] = new_value
+            logger.info("ℹ️ Новое значение сохранено как обычный текст")
+
+        # Новый словарь, а не правка content_data из state: отклоненная
+        # правка не должна попасть в следующую попытку
+        content_data = {**content_data, key: new_value}
+
+        # Правка, на которой раздел не рендерится, не записывается в файл
+        checker = _CONTENT_CHECKERS.get(section)
+        errors = checker(content_data) if checker else []
+        if errors:
+            logger.warning("⚠️ Правка ключа '{}' в {} отклонена: {}", key, file_name, errors)
+            errors_text = sanitize_user_input("\n".join(errors[:5]), max_length=1000, allow_newlines=True)
+            await message.answer(
+                f"❌ <b>Изменения НЕ сохранены</b>\n\n"
+                f"Раздел не отображается с новым значением ключа <code>{key}</code>:\n"
+                f"<pre>{errors_text}</pre>\n\n"
+                f"Проверьте формат данных и отправьте значение снова.",
+                reply_markup=_CANCEL_BUTTON
+            )
+            return
 
         # Сохраняем в файл
         file_path = Path("content/texts") / file_name
@@ -1882,13 +2078,24 @@ async def handle_new_content(message: Message, state: FSMContext):
         backup_path = Path("content/texts") / f"{file_name}.backup"
         if file_path.exists():
             shutil.copy2(file_path, backup_path)
-            logger.info(f"✅ Создан бэкап: {backup_path}")
+            logger.info("✅ Создан бэкап: {}", backup_path)
 
         # Сохраняем обновленный JSON
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(content_data, f, ensure_ascii=False, indent=2)
 
-        logger.info(f"✅ Файл {file_name} успешно обновлен. Ключ '{key}' изменен")
+        logger.info("✅ Файл {} успешно обновлен. Ключ '{}' изменен", file_name, key)
+
+        try:
+            await _CONTENT_RELOADERS[section]()
+            applied_text = "Изменения уже действуют в боте."
+        except Exception as e:
+            # Бот продолжает показывать старый контент, пока раздел не перезагрузится
+            logger.error("❌ Ошибка перезагрузки контента '{}': {}", section, e, exc_info=True)
+            applied_text = (
+                "⚠️ Файл сохранен, но перезагрузить раздел не удалось - "
+                "бот показывает прежний контент. Обратитесь к разработчику."
+            )
 
         # Формируем сообщение об успехе
         if isinstance(new_value, (dict, list)):
@@ -1903,7 +2110,7 @@ async def handle_new_content(message: Message, state: FSMContext):
             f"<b>Новое значение:</b>\n"
             f"<pre>{new_value_preview}</pre>\n\n"
             f"💾 Создан бэкап: <code>{backup_path.name}</code>\n\n"
-            f"Изменения вступят в силу при следующем запросе этого раздела."
+            f"{applied_text}"
         )
 
         # Клавиатура для дальнейших действий
@@ -1930,10 +2137,10 @@ async def handle_new_content(message: Message, state: FSMContext):
 
         # Очищаем state редактирования
         await state.set_state(AdminStates.authorized)
-        logger.info(f"✅ Редактирование завершено успешно")
+        logger.info("✅ Редактирование завершено успешно")
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при сохранении нового содержимого: {e}", exc_info=True)
+        logger.error("❌ Ошибка при сохранении нового содержимого: {}", e, exc_info=True)
         await message.answer(
             f"❌ <b>Ошибка при сохранении:</b>\n\n"
             f"<code>{str(e)}</code>\n\n"
@@ -1956,69 +2163,63 @@ async def show_broadcast_menu(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_broadcast_menu()
+            reply_markup=_BROADCAST_MENU
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка показа меню рассылки: {e}")
+        logger.error("Ошибка показа меню рассылки: {}", e)
         await callback.answer("Ошибка")
 
 
-@router.callback_query(F.data.startswith("broadcast_send_"))
+@router.callback_query(F.data.regexp(r"^broadcast_send_\w+$"))
 async def send_broadcast(callback: CallbackQuery, state: FSMContext):
     """
     Отправляет рассылку.
 
-    ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ: Обработчик перемещен ВЫШЕ process_broadcast_target.
-    Ранее из-за неправильного порядка обработчиков callback "broadcast_send_all"
-    сначала обрабатывался в process_broadcast_target, где target = "send_all"
-    не проходил проверку и выдавал ошибку "Неизвестная аудитория".
+    ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ: Ранее callback "broadcast_send_all" мог попасть
+    в process_broadcast_target (target = "send_all" → "Неизвестная аудитория").
+    Теперь фильтры обоих обработчиков взаимоисключающие, порядок регистрации не важен.
     """
     try:
-        logger.info(f"📤 Пользователь {callback.from_user.id} подтвердил отправку рассылки")
+        logger.info("📤 Пользователь {} подтвердил отправку рассылки", callback.from_user.id)
 
         data = await state.get_data()
         broadcast_text = data.get("broadcast_text")
         target = data.get("broadcast_target")
 
-        logger.info(f"📊 Рассылка для аудитории: {target}, текст: {broadcast_text[:50] if broadcast_text else 'None'}...")
+        logger.info("📊 Рассылка для аудитории: {}, текст: {}...", target, broadcast_text[:50] if broadcast_text else 'None')
 
         await state.set_state(AdminStates.broadcast_sending)
 
         # Получаем список получателей
+        # PERF: Заблокированные отсекаются в SQL, загружаются только telegram_id
         if target == "all":
-            users = await get_all_users()
-            logger.info(f"📋 Получено {len(users) if users else 0} пользователей для рассылки 'всем'")
+            chat_ids = await get_broadcast_recipients()
+            logger.info("📋 Получено {} пользователей для рассылки 'всем'", len(chat_ids))
         elif target == "active":
-            users = await get_all_users()  # TODO: фильтровать активных
-            logger.info(f"📋 Получено {len(users) if users else 0} активных пользователей")
+            chat_ids = await get_broadcast_recipients(active_only=True)
+            logger.info("📋 Получено {} активных пользователей", len(chat_ids))
         else:
-            users = []
-            logger.warning(f"⚠️ Неизвестная аудитория: {target}")
+            chat_ids = []
+            logger.warning("⚠️ Неизвестная аудитория: {}", target)
 
         # Отправляем рассылку
-        success_count = 0
-        fail_count = 0
-
         await callback.message.edit_text("📤 Рассылка начата...")
 
-        for user in users:
-            if user.get('is_blocked'):
-                continue
-
-            try:
-                await callback.bot.send_message(
-                    chat_id=user.get('telegram_id'),
-                    text=f"📢 <b>Объявление от администрации</b>\n\n{broadcast_text}"
-                )
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Ошибка отправки пользователю {user.get('telegram_id')}: {e}")
-                fail_count += 1
+        # PERF: текст собираем один раз, отправка - параллельными пачками
+        # вместо последовательных await
+        success_count, fail_count = await _send_broadcast(
+            callback.bot,
+            chat_ids,
+            f"📢 <b>Объявление от администрации</b>\n\n{broadcast_text}"
+        )
 
         logger.info(
-            f"📢 Администратор {callback.from_user.id} отправил рассылку. "
-            f"Успешно: {success_count}, Ошибок: {fail_count}"
+            "📢 Администратор {} отправил рассылку. "
+            "Успешно: {}, Ошибок: {}",
+            callback.from_user.id,
+            success_count,
+            fail_count
         )
 
         result_text = (
@@ -2029,35 +2230,26 @@ async def send_broadcast(callback: CallbackQuery, state: FSMContext):
 
         await callback.message.edit_text(
             text=result_text,
-            reply_markup=get_back_to_admin()
+            reply_markup=_BACK_TO_ADMIN
         )
         await state.set_state(AdminStates.authorized)
 
     except Exception as e:
-        logger.error(f"❌ Критическая ошибка при отправке рассылки: {e}", exc_info=True)
+        logger.error("❌ Критическая ошибка при отправке рассылки: {}", e, exc_info=True)
         await callback.answer("Ошибка отправки рассылки", show_alert=True)
 
 
-@router.callback_query(F.data.startswith("broadcast_"))
-async def process_broadcast_target(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(F.data.regexp(r"^broadcast_(?!send_)(\w+)$").as_("match"))
+async def process_broadcast_target(callback: CallbackQuery, state: FSMContext, match: re.Match):
     """
     Обрабатывает выбор целевой аудитории.
 
-    ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ: Добавлена проверка на "send_" в начале target.
-    Ранее callback_data "broadcast_send_all" также попадал в этот обработчик,
-    но после удаления "broadcast_" получалось target="send_all", которое
-    не проходило ни одну проверку и выдавало "Неизвестная аудитория".
-
-    Теперь такие callback игнорируются, т.к. они обрабатываются в send_broadcast выше.
+    ИСПРАВЛЕНИЕ КРИТИЧЕСКОЙ ОШИБКИ: callback_data "broadcast_send_*" исключены
+    самим фильтром (negative lookahead) - они обрабатываются в send_broadcast.
     """
-    target = callback.data.replace("broadcast_", "")
-
-    # ИСПРАВЛЕНИЕ: Игнорируем callback'и для отправки (они обрабатываются выше)
-    if target.startswith("send_"):
-        logger.debug(f"Игнорируем broadcast_send_ callback в process_broadcast_target")
-        return
+    target = match.group(1)
 
-    logger.info(f"📢 Пользователь {callback.from_user.id} выбрал аудиторию рассылки: {target}")
+    logger.info("📢 Пользователь {} выбрал аудиторию рассылки: {}", callback.from_user.id, target)
 
     if target == "history":
         await callback.answer("История рассылок - в разработке", show_alert=True)
@@ -2066,28 +2258,28 @@ async def process_broadcast_target(callback: CallbackQuery, state: FSMContext):
     # Подсчитываем количество получателей
     try:
         if target == "all":
-            count = await get_active_users_count()
+            count = await get_active_users_count_cached()
             target_text = "всем пользователям"
-            logger.info(f"✅ Выбрана аудитория 'все пользователи': {count} чел.")
+            logger.info("✅ Выбрана аудитория 'все пользователи': {} чел.", count)
         elif target == "sales":
             count = 0  # TODO: Реализовать подсчет по отделам
             target_text = "отделу продаж"
-            logger.warning(f"⚠️ Аудитория 'отдел продаж' не реализована")
+            logger.warning("⚠️ Аудитория 'отдел продаж' не реализована")
         elif target == "sport":
             count = 0
             target_text = "спортивному отделу"
-            logger.warning(f"⚠️ Аудитория 'спортивный отдел' не реализована")
+            logger.warning("⚠️ Аудитория 'спортивный отдел' не реализована")
         elif target == "active":
-            count = await get_active_users_count()
+            count = await get_active_users_count_cached()
             target_text = "активным пользователям"
-            logger.info(f"✅ Выбрана аудитория 'активные': {count} чел.")
+            logger.info("✅ Выбрана аудитория 'активные': {} чел.", count)
         else:
-            logger.error(f"❌ Неизвестная аудитория: {target}")
+            logger.error("❌ Неизвестная аудитория: {}", target)
             await callback.answer("Неизвестная аудитория", show_alert=True)
             return
 
     except Exception as e:
-        logger.error(f"❌ Ошибка при подсчете аудитории '{target}': {e}", exc_info=True)
+        logger.error("❌ Ошибка при подсчете аудитории '{}': {}", target, e, exc_info=True)
         await callback.answer("Ошибка получения данных об аудитории", show_alert=True)
         return
     
@@ -2107,11 +2299,11 @@ async def process_broadcast_target(callback: CallbackQuery, state: FSMContext):
     try:
         await callback.message.edit_text(
             text=text,
-            reply_markup=get_cancel_button()
+            reply_markup=_CANCEL_BUTTON
         )
         await callback.answer()
     except Exception as e:
-        logger.error(f"Ошибка запроса текста рассылки: {e}")
+        logger.error("Ошибка запроса текста рассылки: {}", e)
         await callback.answer("Ошибка")
 
 
@@ -2159,15 +2351,16 @@ async def show_logs(callback: CallbackQuery):
     ИСПРАВЛЕНИЕ: Изменен статус с "В разработке" на рабочий.
     """
     try:
-        logger.info(f"📋 Администратор {callback.from_user.id} запросил просмотр логов активности")
+        logger.info("📋 Администратор {} запросил просмотр логов активности", callback.from_user.id)
 
         # MVP: Получаем последние 50 действий
         try:
             recent_logs = await get_recent_activity(limit=50)
-            logger.info(f"✅ Получено {len(recent_logs)} записей логов")
+            logger.info("✅ Получено {} записей логов", len(recent_logs))
         except Exception as logs_error:
             logger.error(
-                f"❌ Ошибка при получении логов: {logs_error}",
+                "❌ Ошибка при получении логов: {}",
+                logs_error,
                 exc_info=True
             )
             await callback.answer(
@@ -2212,6 +2405,14 @@ async def show_logs(callback: CallbackQuery):
                 "ℹ️ Логирование активности происходит автоматически при действиях пользователей."
             )
 
+        # ARCH-003: Состояние общего пула соединений БД (для PostgreSQL)
+        pool_stats = get_db_pool_stats()
+        if pool_stats:
+            text += (
+                f"\n\n🗄 Пул БД: занято {pool_stats['checked_out']}/{pool_stats['size']}, "
+                f"overflow {pool_stats['overflow']}"
+            )
+
         # Добавляем кнопку для экспорта
         from keyboards.admin_kb import InlineKeyboardMarkup, InlineKeyboardButton
 
@@ -2234,7 +2435,8 @@ async def show_logs(callback: CallbackQuery):
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в show_logs: {e}",
+            "❌ Критическая ошибка в show_logs: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка отображения логов", show_alert=True)
@@ -2248,17 +2450,18 @@ async def export_logs_to_file(callback: CallbackQuery):
     MVP FEATURE: Экспорт логов за последние 30 дней в .txt файл.
     """
     try:
-        logger.info(f"📥 Администратор {callback.from_user.id} запросил экспорт логов")
+        logger.info("📥 Администратор {} запросил экспорт логов", callback.from_user.id)
 
         await callback.answer("⏳ Генерация файла...", show_alert=False)
 
         # Получаем все логи за последние 30 дней
         try:
             all_logs = await get_all_activity_for_export(days=30)
-            logger.info(f"✅ Получено {len(all_logs)} записей для экспорта")
+            logger.info("✅ Получено {} записей для экспорта", len(all_logs))
         except Exception as export_error:
             logger.error(
-                f"❌ Ошибка при получении логов для экспорта: {export_error}",
+                "❌ Ошибка при получении логов для экспорта: {}",
+                export_error,
                 exc_info=True
             )
             await callback.answer(
@@ -2277,7 +2480,7 @@ async def export_logs_to_file(callback: CallbackQuery):
         # Генерируем текстовый файл
         # Создаем временный файл
         # TIMEZONE: Используем московское время для имени файла и метки времени
-        timestamp = get_msk_now().strftime("%Y%m%d_%H%M%S")
+        timestamp = format_msk_now("%Y%m%d_%H%M%S")
         filename = f"activity_logs_{timestamp}.txt"
 
         # MVP: Формируем содержимое файла
@@ -2286,7 +2489,7 @@ async def export_logs_to_file(callback: CallbackQuery):
             f"ЛОГИ АКТИВНОСТИ ПОЛЬЗОВАТЕЛЕЙ",
             f"Период: последние 30 дней",
             # TIMEZONE: Время генерации файла в МСК
-            f"Сгенерировано: {get_msk_now().strftime('%d.%m.%Y %H:%M:%S')} (МСК)",
+            f"Сгенерировано: {format_msk_now('%d.%m.%Y %H:%M:%S')} (МСК)",
             f"Всего записей: {len(all_logs)}",
             "=" * 80,
             ""
@@ -2325,7 +2528,7 @@ async def export_logs_to_file(callback: CallbackQuery):
                 f"📥 <b>Логи активности</b>\n\n"
                 f"📊 Всего записей: {len(all_logs)}\n"
                 f"📅 Период: 30 дней\n"
-                f"🕐 Сгенерировано: {get_msk_now().strftime('%d.%m.%Y %H:%M:%S')} (МСК)"
+                f"🕐 Сгенерировано: {format_msk_now('%d.%m.%Y %H:%M:%S')} (МСК)"
             )
         )
 
@@ -2333,11 +2536,12 @@ async def export_logs_to_file(callback: CallbackQuery):
         Path(temp_path).unlink(missing_ok=True)
 
         await callback.answer("✅ Файл отправлен!")
-        logger.info(f"✅ Логи успешно экспортированы для администратора {callback.from_user.id}: {len(all_logs)} записей")
+        logger.info("✅ Логи успешно экспортированы для администратора {}: {} записей", callback.from_user.id, len(all_logs))
 
     except Exception as e:
         logger.error(
-            f"❌ Критическая ошибка в export_logs_to_file: {e}",
+            "❌ Критическая ошибка в export_logs_to_file: {}",
+            e,
             exc_info=True
         )
         await callback.answer("❌ Ошибка экспорта логов", show_alert=True)
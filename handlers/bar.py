@@ -9,17 +9,15 @@ Handler для раздела "БАР".
 - Правила обслуживания
 """
 
-import json
 from pathlib import Path
 
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
-from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from states.menu_states import MenuStates
-from utils.logger import logger
+from utils.json_loader import CONTENT_UNAVAILABLE_TEXT, load_handler_content, render_content_entry
 
 # Создаем router для этого модуля
 router = Router(name='bar')
@@ -27,63 +25,181 @@ router = Router(name='bar')
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "bar_menu.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент bar_menu.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
+CONTENT = load_handler_content(CONTENT_PATH)
 
 
-def get_bar_menu() -> InlineKeyboardMarkup:
-    """Меню раздела БАР"""
-    builder = InlineKeyboardBuilder()
+# Соответствие callback-кода категории и её названия в bar_menu.json
+_DRINK_CATEGORY_NAMES = {
+    "hot": "☕ Горячие напитки",
+    "cold": "🧊 Холодные напитки",
+    "lemonade": "🍋 Лимонады",
+    "milkshake": "🥤 Милкшейки и смузи"
+}
+
+_DRINKS_CATEGORIES_TEXT = (
+    "<b>🍹 Меню напитков</b>\n\n"
+    "Выберите категорию для просмотра меню:"
+)
 
-    builder.button(text="🍹 Меню напитков", callback_data="bar_drinks")
-    builder.button(text="💼 Скидки для сотрудников", callback_data="bar_discount")
-    builder.button(text="📋 Стандарты приготовления", callback_data="bar_standards")
-    builder.button(text="🎯 Правила обслуживания", callback_data="bar_service")
-    builder.button(text="◀️ Назад", callback_data="back_to_main")
 
-    builder.adjust(1)
-    return builder.as_markup()
+def _build_bar_menu_text(content: dict) -> str:
+    """Текст главного меню раздела БАР"""
+    main_menu_text = content.get("main_menu", {})
+    return (
+        f"<b>{main_menu_text.get('title', '☕ БАР')}</b>\n\n"
+        f"{main_menu_text.get('description', 'Выберите раздел:')}"
+    )
 
 
-def get_drinks_category_menu() -> InlineKeyboardMarkup:
-    """Меню выбора категории напитков"""
-    builder = InlineKeyboardBuilder()
+def _build_drinks_index(content: dict) -> dict[str, dict]:
+    """Категории напитков из JSON по коду категории (hot, cold, ...)"""
+    categories = {
+        cat["name"]: cat
+        for cat in content.get("drinks", {}).get("categories", [])
+    }
+    return {
+        code: categories[name]
+        for code, name in _DRINK_CATEGORY_NAMES.items()
+        if name in categories
+    }
+
+
+def _build_drinks_text(category: dict) -> str:
+    """Текст меню одной категории напитков"""
+    return f"<b>{category['name']}</b>\n\n" + "".join(
+        f"<b>{item['name']}</b> — {item['price']}\n"
+        f"• {item['volume']}\n"
+        f"• {item['description']}\n\n"
+        for item in category["items"]
+    )
+
+
+def _build_drinks_texts(drinks_index: dict[str, dict]) -> dict[str, str]:
+    """
+    Готовые тексты меню напитков по callback_data категории (bar_drinks_hot, ...).
+
+    Категория с некорректными данными пропускается - хендлер ответит
+    "Категория не найдена".
+    """
+    texts = {}
+    for code, category in drinks_index.items():
+        text = render_content_entry(_build_drinks_text, category, name=f"drinks.{code}")
+        if text:
+            texts[f"bar_drinks_{code}"] = text
+    return texts
+
+
+def _build_employee_discount_text(content: dict) -> str:
+    """Текст о скидках для сотрудников"""
+    discount_data = content.get("employee_discount", {})
+
+    text = f"<b>{discount_data.get('title', '💼 Скидка для сотрудников')}</b>\n\n"
+    text += f"{discount_data.get('description', '')}\n\n"
+    text += "".join(f"{benefit}\n" for benefit in discount_data.get("benefits", []))
+    return text
+
+
+def _build_standards_text(content: dict) -> str:
+    """Текст стандартов приготовления напитков"""
+    standards_data = content.get("standards", {})
+
+    text = f"<b>{standards_data.get('title', '📋 Стандарты приготовления')}</b>\n\n"
+    text += f"{standards_data.get('description', '')}\n\n"
+
+    recipes = standards_data.get("recipes", [])
+    for recipe in recipes[:2]:  # Показываем первые 2 рецепта для экономии места
+        text += f"<b>{recipe['drink']}</b>\n"
+        text += "".join(f"{step}\n" for step in recipe["steps"])
+        text += f"⏱️ Время: {recipe['time']}\n"
+        text += f"🌡️ Температура: {recipe['temperature']}\n\n"
+
+    text += "<b>✅ Контроль качества:</b>\n"
+    text += "".join(f"{check}\n" for check in standards_data.get("quality_check", []))
+    return text
+
+
+def _build_service_rules_text(content: dict) -> str:
+    """Текст правил обслуживания"""
+    service_data = content.get("service_rules", {})
+
+    text = f"<b>{service_data.get('title', '🎯 Правила обслуживания')}</b>\n\n"
+    text += "".join(f"{step}\n" for step in service_data.get("steps", []))
+    text += "\n<b>💡 Полезные советы:</b>\n"
+    text += "".join(f"{tip}\n" for tip in service_data.get("tips", []))
+    return text
+
+
+def _render_text(render, name: str) -> str:
+    """Текст раздела из CONTENT; при некорректных данных - заглушка вместо ошибки импорта"""
+    return render_content_entry(render, CONTENT, name=name, default=CONTENT_UNAVAILABLE_TEXT)
+
+
+# PERF: Контент статичен - тексты рендерятся один раз при импорте модуля
+_BAR_MENU_TEXT = _render_text(_build_bar_menu_text, "main_menu")
+_DRINKS_INDEX = render_content_entry(_build_drinks_index, CONTENT, name="drinks", default={})
+_DRINKS_TEXTS = _build_drinks_texts(_DRINKS_INDEX)
+# Точное совпадение callback_data вместо префикса: кнопки есть для всех кодов,
+# даже если категории нет в JSON (тогда хендлер отвечает "Категория не найдена")
+_DRINK_CALLBACKS = frozenset(f"bar_drinks_{code}" for code in _DRINK_CATEGORY_NAMES)
+_EMPLOYEE_DISCOUNT_TEXT = _render_text(_build_employee_discount_text, "employee_discount")
+_STANDARDS_TEXT = _render_text(_build_standards_text, "standards")
+_SERVICE_RULES_TEXT = _render_text(_build_service_rules_text, "service_rules")
+
+
+def _button(text: str, callback_data: str) -> InlineKeyboardButton:
+    return InlineKeyboardButton(text=text, callback_data=callback_data)
+
+
+# PERF: Клавиатуры статичны - готовые InlineKeyboardMarkup создаются один раз
+# при импорте модуля, без InlineKeyboardBuilder
 
-    builder.button(text="☕ Горячие напитки", callback_data="bar_drinks_hot")
-    builder.button(text="🧊 Холодные напитки", callback_data="bar_drinks_cold")
-    builder.button(text="🍋 Лимонады", callback_data="bar_drinks_lemonade")
-    builder.button(text="🥤 Милкшейки и смузи", callback_data="bar_drinks_milkshake")
-    builder.button(text="◀️ Назад", callback_data="bar")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
+# Меню раздела БАР
+_BAR_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("🍹 Меню напитков", "bar_drinks")],
+    [_button("💼 Скидки для сотрудников", "bar_discount")],
+    [_button("📋 Стандарты приготовления", "bar_standards")],
+    [_button("🎯 Правила обслуживания", "bar_service")],
+    [_button("◀️ Назад", "back_to_main")]
+])
 
-    builder.adjust(1, 1, 1, 1, 2)
-    return builder.as_markup()
+# Меню выбора категории напитков
+_DRINKS_CATEGORY_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("☕ Горячие напитки", "bar_drinks_hot")],
+    [_button("🧊 Холодные напитки", "bar_drinks_cold")],
+    [_button("🍋 Лимонады", "bar_drinks_lemonade")],
+    [_button("🥤 Милкшейки и смузи", "bar_drinks_milkshake")],
+    [_button("◀️ Назад", "bar"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+# Кнопка возврата к меню БАР
+_BACK_TO_BAR = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("◀️ Назад", "bar"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+# Кнопка возврата к категориям напитков
+_BACK_TO_DRINKS = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("◀️ Назад", "bar_drinks"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+
+def get_bar_menu() -> InlineKeyboardMarkup:
+    """Меню раздела БАР (кэшированное)"""
+    return _BAR_MENU
+
+
+def get_drinks_category_menu() -> InlineKeyboardMarkup:
+    """Меню выбора категории напитков (кэшированное)"""
+    return _DRINKS_CATEGORY_MENU
 
 
 def get_back_to_bar() -> InlineKeyboardMarkup:
-    """Кнопка возврата к меню БАР"""
-    builder = InlineKeyboardBuilder()
-    builder.button(text="◀️ Назад", callback_data="bar")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-    builder.adjust(2)
-    return builder.as_markup()
+    """Кнопка возврата к меню БАР (кэшированная)"""
+    return _BACK_TO_BAR
 
 
 def get_back_to_drinks() -> InlineKeyboardMarkup:
-    """Кнопка возврата к категориям напитков"""
-    builder = InlineKeyboardBuilder()
-    builder.button(text="◀️ Назад", callback_data="bar_drinks")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-    builder.adjust(2)
-    return builder.as_markup()
+    """Кнопка возврата к категориям напитков (кэшированная)"""
+    return _BACK_TO_DRINKS
 
 
 @router.callback_query(F.data == "bar")
@@ -91,159 +207,63 @@ async def show_bar_menu(callback: CallbackQuery, state: FSMContext):
     """Показывает главное меню раздела БАР"""
     await state.set_state(MenuStates.main_menu)
 
-    main_menu_text = CONTENT.get("main_menu", {})
-    text = (
-        f"<b>{main_menu_text.get('title', '☕ БАР')}</b>\n\n"
-        f"{main_menu_text.get('description', 'Выберите раздел:')}"
+    await callback.message.edit_text(
+        text=_BAR_MENU_TEXT,
+        reply_markup=_BAR_MENU
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_bar_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_bar_menu: {e}")
-        await callback.answer("Произошла ошибка. Попробуйте еще раз.")
+    await callback.answer()
 
 
 @router.callback_query(F.data == "bar_drinks")
 async def show_drinks_categories(callback: CallbackQuery):
     """Показывает категории напитков"""
-    text = (
-        "<b>🍹 Меню напитков</b>\n\n"
-        "Выберите категорию для просмотра меню:"
+    await callback.message.edit_text(
+        text=_DRINKS_CATEGORIES_TEXT,
+        reply_markup=_DRINKS_CATEGORY_MENU
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_drinks_category_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_drinks_categories: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("bar_drinks_"))
+@router.callback_query(F.data.in_(_DRINK_CALLBACKS))
 async def show_drinks_by_category(callback: CallbackQuery):
     """Показывает напитки по категории"""
-    category_code = callback.data.replace("bar_drinks_", "")  # hot, cold, lemonade, milkshake
-
-    category_map = {
-        "hot": "☕ Горячие напитки",
-        "cold": "🧊 Холодные напитки",
-        "lemonade": "🍋 Лимонады",
-        "milkshake": "🥤 Милкшейки и смузи"
-    }
-
-    drinks_data = CONTENT.get("drinks", {})
-    categories = drinks_data.get("categories", [])
-
-    # Находим нужную категорию
-    category = None
-    for cat in categories:
-        if category_map.get(category_code) == cat["name"]:
-            category = cat
-            break
-
-    if not category:
+    text = _DRINKS_TEXTS.get(callback.data)
+    if not text:
         await callback.answer("Категория не найдена", show_alert=True)
         return
 
-    text = f"<b>{category['name']}</b>\n\n"
-
-    for item in category["items"]:
-        text += f"<b>{item['name']}</b> — {item['price']}\n"
-        text += f"• {item['volume']}\n"
-        text += f"• {item['description']}\n\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_drinks()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_drinks_by_category: {e}")
-        await callback.answer("Ошибка загрузки напитков")
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=_BACK_TO_DRINKS
+    )
+    await callback.answer()
 
 
 @router.callback_query(F.data == "bar_discount")
 async def show_employee_discount(callback: CallbackQuery):
     """Показывает информацию о скидках для сотрудников"""
-    discount_data = CONTENT.get("employee_discount", {})
-
-    text = f"<b>{discount_data.get('title', '💼 Скидка для сотрудников')}</b>\n\n"
-    text += f"{discount_data.get('description', '')}\n\n"
-
-    for benefit in discount_data.get("benefits", []):
-        text += f"{benefit}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_bar()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_employee_discount: {e}")
-        await callback.answer("Ошибка загрузки информации")
+    await callback.message.edit_text(
+        text=_EMPLOYEE_DISCOUNT_TEXT,
+        reply_markup=_BACK_TO_BAR
+    )
+    await callback.answer()
 
 
 @router.callback_query(F.data == "bar_standards")
 async def show_preparation_standards(callback: CallbackQuery):
     """Показывает стандарты приготовления напитков"""
-    standards_data = CONTENT.get("standards", {})
-
-    text = f"<b>{standards_data.get('title', '📋 Стандарты приготовления')}</b>\n\n"
-    text += f"{standards_data.get('description', '')}\n\n"
-
-    recipes = standards_data.get("recipes", [])
-    for recipe in recipes[:2]:  # Показываем первые 2 рецепта для экономии места
-        text += f"<b>{recipe['drink']}</b>\n"
-        for step in recipe["steps"]:
-            text += f"{step}\n"
-        text += f"⏱️ Время: {recipe['time']}\n"
-        text += f"🌡️ Температура: {recipe['temperature']}\n\n"
-
-    text += "<b>✅ Контроль качества:</b>\n"
-    for check in standards_data.get("quality_check", []):
-        text += f"{check}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_bar()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_preparation_standards: {e}")
-        await callback.answer("Ошибка загрузки стандартов")
+    await callback.message.edit_text(
+        text=_STANDARDS_TEXT,
+        reply_markup=_BACK_TO_BAR
+    )
+    await callback.answer()
 
 
 @router.callback_query(F.data == "bar_service")
 async def show_service_rules(callback: CallbackQuery):
     """Показывает правила обслуживания"""
-    service_data = CONTENT.get("service_rules", {})
-
-    text = f"<b>{service_data.get('title', '🎯 Правила обслуживания')}</b>\n\n"
-
-    for step in service_data.get("steps", []):
-        text += f"{step}\n"
-
-    text += "\n<b>💡 Полезные советы:</b>\n"
-    for tip in service_data.get("tips", []):
-        text += f"{tip}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_bar()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_service_rules: {e}")
-        await callback.answer("Ошибка загрузки правил")
+    await callback.message.edit_text(
+        text=_SERVICE_RULES_TEXT,
+        reply_markup=_BACK_TO_BAR
+    )
+    await callback.answer()
@@ -17,6 +17,22 @@ from utils.logger import logger
 # Создаем router для общих обработчиков
 router = Router(name='common')
 
+# Текст справки статичен - собирается один раз при импорте
+_HELP_TEXT = (
+    "ℹ️ <b>Справка по боту</b>\n\n"
+    "<b>Доступные команды:</b>\n"
+    "/start - Главное меню\n"
+    "/help - Эта справка\n\n"
+    "<b>Разделы:</b>\n"
+    "• 📚 Общая информация - базовые сведения\n"
+    "• 💼 Отдел продаж - информация для менеджеров\n"
+    "• ⚽ Спортивный отдел - для инструкторов\n"
+    "• ⚙️ Админ-панель - управление ботом\n\n"
+    "<b>Навигация:</b>\n"
+    "Используйте кнопки под сообщениями для навигации по разделам.\n\n"
+    "По вопросам обращайтесь к администратору."
+)
+
 
 @router.callback_query(F.data == "back")
 async def handle_back(callback: CallbackQuery):
@@ -43,43 +59,13 @@ async def handle_cancel(callback: CallbackQuery, state: FSMContext):
 @router.message(Command("help"))
 async def cmd_help(message: Message):
     """Обработчик команды /help"""
-    help_text = (
-        "ℹ️ <b>Справка по боту</b>\n\n"
-        "<b>Доступные команды:</b>\n"
-        "/start - Главное меню\n"
-        "/help - Эта справка\n\n"
-        "<b>Разделы:</b>\n"
-        "• 📚 Общая информация - базовые сведения\n"
-        "• 💼 Отдел продаж - информация для менеджеров\n"
-        "• ⚽ Спортивный отдел - для инструкторов\n"
-        "• ⚙️ Админ-панель - управление ботом\n\n"
-        "<b>Навигация:</b>\n"
-        "Используйте кнопки под сообщениями для навигации по разделам.\n\n"
-        "По вопросам обращайтесь к администратору."
-    )
-
-    await message.answer(help_text)
+    await message.answer(_HELP_TEXT)
     logger.info(f"Пользователь {message.from_user.id} запросил помощь")
 
 
 @router.callback_query(F.data == "help")
 async def callback_help(callback: CallbackQuery):
     """Обработчик callback кнопки 'Помощь'"""
-    help_text = (
-        "ℹ️ <b>Справка по боту</b>\n\n"
-        "<b>Доступные команды:</b>\n"
-        "/start - Главное меню\n"
-        "/help - Эта справка\n\n"
-        "<b>Разделы:</b>\n"
-        "• 📚 Общая информация - базовые сведения\n"
-        "• 💼 Отдел продаж - информация для менеджеров\n"
-        "• ⚽ Спортивный отдел - для инструкторов\n"
-        "• ⚙️ Админ-панель - управление ботом\n\n"
-        "<b>Навигация:</b>\n"
-        "Используйте кнопки под сообщениями для навигации по разделам.\n\n"
-        "По вопросам обращайтесь к администратору."
-    )
-
-    await callback.message.edit_text(help_text)
+    await callback.message.edit_text(_HELP_TEXT)
     await callback.answer()
     logger.info(f"Пользователь {callback.from_user.id} запросил помощь")
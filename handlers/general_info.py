@@ -10,11 +10,13 @@ Handler для раздела "Общая информация".
 - Скидками партнеров
 """
 
-import json
+import asyncio
 from pathlib import Path
+from typing import Optional
 
 from aiogram import Router, F
-from aiogram.types import CallbackQuery, FSInputFile
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, FSInputFile, LinkPreviewOptions
 from aiogram.fsm.context import FSMContext
 
 from keyboards.general_info_kb import (
@@ -32,8 +34,16 @@ from keyboards.general_info_kb import (
     get_back_to_emergency,
     get_back_to_discounts
 )
+from database.crud import get_media_file_id, set_media_file_id
 from states.menu_states import MenuStates
+from utils.json_loader import (
+    CONTENT_UNAVAILABLE_TEXT,
+    load_handler_content,
+    read_json_async,
+    render_content_entry
+)
 from utils.logger import logger
+from utils.message_parts import show_parts, split_message
 
 # Создаем router для этого модуля
 router = Router(name='general_info')
@@ -41,16 +51,400 @@ router = Router(name='general_info')
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "general_info.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент general_info.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
+CONTENT = load_handler_content(CONTENT_PATH)
+
+
+# PERF: Статические клавиатуры строятся один раз при импорте, а не на каждый callback.
+# Клавиатура парка кэшируется в самой фабрике (lru_cache по коду парка).
+_GENERAL_INFO_MENU = get_general_info_menu()
+_PARKS_ADDRESSES_MENU = get_parks_addresses_menu()
+_PARKS_PHONES_MENU = get_parks_phones_menu()
+_EMERGENCY_MENU = get_emergency_menu()
+_ORDERS_MENU = get_orders_menu()
+_DISCOUNTS_PARKS_MENU = get_discounts_parks_menu()
+_BACK_TO_GENERAL_INFO = get_back_to_general_info()
+_BACK_TO_PHONES = get_back_to_phones()
+_BACK_TO_EMERGENCY = get_back_to_emergency()
+_BACK_TO_DISCOUNTS = get_back_to_discounts()
+
+# Коды, которые выдают клавиатуры из keyboards/general_info_kb.py
+_PARK_CODES = ("zeleno", "kashir", "columb")
+_EMERGENCY_TYPES = ("evacuation", "fire", "medical", "conflict", "technical")
+_ORDER_NUMBERS = ("001", "002", "003", "004", "005")
+
+
+def _callback_codes(prefix: str, codes: tuple) -> dict[str, str]:
+    """callback_data -> код ("addr_zeleno" -> "zeleno")"""
+    return {f"{prefix}_{code}": code for code in codes}
+
+
+# PERF: Хендлеры фильтруются точным совпадением F.data.in_(...), а код
+# берется из словаря вместо разбора callback.data на каждом нажатии
+_ADDRESS_CALLBACKS = _callback_codes("addr", _PARK_CODES)
+_NAVIGATION_CALLBACKS = _callback_codes("nav", _PARK_CODES)
+_PHONE_CALLBACKS = _callback_codes("phone", _PARK_CODES)
+_DISCOUNT_CALLBACKS = _callback_codes("discount", _PARK_CODES)
+_EMERGENCY_CALLBACKS = _callback_codes("emergency", _EMERGENCY_TYPES)
+_ORDER_CALLBACKS = _callback_codes("order", _ORDER_NUMBERS)
+
+# PDF приказов сканируются один раз при импорте (новые файлы - после рестарта)
+DOCUMENTS_PATH = Path(__file__).parent.parent / "content" / "media" / "documents"
+
+
+def _scan_order_files(directory: Path) -> dict[str, tuple[FSInputFile, str]]:
+    """
+    Номер приказа -> (FSInputFile, ключ file_id в таблице content).
+
+    Ключ содержит версию файла на момент сканирования (st_mtime_ns и размер):
+    order_<номер>:<mtime_ns>:<размер>. Замененный на диске PDF получает
+    новый ключ, и после рестарта старый file_id уже не читается.
+    """
+    files = {}
+    for path in directory.glob("order_*.pdf"):
+        stat = path.stat()
+        files[path.stem[len("order_"):]] = (
+            FSInputFile(path),
+            f"{path.stem}:{stat.st_mtime_ns}:{stat.st_size}"
+        )
+    return files
+
+
+_ORDER_FILES = _scan_order_files(DOCUMENTS_PATH)
+
+# PERF: file_id уже загруженных PDF - повторная отправка без upload.
+# Хранится в таблице content под ключом версии файла, здесь - кэш поверх БД.
+_ORDER_FILE_IDS: dict[str, str] = {}
+
+
+async def _get_order_file_id(order_number: str) -> Optional[str]:
+    """file_id текущей версии приказа из памяти, при промахе - из БД"""
+    file_id = _ORDER_FILE_IDS.get(order_number)
+    if file_id is None:
+        _, media_key = _ORDER_FILES[order_number]
+        file_id = await get_media_file_id(media_key)
+        if file_id:
+            _ORDER_FILE_IDS[order_number] = file_id
+    return file_id
+
+
+async def _set_order_file_id(order_number: str, file_id: Optional[str]) -> None:
+    """Запоминает file_id приказа (None - сбросить невалидный)"""
+    if file_id:
+        _ORDER_FILE_IDS[order_number] = file_id
+    else:
+        _ORDER_FILE_IDS.pop(order_number, None)
+    document, media_key = _ORDER_FILES[order_number]
+    await set_media_file_id(
+        media_key,
+        section="orders",
+        media_file_id=file_id,
+        media_path=str(document.path),
+        media_type="document"
+    )
+
+
+_ADDRESSES_MENU_TEXT = (
+    "<b>📍 Адреса парков</b>\n\n"
+    "Выберите парк, чтобы узнать:\n"
+    "• Полный адрес\n"
+    "• Как добраться от метро\n"
+    "• Где найти парк в ТРЦ\n"
+    "• Информацию о парковке"
+)
+
+_PHONES_MENU_TEXT = (
+    "<b>📞 Важные номера телефонов</b>\n\n"
+    "Выберите парк, чтобы узнать контакты:\n"
+    "• Администратор парка\n"
+    "• Старший смены\n"
+    "• Техническая поддержка\n"
+    "• Экстренная связь"
+)
+
+# Телефоны и зарплата содержат ссылки - превью не нужно
+_NO_PREVIEW = LinkPreviewOptions(is_disabled=True)
+
+
+def _build_main_menu_text(content: dict) -> str:
+    """Текст главного меню раздела"""
+    main_menu_text = content.get("main_menu", {})
+    return (
+        f"<b>{main_menu_text.get('title', '🟢 Общая информация')}</b>\n\n"
+        f"{main_menu_text.get('description', 'Выберите интересующий раздел:')}"
+    )
+
+
+def _build_emergency_menu_text(content: dict) -> str:
+    """Текст меню внештатных ситуаций"""
+    emergency_data = content.get("emergency_situations", {})
+    return (
+        f"<b>{emergency_data.get('title', '🚨 Действия во внештатных ситуациях')}</b>\n\n"
+        "Выберите тип ситуации для получения инструкций:"
+    )
+
+
+def _build_salary_text(content: dict) -> str:
+    """Текст о зарплате и авансе"""
+    salary_data = content.get("salary_info", {})
+    schedule = salary_data.get("schedule", {})
+    payment_methods = salary_data.get("payment_methods", [])
+    delays = salary_data.get("delays", {})
+
+    text = (
+        f"<b>{salary_data.get('title', '💰 Зарплата и аванс')}</b>\n\n"
+        f"{schedule.get('advance', '')}\n"
+        f"{schedule.get('salary', '')}\n"
+        f"{schedule.get('amount', '')}\n\n"
+        f"<b>💳 Способы получения:</b>\n"
+    )
+
+    text += "\n".join(payment_methods)
+    text += f"\n\n{salary_data.get('documents', '')}"
+    text += f"\n\n<b>{delays.get('title', '')}</b>\n"
+    text += "\n".join(delays.get('steps', []))
+    text += f"\n\n{salary_data.get('taxes', '')}"
+    return text
+
+
+def _build_orders_text(content: dict) -> str:
+    """Текст меню приказов парка"""
+    orders_data = content.get("orders", {})
+    return (
+        f"<b>{orders_data.get('title', '📄 Приказы парка')}</b>\n\n"
+        f"{orders_data.get('description', '')}\n\n"
+        f"{orders_data.get('how_to_access', '')}\n\n"
+        f"{orders_data.get('important', '')}"
+    )
+
+
+def _build_discounts_menu_text(content: dict) -> str:
+    """Текст меню выбора парка для скидок"""
+    discounts_data = content.get("partner_discounts", {})
+    return (
+        f"<b>{discounts_data.get('title', '🎁 Скидки у партнеров ТРЦ')}</b>\n\n"
+        f"{discounts_data.get('description', '')}\n\n"
+        f"{discounts_data.get('how_to_get', '')}\n\n"
+        "Выберите парк:"
+    )
+
+
+def _build_emergency_parts(content: dict, situation_type: str) -> Optional[list[str]]:
+    """Инструкция по одной внештатной ситуации, сразу разбитая на части"""
+    situation = content.get("emergency_situations", {}).get(situation_type, {})
+    if not situation:
+        return None
+
+    title = situation.get("title", "")
+
+    # Формируем текст в зависимости от типа ситуации
+    if situation_type in ["evacuation", "fire", "medical", "technical"]:
+        steps = situation.get("steps", [])
+        text = f"<b>{title}</b>\n\n" + "\n\n".join(steps)
+
+        # Добавляем дополнительную информацию если есть
+        if "emergency_exits" in situation:
+            text += f"\n\n{situation['emergency_exits']}"
+        if "extinguisher_location" in situation:
+            text += f"\n\n{situation['extinguisher_location']}"
+        if "first_aid_kit" in situation:
+            text += f"\n\n{situation['first_aid_kit']}"
+        if "common_issues" in situation:
+            text += f"\n\n{situation['common_issues']}"
+
+    elif situation_type == "conflict":
+        algorithm = situation.get("algorithm", [])
+        phrases = situation.get("phrases", {})
+
+        text = f"<b>{title}</b>\n\n" + "\n\n".join(algorithm)
+        text += f"\n\n{phrases.get('good', '')}"
+        text += f"\n\n{phrases.get('bad', '')}"
+    else:
+        text = f"<b>{title}</b>\n\nИнструкция в разработке."
+
+    return split_message(text)
+
+
+def _build_address_text(content: dict, park_code: str) -> Optional[str]:
+    """Карточка адреса одного парка"""
+    park_info = content.get("addresses", {}).get(park_code, {})
+    if not park_info:
+        return None
+
+    return (
+        f"<b>🏢 {park_info.get('name')}</b>\n\n"
+        f"<b>📍 Адрес:</b>\n{park_info.get('full_address')}\n\n"
+        f"<b>🚇 Как добраться:</b>\n{park_info.get('metro')}\n\n"
+        f"<b>Маршрут:</b>\n{park_info.get('how_to_get')}\n\n"
+        f"<b>🗺️ Расположение в ТРЦ:</b>\n{park_info.get('location_in_mall')}\n\n"
+        f"<b>🅿️ Парковка:</b>\n{park_info.get('parking')}"
+    )
+
+
+def _build_navigation_parts(content: dict, park_code: str) -> Optional[list[str]]:
+    """Навигация внутри одного парка, сразу разбитая на части"""
+    park_info = content.get("addresses", {}).get(park_code, {})
+    navigation = park_info.get("indoor_navigation", {})
+    if not navigation:
+        return None
+
+    # Формируем текст с навигацией
+    text = f"<b>{navigation.get('title', '🗺️ Навигация внутри парка')}</b>\n\n"
+    text += f"<b>🏢 Парк:</b> {park_info.get('name')}\n"
+    text += f"<b>📍 Этаж:</b> {navigation.get('floor')}\n"
+    text += f"<b>🗺️ Расположение:</b> {navigation.get('location')}\n\n"
+
+    # Если есть инструкции от входа (только для Columbus)
+    if 'navigation_from_entrance' in navigation:
+        text += "<b>🚶 Как найти от входа в ТРЦ:</b>\n"
+        text += "\n".join(navigation['navigation_from_entrance'])
+        text += "\n\n"
+
+    # Добавляем зоны парка
+    text += "<b>🏢 Зоны внутри парка:</b>\n\n"
+    text += "".join(
+        f"<b>{zone.get('name')}</b>\n"
+        f"📝 {zone.get('description')}\n"
+        f"🎯 {zone.get('landmarks')}\n\n"
+        for zone in navigation.get('zones', [])
+    )
+
+    # Важные заметки
+    if navigation.get('important_notes'):
+        text += "<b>❗ Важная информация:</b>\n"
+        text += "\n".join(navigation['important_notes'])
+
+    return split_message(text)
+
+
+def _build_phone_text(content: dict, park_code: str) -> Optional[str]:
+    """Список телефонов одного парка"""
+    park_phones = content.get("phones", {}).get(park_code, {})
+    if not park_phones:
+        return None
+
+    admin = park_phones.get("admin", {})
+    senior = park_phones.get("senior_shift", {})
+    tech = park_phones.get("tech_support", {})
+    emergency = park_phones.get("emergency", {})
+
+    return (
+        f"<b>📞 {park_phones.get('park_name')}</b>\n\n"
+        f"<b>👤 {admin.get('name')}:</b>\n"
+        f"   {admin.get('person')}\n"
+        f"   📱 <a href='tel:{admin.get('phone')}'>{admin.get('phone')}</a>\n"
+        f"   ⏰ {admin.get('work_hours')}\n\n"
+        f"<b>👔 {senior.get('name')}:</b>\n"
+        f"   📱 <a href='tel:{senior.get('phone')}'>{senior.get('phone')}</a>\n"
+        f"   ⏰ {senior.get('work_hours')}\n\n"
+        f"<b>🔧 {tech.get('name')}:</b>\n"
+        f"   📱 <a href='tel:{tech.get('phone')}'>{tech.get('phone')}</a>\n"
+        f"   ⏰ {tech.get('work_hours')}\n\n"
+        f"<b>🚨 {emergency.get('name')}:</b>\n"
+        f"   📱 <a href='tel:{emergency.get('phone')}'>{emergency.get('phone')}</a>\n"
+        f"   ⏰ {emergency.get('work_hours')}"
+    )
+
+
+def _build_discount_text(content: dict, park_code: str) -> Optional[str]:
+    """Список скидок партнеров одного парка"""
+    park_discounts = content.get("partner_discounts", {}).get(park_code, {})
+    if not park_discounts:
+        return None
+
+    return f"<b>🎁 {park_discounts.get('title')}</b>\n\n" + "".join(
+        f"{partner.get('name')}\n"
+        f"💰 <b>Скидка:</b> {partner.get('discount')}\n"
+        f"📋 {partner.get('conditions')}\n"
+        f"📍 {partner.get('location')}\n\n"
+        for partner in park_discounts.get("partners", [])
+    )
+
+
+def _render_by_code(render, content: dict, codes: tuple, section: str, errors) -> dict:
+    """
+    Рендерит render(content, code) для каждого кода.
+
+    Коды без данных и с некорректными данными в словарь не попадают -
+    хендлер ответит, что информация не найдена.
+    """
+    rendered = {}
+    for code in codes:
+        value = render_content_entry(
+            render, content, code, name=f"{section}.{code}", errors=errors
+        )
+        if value:
+            rendered[code] = value
+    return rendered
+
+
+def _render_texts(content: dict, errors: Optional[list[str]] = None) -> tuple:
+    """
+    Рендерит все статичные тексты раздела.
+
+    Ошибка в одной записи контента не прерывает рендеринг: текст меню
+    заменяется заглушкой, запись по коду парка/ситуации пропускается.
+    """
+    def text(render, name: str) -> str:
+        return render_content_entry(
+            render, content, name=name, default=CONTENT_UNAVAILABLE_TEXT, errors=errors
+        )
+
+    return (
+        text(_build_main_menu_text, "main_menu"),
+        text(_build_emergency_menu_text, "emergency_situations"),
+        text(_build_salary_text, "salary_info"),
+        text(_build_orders_text, "orders"),
+        text(_build_discounts_menu_text, "partner_discounts"),
+        # Инструкции сразу разбиты на части под лимит Telegram
+        _render_by_code(_build_emergency_parts, content, _EMERGENCY_TYPES, "emergency_situations", errors),
+        _render_by_code(_build_discount_text, content, _PARK_CODES, "partner_discounts", errors),
+        _render_by_code(_build_address_text, content, _PARK_CODES, "addresses", errors),
+        _render_by_code(_build_phone_text, content, _PARK_CODES, "phones", errors),
+        _render_by_code(_build_navigation_parts, content, _PARK_CODES, "addresses.indoor_navigation", errors),
+    )
+
+
+def check_content(content: dict) -> list[str]:
+    """Ошибки рендеринга нового контента (проверка правки из админки до записи файла)"""
+    errors: list[str] = []
+    _render_texts(content, errors)
+    return errors
+
+
+def _precompute_texts(content: dict) -> None:
+    """
+    Рендерит статичные тексты раздела в глобальные переменные модуля.
+
+    Все тексты строятся до присваивания, поэтому хендлеры никогда
+    не видят смесь старого и нового контента.
+    """
+    global _MAIN_MENU_TEXT, _EMERGENCY_MENU_TEXT, _SALARY_TEXT, _ORDERS_TEXT
+    global _DISCOUNTS_MENU_TEXT, _EMERGENCY_PARTS, _DISCOUNT_TEXTS
+    global _ADDRESS_TEXTS, _PHONE_TEXTS, _NAVIGATION_PARTS
+
+    (
+        _MAIN_MENU_TEXT, _EMERGENCY_MENU_TEXT, _SALARY_TEXT, _ORDERS_TEXT,
+        _DISCOUNTS_MENU_TEXT, _EMERGENCY_PARTS, _DISCOUNT_TEXTS,
+        _ADDRESS_TEXTS, _PHONE_TEXTS, _NAVIGATION_PARTS
+    ) = _render_texts(content)
+
+
+# PERF: Контент статичен - тексты рендерятся один раз при импорте модуля
+# (и заново при reload_content после правки из админки)
+_precompute_texts(CONTENT)
+
+_reload_lock = asyncio.Lock()
+
+
+async def reload_content() -> None:
+    """Перечитывает general_info.json без блокировки event loop и обновляет тексты"""
+    global CONTENT
+
+    async with _reload_lock:
+        content = await read_json_async(CONTENT_PATH)
+        _precompute_texts(content)
+        CONTENT = content
+    logger.info("✅ Контент general_info.json перезагружен")
 
 
 @router.callback_query(F.data == "general_info")
@@ -64,21 +458,11 @@ async def show_general_info_menu(callback: CallbackQuery, state: FSMContext):
     """
     await state.set_state(MenuStates.general_info)
     
-    main_menu_text = CONTENT.get("main_menu", {})
-    text = (
-        f"<b>{main_menu_text.get('title', '🟢 Общая информация')}</b>\n\n"
-        f"{main_menu_text.get('description', 'Выберите интересующий раздел:')}"
+    await callback.message.edit_text(
+        text=_MAIN_MENU_TEXT,
+        reply_markup=_GENERAL_INFO_MENU
     )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_general_info_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_general_info_menu: {e}")
-        await callback.answer("Произошла ошибка. Попробуйте еще раз.")
+    await callback.answer()
 
 
 # ========== АДРЕСА ПАРКОВ ==========
@@ -90,29 +474,16 @@ async def show_addresses_menu(callback: CallbackQuery):
 
     ИСПРАВЛЕНИЕ: Теперь использует get_parks_addresses_menu() с callback_data "addr_*"
     """
-    logger.info(f"📍 Пользователь {callback.from_user.id} открыл меню адресов парков")
+    logger.info("📍 Пользователь {} открыл меню адресов парков", callback.from_user.id)
 
-    text = (
-        "<b>📍 Адреса парков</b>\n\n"
-        "Выберите парк, чтобы узнать:\n"
-        "• Полный адрес\n"
-        "• Как добраться от метро\n"
-        "• Где найти парк в ТРЦ\n"
-        "• Информацию о парковке"
+    await callback.message.edit_text(
+        text=_ADDRESSES_MENU_TEXT,
+        reply_markup=_PARKS_ADDRESSES_MENU  # ИСПРАВЛЕНИЕ: Используем отдельную клавиатуру для адресов
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_parks_addresses_menu()  # ИСПРАВЛЕНИЕ: Используем отдельную клавиатуру для адресов
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_addresses_menu: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("addr_"))
+@router.callback_query(F.data.in_(_ADDRESS_CALLBACKS))
 async def show_park_address(callback: CallbackQuery):
     """
     Показывает адрес и информацию о конкретном парке.
@@ -120,45 +491,30 @@ async def show_park_address(callback: CallbackQuery):
     ИСПРАВЛЕНИЕ: Теперь обрабатывает callback: addr_zeleno, addr_kashir, addr_columb
     Изменено с park_* на addr_* для разделения логики адресов и телефонов.
     """
-    park_code = callback.data.split("_")[1]  # zeleno, kashir, columb
-    logger.info(f"📍 Пользователь {callback.from_user.id} запрашивает адрес парка '{park_code}'")
+    park_code = _ADDRESS_CALLBACKS[callback.data]
+    logger.info("📍 Пользователь {} запрашивает адрес парка '{}'", callback.from_user.id, park_code)
 
-    addresses = CONTENT.get("addresses", {})
-    park_info = addresses.get(park_code, {})
+    text = _ADDRESS_TEXTS.get(park_code)
 
-    if not park_info:
+    if not text:
         # ИСПРАВЛЕНИЕ: Улучшенное сообщение об отсутствии информации
-        logger.warning(f"⚠️ Информация о парке '{park_code}' не найдена в JSON для пользователя {callback.from_user.id}")
-        logger.debug(f"Доступные парки в JSON: {list(addresses.keys())}")
+        logger.warning("⚠️ Информация о парке '{}' не найдена в JSON для пользователя {}", park_code, callback.from_user.id)
+        logger.opt(lazy=True).debug("Доступные парки в JSON: {}", lambda: list(_ADDRESS_TEXTS))
         await callback.answer(
             f"Информация о выбранном ТРЦ временно недоступна. Обратитесь к администратору.",
             show_alert=True
         )
         return
 
-    text = (
-        f"<b>🏢 {park_info.get('name')}</b>\n\n"
-        f"<b>📍 Адрес:</b>\n{park_info.get('full_address')}\n\n"
-        f"<b>🚇 Как добраться:</b>\n{park_info.get('metro')}\n\n"
-        f"<b>Маршрут:</b>\n{park_info.get('how_to_get')}\n\n"
-        f"<b>🗺️ Расположение в ТРЦ:</b>\n{park_info.get('location_in_mall')}\n\n"
-        f"<b>🅿️ Парковка:</b>\n{park_info.get('parking')}"
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=get_park_address_detail_keyboard(park_code)
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_park_address_detail_keyboard(park_code)
-        )
-        await callback.answer()
-        logger.info(f"✅ Адрес парка '{park_code}' успешно показан пользователю {callback.from_user.id}")
-    except Exception as e:
-        # ИСПРАВЛЕНИЕ: Расширенное логирование ошибок с полным traceback
-        logger.error(f"❌ Ошибка в show_park_address для парка '{park_code}', пользователь {callback.from_user.id}: {e}", exc_info=True)
-        await callback.answer("Ошибка загрузки информации")
+    await callback.answer()
+    logger.info("✅ Адрес парка '{}' успешно показан пользователю {}", park_code, callback.from_user.id)
 
 
-@router.callback_query(F.data.startswith("nav_"))
+@router.callback_query(F.data.in_(_NAVIGATION_CALLBACKS))
 async def show_park_navigation(callback: CallbackQuery):
     """
     Показывает навигацию внутри конкретного парка.
@@ -166,66 +522,18 @@ async def show_park_navigation(callback: CallbackQuery):
     Args:
         callback: Callback с данными nav_zeleno, nav_kashir, nav_columb
     """
-    park_code = callback.data.split("_")[1]  # zeleno, kashir, columb
-    logger.info(f"🗺️ Пользователь {callback.from_user.id} запрашивает навигацию парка '{park_code}'")
+    park_code = _NAVIGATION_CALLBACKS[callback.data]
+    logger.info("🗺️ Пользователь {} запрашивает навигацию парка '{}'", callback.from_user.id, park_code)
 
-    addresses = CONTENT.get("addresses", {})
-    park_info = addresses.get(park_code, {})
-    navigation = park_info.get("indoor_navigation", {})
+    parts = _NAVIGATION_PARTS.get(park_code)
 
-    if not navigation:
-        logger.warning(f"⚠️ Навигация для парка '{park_code}' не найдена")
+    if not parts:
+        logger.warning("⚠️ Навигация для парка '{}' не найдена", park_code)
         await callback.answer("Навигация для этого парка пока недоступна", show_alert=True)
         return
 
-    # Формируем текст с навигацией
-    text = f"<b>{navigation.get('title', '🗺️ Навигация внутри парка')}</b>\n\n"
-    text += f"<b>🏢 Парк:</b> {park_info.get('name')}\n"
-    text += f"<b>📍 Этаж:</b> {navigation.get('floor')}\n"
-    text += f"<b>🗺️ Расположение:</b> {navigation.get('location')}\n\n"
-
-    # Если есть инструкции от входа (только для Columbus)
-    if 'navigation_from_entrance' in navigation:
-        text += "<b>🚶 Как найти от входа в ТРЦ:</b>\n"
-        text += "\n".join(navigation['navigation_from_entrance'])
-        text += "\n\n"
-
-    # Добавляем зоны парка
-    text += "<b>🏢 Зоны внутри парка:</b>\n\n"
-    for zone in navigation.get('zones', []):
-        text += f"<b>{zone.get('name')}</b>\n"
-        text += f"📝 {zone.get('description')}\n"
-        text += f"🎯 {zone.get('landmarks')}\n\n"
-
-    # Важные заметки
-    if navigation.get('important_notes'):
-        text += "<b>❗ Важная информация:</b>\n"
-        text += "\n".join(navigation['important_notes'])
-
-    try:
-        # Если текст слишком длинный, разбиваем на части
-        if len(text) > 4000:
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    # Последняя часть с кнопками
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_park_address_detail_keyboard(park_code)
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_park_address_detail_keyboard(park_code)
-            )
-        await callback.answer()
-        logger.info(f"✅ Навигация парка '{park_code}' успешно показана пользователю {callback.from_user.id}")
-    except Exception as e:
-        logger.error(f"❌ Ошибка в show_park_navigation для парка '{park_code}': {e}", exc_info=True)
-        await callback.answer("Ошибка загрузки навигации")
+    await show_parts(callback, parts, get_park_address_detail_keyboard(park_code))
+    logger.info("✅ Навигация парка '{}' успешно показана пользователю {}", park_code, callback.from_user.id)
 
 
 # ========== ВАЖНЫЕ ТЕЛЕФОНЫ ==========
@@ -237,29 +545,16 @@ async def show_phones_menu(callback: CallbackQuery):
 
     ИСПРАВЛЕНИЕ: Теперь использует get_parks_phones_menu() с callback_data "phone_*"
     """
-    logger.info(f"📞 Пользователь {callback.from_user.id} открыл меню важных телефонов")
+    logger.info("📞 Пользователь {} открыл меню важных телефонов", callback.from_user.id)
 
-    text = (
-        "<b>📞 Важные номера телефонов</b>\n\n"
-        "Выберите парк, чтобы узнать контакты:\n"
-        "• Администратор парка\n"
-        "• Старший смены\n"
-        "• Техническая поддержка\n"
-        "• Экстренная связь"
+    await callback.message.edit_text(
+        text=_PHONES_MENU_TEXT,
+        reply_markup=_PARKS_PHONES_MENU  # ИСПРАВЛЕНИЕ: Используем отдельную клавиатуру для телефонов
     )
+    await callback.answer()
 
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_parks_phones_menu()  # ИСПРАВЛЕНИЕ: Используем отдельную клавиатуру для телефонов
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_phones_menu: {e}")
-        await callback.answer("Ошибка загрузки меню")
 
-
-@router.callback_query(F.data.startswith("phone_"))
+@router.callback_query(F.data.in_(_PHONE_CALLBACKS))
 async def show_park_phones(callback: CallbackQuery):
     """
     Показывает телефоны конкретного парка.
@@ -268,50 +563,23 @@ async def show_park_phones(callback: CallbackQuery):
     Изменено с park_* на phone_* для разделения логики адресов и телефонов.
     Убрана ненужная проверка состояния FSM, которая не работала.
     """
-    park_code = callback.data.split("_")[1]  # zeleno, kashir, columb
-    logger.info(f"📞 Пользователь {callback.from_user.id} запрашивает телефоны парка '{park_code}'")
+    park_code = _PHONE_CALLBACKS[callback.data]
+    logger.info("📞 Пользователь {} запрашивает телефоны парка '{}'", callback.from_user.id, park_code)
 
-    phones = CONTENT.get("phones", {})
-    park_phones = phones.get(park_code, {})
+    text = _PHONE_TEXTS.get(park_code)
 
-    if not park_phones:
-        logger.warning(f"⚠️ Телефоны для парка '{park_code}' не найдены в JSON")
+    if not text:
+        logger.warning("⚠️ Телефоны для парка '{}' не найдены в JSON", park_code)
         await callback.answer("Информация о телефонах не найдена", show_alert=True)
         return
-    
-    admin = park_phones.get("admin", {})
-    senior = park_phones.get("senior_shift", {})
-    tech = park_phones.get("tech_support", {})
-    emergency = park_phones.get("emergency", {})
-    
-    text = (
-        f"<b>📞 {park_phones.get('park_name')}</b>\n\n"
-        f"<b>👤 {admin.get('name')}:</b>\n"
-        f"   {admin.get('person')}\n"
-        f"   📱 <a href='tel:{admin.get('phone')}'>{admin.get('phone')}</a>\n"
-        f"   ⏰ {admin.get('work_hours')}\n\n"
-        f"<b>👔 {senior.get('name')}:</b>\n"
-        f"   📱 <a href='tel:{senior.get('phone')}'>{senior.get('phone')}</a>\n"
-        f"   ⏰ {senior.get('work_hours')}\n\n"
-        f"<b>🔧 {tech.get('name')}:</b>\n"
-        f"   📱 <a href='tel:{tech.get('phone')}'>{tech.get('phone')}</a>\n"
-        f"   ⏰ {tech.get('work_hours')}\n\n"
-        f"<b>🚨 {emergency.get('name')}:</b>\n"
-        f"   📱 <a href='tel:{emergency.get('phone')}'>{emergency.get('phone')}</a>\n"
-        f"   ⏰ {emergency.get('work_hours')}"
+
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=_BACK_TO_PHONES,
+        link_preview_options=_NO_PREVIEW
     )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_phones(),
-            disable_web_page_preview=True
-        )
-        await callback.answer()
-        logger.info(f"✅ Телефоны парка '{park_code}' успешно показаны пользователю {callback.from_user.id}")
-    except Exception as e:
-        logger.error(f"❌ Ошибка в show_park_phones для парка '{park_code}': {e}", exc_info=True)
-        await callback.answer("Ошибка загрузки телефонов")
+    await callback.answer()
+    logger.info("✅ Телефоны парка '{}' успешно показаны пользователю {}", park_code, callback.from_user.id)
 
 
 # ========== ВНЕШТАТНЫЕ СИТУАЦИИ ==========
@@ -319,92 +587,26 @@ async def show_park_phones(callback: CallbackQuery):
 @router.callback_query(F.data == "gen_emergency")
 async def show_emergency_menu(callback: CallbackQuery):
     """Показывает меню внештатных ситуаций."""
-    emergency_data = CONTENT.get("emergency_situations", {})
-    
-    text = (
-        f"<b>{emergency_data.get('title', '🚨 Действия во внештатных ситуациях')}</b>\n\n"
-        "Выберите тип ситуации для получения инструкций:"
+    await callback.message.edit_text(
+        text=_EMERGENCY_MENU_TEXT,
+        reply_markup=_EMERGENCY_MENU
     )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_emergency_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_emergency_menu: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("emergency_"))
+@router.callback_query(F.data.in_(_EMERGENCY_CALLBACKS))
 async def show_emergency_instruction(callback: CallbackQuery):
     """
     Показывает инструкцию по конкретной внештатной ситуации.
     
     Обрабатывает: evacuation, fire, medical, conflict, technical
     """
-    situation_type = callback.data.split("_")[1]
-    
-    emergency_situations = CONTENT.get("emergency_situations", {})
-    situation = emergency_situations.get(situation_type, {})
-    
-    if not situation:
+    parts = _EMERGENCY_PARTS.get(_EMERGENCY_CALLBACKS[callback.data])
+    if not parts:
         await callback.answer("Инструкция не найдена", show_alert=True)
         return
-    
-    title = situation.get("title", "")
-    
-    # Формируем текст в зависимости от типа ситуации
-    if situation_type in ["evacuation", "fire", "medical", "technical"]:
-        steps = situation.get("steps", [])
-        text = f"<b>{title}</b>\n\n" + "\n\n".join(steps)
-        
-        # Добавляем дополнительную информацию если есть
-        if "emergency_exits" in situation:
-            text += f"\n\n{situation['emergency_exits']}"
-        if "extinguisher_location" in situation:
-            text += f"\n\n{situation['extinguisher_location']}"
-        if "first_aid_kit" in situation:
-            text += f"\n\n{situation['first_aid_kit']}"
-        if "common_issues" in situation:
-            text += f"\n\n{situation['common_issues']}"
-            
-    elif situation_type == "conflict":
-        algorithm = situation.get("algorithm", [])
-        phrases = situation.get("phrases", {})
-        
-        text = f"<b>{title}</b>\n\n" + "\n\n".join(algorithm)
-        text += f"\n\n{phrases.get('good', '')}"
-        text += f"\n\n{phrases.get('bad', '')}"
-    else:
-        text = f"<b>{title}</b>\n\nИнструкция в разработке."
-    
-    try:
-        # Telegram ограничивает длину сообщения 4096 символов
-        if len(text) > 4000:
-            # Разбиваем на части
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    # Последняя часть - с кнопками
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_back_to_emergency()
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            # Удаляем старое сообщение
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_back_to_emergency()
-            )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_emergency_instruction: {e}")
-        await callback.answer("Ошибка загрузки инструкции")
+
+    await show_parts(callback, parts, _BACK_TO_EMERGENCY)
 
 
 # ========== ЗАРПЛАТА И АВАНС ==========
@@ -412,35 +614,12 @@ async def show_emergency_instruction(callback: CallbackQuery):
 @router.callback_query(F.data == "gen_salary")
 async def show_salary_info(callback: CallbackQuery):
     """Показывает информацию о зарплате и авансе."""
-    salary_data = CONTENT.get("salary_info", {})
-    schedule = salary_data.get("schedule", {})
-    payment_methods = salary_data.get("payment_methods", [])
-    delays = salary_data.get("delays", {})
-    
-    text = (
-        f"<b>{salary_data.get('title', '💰 Зарплата и аванс')}</b>\n\n"
-        f"{schedule.get('advance', '')}\n"
-        f"{schedule.get('salary', '')}\n"
-        f"{schedule.get('amount', '')}\n\n"
-        f"<b>💳 Способы получения:</b>\n"
+    await callback.message.edit_text(
+        text=_SALARY_TEXT,
+        reply_markup=_BACK_TO_GENERAL_INFO,
+        link_preview_options=_NO_PREVIEW
     )
-    
-    text += "\n".join(payment_methods)
-    text += f"\n\n{salary_data.get('documents', '')}"
-    text += f"\n\n<b>{delays.get('title', '')}</b>\n"
-    text += "\n".join(delays.get('steps', []))
-    text += f"\n\n{salary_data.get('taxes', '')}"
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_general_info(),
-            disable_web_page_preview=True
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_salary_info: {e}")
-        await callback.answer("Ошибка загрузки информации")
+    await callback.answer()
 
 
 # ========== ПРИКАЗЫ ПАРКА ==========
@@ -448,59 +627,55 @@ async def show_salary_info(callback: CallbackQuery):
 @router.callback_query(F.data == "gen_orders")
 async def show_orders_menu(callback: CallbackQuery):
     """Показывает меню приказов парка."""
-    orders_data = CONTENT.get("orders", {})
-    
-    text = (
-        f"<b>{orders_data.get('title', '📄 Приказы парка')}</b>\n\n"
-        f"{orders_data.get('description', '')}\n\n"
-        f"{orders_data.get('how_to_access', '')}\n\n"
-        f"{orders_data.get('important', '')}"
+    await callback.message.edit_text(
+        text=_ORDERS_TEXT,
+        reply_markup=_ORDERS_MENU
     )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_orders_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_orders_menu: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("order_"))
+@router.callback_query(F.data.in_(_ORDER_CALLBACKS))
 async def send_order_document(callback: CallbackQuery):
     """
     Отправляет PDF-документ приказа.
     
-    В реальном проекте здесь будет загрузка из content/media/documents/
+    Файлы берутся из content/media/documents/ (order_<номер>.pdf).
     """
-    order_number = callback.data.split("_")[1]
-    
-    # Путь к документам
-    documents_path = Path(__file__).parent.parent / "content" / "media" / "documents"
-    order_file = documents_path / f"order_{order_number}.pdf"
-    
-    try:
-        if order_file.exists():
-            # Отправляем реальный документ
-            document = FSInputFile(order_file)
-            await callback.message.answer_document(
-                document=document,
-                caption=f"📄 Приказ №{order_number}\n\n"
-                        "⚠️ Ознакомьтесь с документом и распишитесь в журнале."
-            )
-            await callback.answer("Документ отправлен ✅")
-        else:
-            # Если файла нет - отправляем уведомление
-            await callback.answer(
-                f"Документ приказа №{order_number} временно недоступен. "
-                "Обратитесь к администратору.",
-                show_alert=True
+    order_number = _ORDER_CALLBACKS[callback.data]
+    order_file = _ORDER_FILES.get(order_number)
+
+    caption = (
+        f"📄 Приказ №{order_number}\n\n"
+        "⚠️ Ознакомьтесь с документом и распишитесь в журнале."
+    )
+
+    if order_file is not None:
+        file_id = await _get_order_file_id(order_number)
+        if file_id:
+            try:
+                await callback.message.answer_document(document=file_id, caption=caption)
+            except TelegramBadRequest as e:
+                # file_id больше не принимается - загружаем файл заново
+                logger.warning("file_id приказа {} отклонен: {}", order_number, e)
+                await _set_order_file_id(order_number, None)
+                file_id = None
+
+        if not file_id:
+            # Отправляем реальный документ с диска
+            message = await callback.message.answer_document(
+                document=order_file[0],
+                caption=caption
             )
-    except Exception as e:
-        logger.error(f"Ошибка отправки документа order_{order_number}: {e}")
-        await callback.answer("Ошибка отправки документа", show_alert=True)
+            if message.document:
+                await _set_order_file_id(order_number, message.document.file_id)
+        await callback.answer("Документ отправлен ✅")
+    else:
+        # Если файла нет - отправляем уведомление
+        await callback.answer(
+            f"Документ приказа №{order_number} временно недоступен. "
+            "Обратитесь к администратору.",
+            show_alert=True
+        )
 
 
 # ========== СКИДКИ ПАРТНЕРОВ ==========
@@ -508,55 +683,23 @@ async def send_order_document(callback: CallbackQuery):
 @router.callback_query(F.data == "gen_discounts")
 async def show_discounts_menu(callback: CallbackQuery):
     """Показывает меню выбора парка для просмотра скидок."""
-    discounts_data = CONTENT.get("partner_discounts", {})
-    
-    text = (
-        f"<b>{discounts_data.get('title', '🎁 Скидки у партнеров ТРЦ')}</b>\n\n"
-        f"{discounts_data.get('description', '')}\n\n"
-        f"{discounts_data.get('how_to_get', '')}\n\n"
-        "Выберите парк:"
+    await callback.message.edit_text(
+        text=_DISCOUNTS_MENU_TEXT,
+        reply_markup=_DISCOUNTS_PARKS_MENU
     )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_discounts_parks_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_discounts_menu: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("discount_"))
+@router.callback_query(F.data.in_(_DISCOUNT_CALLBACKS))
 async def show_park_discounts(callback: CallbackQuery):
     """Показывает скидки партнеров для конкретного парка."""
-    park_code = callback.data.split("_")[1]
-    
-    discounts = CONTENT.get("partner_discounts", {})
-    park_discounts = discounts.get(park_code, {})
-    
-    if not park_discounts:
+    text = _DISCOUNT_TEXTS.get(_DISCOUNT_CALLBACKS[callback.data])
+    if not text:
         await callback.answer("Информация о скидках не найдена", show_alert=True)
         return
-    
-    text = f"<b>🎁 {park_discounts.get('title')}</b>\n\n"
-    
-    partners = park_discounts.get("partners", [])
-    for partner in partners:
-        text += (
-            f"{partner.get('name')}\n"
-            f"💰 <b>Скидка:</b> {partner.get('discount')}\n"
-            f"📋 {partner.get('conditions')}\n"
-            f"📍 {partner.get('location')}\n\n"
-        )
-    
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_discounts()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_park_discounts: {e}")
-        await callback.answer("Ошибка загрузки скидок")
+
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=_BACK_TO_DISCOUNTS
+    )
+    await callback.answer()
@@ -9,212 +9,121 @@ Handler для раздела "Наша кухня".
 - Правила гигиены
 """
 
-import json
 from pathlib import Path
 
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
-from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from states.menu_states import MenuStates
-from utils.logger import logger
+from utils.json_loader import CONTENT_UNAVAILABLE_TEXT, load_handler_content, render_content_entry
 
 # Создаем router для этого модуля
 router = Router(name='kitchen')
 
+# callback_data категорий меню: kitchen_cat_<код категории>
+_CATEGORY_PREFIX = "kitchen_cat_"
+
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "kitchen_menu.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент kitchen_menu.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
-
-
-def get_kitchen_menu() -> InlineKeyboardMarkup:
-    """Меню раздела Наша кухня"""
-    builder = InlineKeyboardBuilder()
-
-    builder.button(text="📋 Меню блюд", callback_data="kitchen_menu")
-    builder.button(text="⚠️ Информация об аллергенах", callback_data="kitchen_allergens")
-    builder.button(text="📋 Технологические карты", callback_data="kitchen_tech_cards")
-    builder.button(text="💼 Скидки для сотрудников", callback_data="kitchen_discount")
-    builder.button(text="🧼 Правила гигиены", callback_data="kitchen_hygiene")
-    builder.button(text="◀️ Назад", callback_data="back_to_main")
-
-    builder.adjust(1)
-    return builder.as_markup()
-
-
-def get_menu_categories() -> InlineKeyboardMarkup:
-    """Меню выбора категории блюд"""
-    builder = InlineKeyboardBuilder()
-
-    builder.button(text="🍕 Пицца", callback_data="kitchen_cat_pizza")
-    builder.button(text="🍔 Бургеры и сэндвичи", callback_data="kitchen_cat_burgers")
-    builder.button(text="🍟 Закуски", callback_data="kitchen_cat_snacks")
-    builder.button(text="🥗 Салаты", callback_data="kitchen_cat_salads")
-    builder.button(text="🍰 Десерты", callback_data="kitchen_cat_desserts")
-    builder.button(text="◀️ Назад", callback_data="kitchen")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-
-    builder.adjust(1, 1, 1, 1, 1, 2)
-    return builder.as_markup()
-
+CONTENT = load_handler_content(CONTENT_PATH)
 
-def get_back_to_kitchen() -> InlineKeyboardMarkup:
-    """Кнопка возврата к меню кухни"""
-    builder = InlineKeyboardBuilder()
-    builder.button(text="◀️ Назад", callback_data="kitchen")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-    builder.adjust(2)
-    return builder.as_markup()
 
+# Соответствие callback-кода категории и её названия в kitchen_menu.json
+_CATEGORY_NAMES = {
+    "pizza": "🍕 Пицца",
+    "burgers": "🍔 Бургеры и сэндвичи",
+    "snacks": "🍟 Закуски",
+    "salads": "🥗 Салаты",
+    "desserts": "🍰 Десерты"
+}
 
-def get_back_to_menu() -> InlineKeyboardMarkup:
-    """Кнопка возврата к категориям меню"""
-    builder = InlineKeyboardBuilder()
-    builder.button(text="◀️ Назад", callback_data="kitchen_menu")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-    builder.adjust(2)
-    return builder.as_markup()
+_MENU_CATEGORIES_TEXT = (
+    "<b>📋 Меню блюд</b>\n\n"
+    "Выберите категорию для просмотра меню:"
+)
 
 
-@router.callback_query(F.data == "kitchen")
-async def show_kitchen_menu(callback: CallbackQuery, state: FSMContext):
-    """Показывает главное меню раздела Наша кухня"""
-    await state.set_state(MenuStates.main_menu)
-
-    main_menu_text = CONTENT.get("main_menu", {})
-    text = (
+def _build_kitchen_menu_text(content: dict) -> str:
+    """Текст главного меню раздела Наша кухня"""
+    main_menu_text = content.get("main_menu", {})
+    return (
         f"<b>{main_menu_text.get('title', '🍽️ Наша кухня')}</b>\n\n"
         f"{main_menu_text.get('description', 'Выберите раздел:')}"
     )
 
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_kitchen_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_kitchen_menu: {e}")
-        await callback.answer("Произошла ошибка. Попробуйте еще раз.")
 
-
-@router.callback_query(F.data == "kitchen_menu")
-async def show_menu_categories_handler(callback: CallbackQuery):
-    """Показывает категории блюд"""
+def _build_dish_text(item: dict) -> str:
+    """Описание одного блюда в меню категории"""
     text = (
-        "<b>📋 Меню блюд</b>\n\n"
-        "Выберите категорию для просмотра меню:"
+        f"<b>{item.get('name', '')}</b> — {item.get('price', '')}\n"
+        f"• Вес: {item.get('weight', '')}\n"
+        f"• {item.get('description', '')}\n"
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_menu_categories()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_menu_categories: {e}")
-        await callback.answer("Ошибка загрузки меню")
+    if item.get("allergens"):
+        text += f"⚠️ Аллергены: {', '.join(item['allergens'])}\n"
+    return text + "\n"
 
 
-@router.callback_query(F.data.startswith("kitchen_cat_"))
-async def show_menu_by_category(callback: CallbackQuery):
-    """Показывает блюда по категории"""
-    category_code = callback.data.replace("kitchen_cat_", "")
-
-    category_map = {
-        "pizza": "🍕 Пицца",
-        "burgers": "🍔 Бургеры и сэндвичи",
-        "snacks": "🍟 Закуски",
-        "salads": "🥗 Салаты",
-        "desserts": "🍰 Десерты"
+def _build_categories_index(content: dict) -> dict[str, dict]:
+    """Категории меню из JSON по названию"""
+    return {
+        cat["name"]: cat
+        for cat in content.get("menu", {}).get("categories", [])
     }
 
-    menu_data = CONTENT.get("menu", {})
-    categories = menu_data.get("categories", [])
 
-    # Находим нужную категорию
-    category = None
-    for cat in categories:
-        if category_map.get(category_code) == cat["name"]:
-            category = cat
-            break
-
-    if not category:
-        await callback.answer("Категория не найдена", show_alert=True)
-        return
-
-    text = f"<b>{category['name']}</b>\n\n"
-
-    for item in category["items"]:
-        text += f"<b>{item['name']}</b> — {item['price']}\n"
-        text += f"• Вес: {item['weight']}\n"
-        text += f"• {item['description']}\n"
+def _build_category_text(name: str, category: dict) -> str:
+    """Текст меню одной категории блюд"""
+    return f"<b>{name}</b>\n\n" + "".join(
+        _build_dish_text(item) for item in category.get("items", [])
+    )
 
-        if item.get("allergens"):
-            allergens_str = ", ".join(item["allergens"])
-            text += f"⚠️ Аллергены: {allergens_str}\n"
 
-        text += "\n"
+def _build_category_texts(categories: dict[str, dict]) -> dict[str, str]:
+    """
+    Готовые тексты меню по callback_data категории (kitchen_cat_pizza, ...).
 
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_menu_by_category: {e}")
-        await callback.answer("Ошибка загрузки блюд")
+    Категория с некорректными данными пропускается - хендлер ответит
+    "Категория не найдена".
+    """
+    texts = {}
+    for code, name in _CATEGORY_NAMES.items():
+        if name not in categories:
+            continue
+        text = render_content_entry(_build_category_text, name, categories[name], name=f"menu.{code}")
+        if text:
+            texts[f"{_CATEGORY_PREFIX}{code}"] = text
+    return texts
 
 
-@router.callback_query(F.data == "kitchen_allergens")
-async def show_allergens_info(callback: CallbackQuery):
-    """Показывает информацию об аллергенах"""
-    allergens_data = CONTENT.get("allergens", {})
+def _build_allergens_text(content: dict) -> str:
+    """Текст информации об аллергенах"""
+    allergens_data = content.get("allergens", {})
 
     text = f"<b>{allergens_data.get('title', '⚠️ Информация об аллергенах')}</b>\n\n"
     text += f"{allergens_data.get('description', '')}\n\n"
 
     text += "<b>Основные аллергены:</b>\n\n"
-    for allergen in allergens_data.get("common_allergens", [])[:4]:  # Первые 4 для экономии места
-        text += f"<b>{allergen['name']}</b>\n"
-        text += f"• Источники: {allergen['sources']}\n"
-        text += f"• {allergen['severity']}\n\n"
+    text += "".join(
+        f"<b>{allergen['name']}</b>\n"
+        f"• Источники: {allergen['sources']}\n"
+        f"• {allergen['severity']}\n\n"
+        for allergen in allergens_data.get("common_allergens", [])[:4]  # Первые 4 для экономии места
+    )
 
     text += "<b>Протокол действий:</b>\n\n"
-    for action in allergens_data.get("action_protocol", [])[:6]:  # Первые 6 шагов
-        text += f"{action}\n"
+    text += "".join(f"{action}\n" for action in allergens_data.get("action_protocol", [])[:6])  # Первые 6 шагов
 
     text += f"\n{allergens_data.get('important', '')}"
+    return text
 
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_kitchen()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_allergens_info: {e}")
-        await callback.answer("Ошибка загрузки информации")
 
-
-@router.callback_query(F.data == "kitchen_tech_cards")
-async def show_tech_cards(callback: CallbackQuery):
-    """Показывает технологические карты"""
-    tech_cards_data = CONTENT.get("tech_cards", {})
+def _build_tech_cards_text(content: dict) -> str:
+    """Текст технологических карт (первый рецепт)"""
+    tech_cards_data = content.get("tech_cards", {})
 
     text = f"<b>{tech_cards_data.get('title', '📋 Технологические карты')}</b>\n\n"
     text += f"{tech_cards_data.get('description', '')}\n\n"
@@ -226,65 +135,162 @@ async def show_tech_cards(callback: CallbackQuery):
         text += f"<b>{recipe['dish']}</b>\n\n"
 
         text += "<b>Ингредиенты:</b>\n"
-        for ingredient in recipe["ingredients"]:
-            text += f"{ingredient}\n"
+        text += "".join(f"{ingredient}\n" for ingredient in recipe["ingredients"])
 
         text += "\n<b>Приготовление:</b>\n"
-        for step in recipe["steps"]:
-            text += f"{step}\n"
+        text += "".join(f"{step}\n" for step in recipe["steps"])
 
         text += f"\n⏱️ Время: {recipe['time']}\n"
         text += f"🌡️ Температура: {recipe['temperature']}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_kitchen()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_tech_cards: {e}")
-        await callback.answer("Ошибка загрузки карт")
+    return text
 
 
-@router.callback_query(F.data == "kitchen_discount")
-async def show_kitchen_discount(callback: CallbackQuery):
-    """Показывает информацию о скидках для сотрудников"""
-    discount_data = CONTENT.get("employee_discount", {})
+def _build_employee_discount_text(content: dict) -> str:
+    """Текст о скидках для сотрудников"""
+    discount_data = content.get("employee_discount", {})
 
     text = f"<b>{discount_data.get('title', '💼 Скидка для сотрудников')}</b>\n\n"
     text += f"{discount_data.get('description', '')}\n\n"
+    text += "".join(f"{benefit}\n" for benefit in discount_data.get("benefits", []))
+    return text
 
-    for benefit in discount_data.get("benefits", []):
-        text += f"{benefit}\n"
 
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_kitchen()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_kitchen_discount: {e}")
-        await callback.answer("Ошибка загрузки информации")
+def _build_hygiene_text(content: dict) -> str:
+    """Текст правил гигиены"""
+    hygiene_data = content.get("hygiene", {})
 
+    text = f"<b>{hygiene_data.get('title', '🧼 Правила гигиены')}</b>\n\n"
+    text += "".join(f"{rule}\n" for rule in hygiene_data.get("rules", []))
+    return text
+
+
+def _render_text(render, name: str) -> str:
+    """Текст раздела из CONTENT; при некорректных данных - заглушка вместо ошибки импорта"""
+    return render_content_entry(render, CONTENT, name=name, default=CONTENT_UNAVAILABLE_TEXT)
+
+
+# PERF: kitchen_menu.json не меняется во время работы - все экраны раздела
+# рендерятся один раз при импорте, handlers только отправляют готовый текст
+_KITCHEN_MENU_TEXT = _render_text(_build_kitchen_menu_text, "main_menu")
+_CATEGORY_TEXTS = _build_category_texts(
+    render_content_entry(_build_categories_index, CONTENT, name="menu", default={})
+)
+# Точное совпадение callback_data вместо startswith: кнопки есть для всех
+# кодов, даже если категории нет в JSON (тогда - "Категория не найдена")
+_CATEGORY_CALLBACKS = frozenset(f"{_CATEGORY_PREFIX}{code}" for code in _CATEGORY_NAMES)
+_ALLERGENS_TEXT = _render_text(_build_allergens_text, "allergens")
+_TECH_CARDS_TEXT = _render_text(_build_tech_cards_text, "tech_cards")
+_EMPLOYEE_DISCOUNT_TEXT = _render_text(_build_employee_discount_text, "employee_discount")
+_HYGIENE_TEXT = _render_text(_build_hygiene_text, "hygiene")
+
+
+def _button(text: str, callback_data: str) -> InlineKeyboardButton:
+    return InlineKeyboardButton(text=text, callback_data=callback_data)
+
+
+# PERF: Разметка клавиатур не зависит от пользователя и контента -
+# InlineKeyboardMarkup создаются один раз при импорте и переиспользуются
+
+# Меню раздела Наша кухня
+_KITCHEN_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("📋 Меню блюд", "kitchen_menu")],
+    [_button("⚠️ Информация об аллергенах", "kitchen_allergens")],
+    [_button("📋 Технологические карты", "kitchen_tech_cards")],
+    [_button("💼 Скидки для сотрудников", "kitchen_discount")],
+    [_button("🧼 Правила гигиены", "kitchen_hygiene")],
+    [_button("◀️ Назад", "back_to_main")]
+])
+
+# Меню выбора категории блюд
+_MENU_CATEGORIES = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("🍕 Пицца", "kitchen_cat_pizza")],
+    [_button("🍔 Бургеры и сэндвичи", "kitchen_cat_burgers")],
+    [_button("🍟 Закуски", "kitchen_cat_snacks")],
+    [_button("🥗 Салаты", "kitchen_cat_salads")],
+    [_button("🍰 Десерты", "kitchen_cat_desserts")],
+    [_button("◀️ Назад", "kitchen"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+# Кнопка возврата к меню кухни
+_BACK_TO_KITCHEN = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("◀️ Назад", "kitchen"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+# Кнопка возврата к категориям меню
+_BACK_TO_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("◀️ Назад", "kitchen_menu"), _button("🏠 Главное меню", "back_to_main")]
+])
 
-@router.callback_query(F.data == "kitchen_hygiene")
-async def show_hygiene_rules(callback: CallbackQuery):
-    """Показывает правила гигиены"""
-    hygiene_data = CONTENT.get("hygiene", {})
 
-    text = f"<b>{hygiene_data.get('title', '🧼 Правила гигиены')}</b>\n\n"
+def get_kitchen_menu() -> InlineKeyboardMarkup:
+    """Меню раздела Наша кухня (кэшированное)"""
+    return _KITCHEN_MENU
+
+
+def get_menu_categories() -> InlineKeyboardMarkup:
+    """Меню выбора категории блюд (кэшированное)"""
+    return _MENU_CATEGORIES
+
+
+def get_back_to_kitchen() -> InlineKeyboardMarkup:
+    """Кнопка возврата к меню кухни (кэшированная)"""
+    return _BACK_TO_KITCHEN
+
+
+def get_back_to_menu() -> InlineKeyboardMarkup:
+    """Кнопка возврата к категориям меню (кэшированная)"""
+    return _BACK_TO_MENU
+
 
-    for rule in hygiene_data.get("rules", []):
-        text += f"{rule}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_kitchen()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_hygiene_rules: {e}")
-        await callback.answer("Ошибка загрузки правил")
+@router.callback_query(F.data == "kitchen")
+async def show_kitchen_menu(callback: CallbackQuery, state: FSMContext):
+    """Показывает главное меню раздела Наша кухня"""
+    await state.set_state(MenuStates.main_menu)
+
+    await callback.message.edit_text(
+        text=_KITCHEN_MENU_TEXT,
+        reply_markup=_KITCHEN_MENU
+    )
+    await callback.answer()
+
+
+# Статичные экраны раздела: callback_data -> (текст, клавиатура).
+# Один handler с одним фильтром вместо пяти одинаковых
+_SECTION_SCREENS = {
+    "kitchen_menu": (_MENU_CATEGORIES_TEXT, _MENU_CATEGORIES),
+    "kitchen_allergens": (_ALLERGENS_TEXT, _BACK_TO_KITCHEN),
+    "kitchen_tech_cards": (_TECH_CARDS_TEXT, _BACK_TO_KITCHEN),
+    "kitchen_discount": (_EMPLOYEE_DISCOUNT_TEXT, _BACK_TO_KITCHEN),
+    "kitchen_hygiene": (_HYGIENE_TEXT, _BACK_TO_KITCHEN),
+}
+
+
+@router.callback_query(F.data.in_(_SECTION_SCREENS))
+async def show_kitchen_section(callback: CallbackQuery):
+    """
+    Показывает статичный экран раздела кухни.
+
+    Обрабатывает: kitchen_menu (категории блюд), kitchen_allergens,
+    kitchen_tech_cards, kitchen_discount, kitchen_hygiene
+    """
+    text, reply_markup = _SECTION_SCREENS[callback.data]
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=reply_markup
+    )
+    await callback.answer()
+
+
+@router.callback_query(F.data.in_(_CATEGORY_CALLBACKS))
+async def show_menu_by_category(callback: CallbackQuery):
+    """Показывает блюда по категории"""
+    text = _CATEGORY_TEXTS.get(callback.data)
+    if not text:
+        await callback.answer("Категория не найдена", show_alert=True)
+        return
+
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=_BACK_TO_MENU
+    )
+    await callback.answer()
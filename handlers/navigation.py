@@ -7,56 +7,121 @@ Handler для раздела "Навигация".
 - Важные локации (выходы, огнетушители, туалеты)
 """
 
-import json
 from pathlib import Path
 
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
-from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from states.menu_states import MenuStates
+from utils.json_loader import CONTENT_UNAVAILABLE_TEXT, load_handler_content, render_content_entry
 from utils.logger import logger
 
 # Создаем router для этого модуля
 router = Router(name='navigation')
 
+# callback_data навигации по парку: nav_<код парка>
+_PARK_PREFIX = "nav_"
+
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "navigation.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент navigation.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
+CONTENT = load_handler_content(CONTENT_PATH)
 
+# Парки с кнопками в меню навигации (ключи navigation.json)
+_PARK_CODES = ("kashirskaya", "columbus", "zeleno")
+
+
+def _build_navigation_menu_text(content: dict) -> str:
+    """Текст главного меню раздела Навигация"""
+    main_menu_text = content.get("main_menu", {})
+    return (
+        f"<b>{main_menu_text.get('title', '🗺️ Навигация')}</b>\n\n"
+        f"{main_menu_text.get('description', 'Выберите парк для просмотра навигации:')}"
+    )
+
+
+def _build_park_text(park_info: dict) -> str:
+    """Текст навигации по одному парку"""
+    text = f"<b>🗺️ {park_info.get('name')}</b>\n\n"
+    text += f"<b>📍 Расположение:</b> {park_info.get('floor')}, {park_info.get('location')}\n\n"
+
+    # Навигация от входа (если есть)
+    if "navigation_from_entrance" in park_info:
+        text += "<b>🚶 Как найти парк:</b>\n"
+        text += "".join(f"{step}\n" for step in park_info["navigation_from_entrance"])
+        text += "\n"
+
+    text += "<b>🏢 Зоны парка:</b>\n\n"
+    text += "".join(
+        f"<b>{zone.get('name', '')}</b>\n"
+        f"• {zone.get('description', '')}\n"
+        f"• {zone.get('landmarks', '')}\n\n"
+        for zone in park_info.get("zones", [])
+    )
+
+    # Важные заметки
+    if "important_notes" in park_info:
+        text += "<b>⚠️ Важные ориентиры:</b>\n"
+        text += "".join(f"{note}\n" for note in park_info["important_notes"])
+    return text
+
+
+def _build_park_texts(content: dict) -> dict[str, str]:
+    """
+    Готовые тексты навигации по коду парка.
+
+    Парк с некорректными данными пропускается - хендлер сообщит,
+    что навигация временно недоступна.
+    """
+    texts = {}
+    for park_code in _PARK_CODES:
+        if not content.get(park_code):
+            continue
+        text = render_content_entry(_build_park_text, content[park_code], name=park_code)
+        if text:
+            texts[park_code] = text
+    return texts
 
-def get_navigation_menu() -> InlineKeyboardMarkup:
-    """Меню выбора парка для навигации"""
-    builder = InlineKeyboardBuilder()
 
-    builder.button(text="🏢 ТРЦ Каширская плаза", callback_data="nav_kashirskaya")
-    builder.button(text="🏢 ТРЦ Коламбус", callback_data="nav_columbus")
-    builder.button(text="🏢 ТРЦ Зеленопарк", callback_data="nav_zeleno")
-    builder.button(text="◀️ Назад", callback_data="back_to_main")
+# PERF: Тексты навигации рендерятся один раз при импорте модуля
+_NAVIGATION_MENU_TEXT = render_content_entry(
+    _build_navigation_menu_text, CONTENT, name="main_menu", default=CONTENT_UNAVAILABLE_TEXT
+)
+_PARK_TEXTS = _build_park_texts(CONTENT)
+# callback_data кнопки -> код парка, для фильтра F.data.in_() без разбора строки
+_PARK_CALLBACKS = {f"{_PARK_PREFIX}{park_code}": park_code for park_code in _PARK_CODES}
 
-    builder.adjust(1)
-    return builder.as_markup()
+
+def _button(text: str, callback_data: str) -> InlineKeyboardButton:
+    return InlineKeyboardButton(text=text, callback_data=callback_data)
+
+
+# PERF: Обе клавиатуры статичны - собираем их один раз при импорте
+
+# Меню выбора парка для навигации
+_NAVIGATION_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("🏢 ТРЦ Каширская плаза", "nav_kashirskaya")],
+    [_button("🏢 ТРЦ Коламбус", "nav_columbus")],
+    [_button("🏢 ТРЦ Зеленопарк", "nav_zeleno")],
+    [_button("◀️ Назад", "back_to_main")]
+])
+
+# Кнопка возврата к выбору парка
+_BACK_TO_NAVIGATION = InlineKeyboardMarkup(inline_keyboard=[
+    [_button("◀️ Назад", "navigation"), _button("🏠 Главное меню", "back_to_main")]
+])
+
+
+def get_navigation_menu() -> InlineKeyboardMarkup:
+    """Меню выбора парка для навигации (кэшированное)"""
+    return _NAVIGATION_MENU
 
 
 def get_back_to_navigation() -> InlineKeyboardMarkup:
-    """Кнопка возврата к выбору парка"""
-    builder = InlineKeyboardBuilder()
-    builder.button(text="◀️ Назад", callback_data="navigation")
-    builder.button(text="🏠 Главное меню", callback_data="back_to_main")
-    builder.adjust(2)
-    return builder.as_markup()
+    """Кнопка возврата к выбору парка (кэшированная)"""
+    return _BACK_TO_NAVIGATION
 
 
 @router.callback_query(F.data == "navigation")
@@ -70,36 +135,26 @@ async def show_navigation_menu(callback: CallbackQuery, state: FSMContext):
     """
     await state.set_state(MenuStates.main_menu)
 
-    main_menu_text = CONTENT.get("main_menu", {})
-    text = (
-        f"<b>{main_menu_text.get('title', '🗺️ Навигация')}</b>\n\n"
-        f"{main_menu_text.get('description', 'Выберите парк для просмотра навигации:')}"
+    await callback.message.edit_text(
+        text=_NAVIGATION_MENU_TEXT,
+        reply_markup=_NAVIGATION_MENU
     )
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_navigation_menu()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_navigation_menu: {e}")
-        await callback.answer("Произошла ошибка. Попробуйте еще раз.")
+    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("nav_"))
+@router.callback_query(F.data.in_(_PARK_CALLBACKS))
 async def show_park_navigation(callback: CallbackQuery):
     """
     Показывает навигацию для конкретного парка.
 
     Обрабатывает callback: nav_kashirskaya, nav_columbus, nav_zeleno
     """
-    park_code = callback.data.split("_")[1]  # kashirskaya, columbus, zeleno
+    park_code = _PARK_CALLBACKS[callback.data]  # kashirskaya, columbus, zeleno
     logger.info(f"🗺️ Пользователь {callback.from_user.id} запрашивает навигацию парка '{park_code}'")
 
-    park_info = CONTENT.get(park_code, {})
+    text = _PARK_TEXTS.get(park_code)
 
-    if not park_info:
+    if not text:
         logger.warning(f"⚠️ Информация о навигации парка '{park_code}' не найдена")
         await callback.answer(
             "Информация о навигации для выбранного парка временно недоступна.",
@@ -107,36 +162,8 @@ async def show_park_navigation(callback: CallbackQuery):
         )
         return
 
-    # Формируем текст с информацией о парке
-    text = f"<b>🗺️ {park_info.get('name')}</b>\n\n"
-    text += f"<b>📍 Расположение:</b> {park_info.get('floor')}, {park_info.get('location')}\n\n"
-
-    # Добавляем навигацию от входа (если есть)
-    if "navigation_from_entrance" in park_info:
-        text += "<b>🚶 Как найти парк:</b>\n"
-        for step in park_info["navigation_from_entrance"]:
-            text += f"{step}\n"
-        text += "\n"
-
-    # Добавляем зоны
-    text += "<b>🏢 Зоны парка:</b>\n\n"
-    for zone in park_info.get("zones", []):
-        text += f"<b>{zone['name']}</b>\n"
-        text += f"• {zone['description']}\n"
-        text += f"• {zone['landmarks']}\n\n"
-
-    # Добавляем важные заметки
-    if "important_notes" in park_info:
-        text += "<b>⚠️ Важные ориентиры:</b>\n"
-        for note in park_info["important_notes"]:
-            text += f"{note}\n"
-
-    try:
-        await callback.message.edit_text(
-            text=text,
-            reply_markup=get_back_to_navigation()
-        )
-        await callback.answer()
-    except Exception as e:
-        logger.error(f"Ошибка в show_park_navigation: {e}")
-        await callback.answer("Ошибка загрузки навигации")
+    await callback.message.edit_text(
+        text=text,
+        reply_markup=_BACK_TO_NAVIGATION
+    )
+    await callback.answer()
@@ -12,7 +12,7 @@ Handler для раздела "Отдел продаж".
 Это самый объемный handler в проекте.
 """
 
-import json
+import asyncio
 from pathlib import Path
 
 from aiogram import Router, F
@@ -38,24 +38,33 @@ from keyboards.sales_kb import (
     get_back_to_fraud
 )
 from states.menu_states import MenuStates
+from utils.json_loader import load_handler_content, read_json_async
 from utils.logger import logger
 
 # Создаем router для этого модуля
 router = Router(name='sales')
 
+# Префиксы callback_data, после которых идет код раздела
+_CASH_PREFIX = "sales_cash_"
+_CRM_PREFIX = "sales_crm_"
+_SCRIPT_PREFIX = "sales_script_"
+_FRAUD_PREFIX = "sales_fraud_"
+
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "sales.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент sales.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
+CONTENT = load_handler_content(CONTENT_PATH)
+
+_reload_lock = asyncio.Lock()
+
+
+async def reload_content() -> None:
+    """Перечитывает sales.json без блокировки event loop (после правки из админки)"""
+    global CONTENT
+
+    async with _reload_lock:
+        CONTENT = await read_json_async(CONTENT_PATH)
+    logger.info("✅ Контент sales.json перезагружен")
 
 
 # ========== ГЛАВНОЕ МЕНЮ РАЗДЕЛА ==========
@@ -473,10 +482,10 @@ async def send_cash_video(callback: CallbackQuery):
         await callback.answer("Видео не найдено", show_alert=True)
 
 
-@router.callback_query(F.data.startswith("sales_cash_"))
+@router.callback_query(F.data.startswith(_CASH_PREFIX))
 async def show_cash_instructions(callback: CallbackQuery):
     """Показывает инструкции по работе с кассой."""
-    section = callback.data.replace("sales_cash_", "")
+    section = callback.data[len(_CASH_PREFIX):]
     
     cash_data = CONTENT.get("cash_register", {})
     section_data = cash_data.get(section, {})
@@ -582,10 +591,10 @@ async def send_crm_video(callback: CallbackQuery):
         await callback.answer("Видео не найдено", show_alert=True)
 
 
-@router.callback_query(F.data.startswith("sales_crm_"))
+@router.callback_query(F.data.startswith(_CRM_PREFIX))
 async def show_crm_instructions(callback: CallbackQuery):
     """Показывает инструкции по работе с CRM."""
-    section = callback.data.replace("sales_crm_", "")
+    section = callback.data[len(_CRM_PREFIX):]
     
     crm_data = CONTENT.get("crm", {})
     section_mapping = {
@@ -714,10 +723,10 @@ async def show_scripts_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sales_script_"))
+@router.callback_query(F.data.startswith(_SCRIPT_PREFIX))
 async def show_script(callback: CallbackQuery):
     """Показывает конкретный скрипт продаж."""
-    script_type = callback.data.replace("sales_script_", "")
+    script_type = callback.data[len(_SCRIPT_PREFIX):]
     
     guest_data = CONTENT.get("guest_interaction", {})
     scripts = guest_data.get("sales_scripts", {})
@@ -903,10 +912,10 @@ async def show_fraud_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sales_fraud_"))
+@router.callback_query(F.data.startswith(_FRAUD_PREFIX))
 async def show_fraud_info(callback: CallbackQuery):
     """Показывает информацию о конкретной мошеннической схеме."""
-    fraud_type = callback.data.replace("sales_fraud_", "")
+    fraud_type = callback.data[len(_FRAUD_PREFIX):]
     
     fraud_data = CONTENT.get("fraud_prevention", {})
     
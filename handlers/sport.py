@@ -9,10 +9,12 @@ Handler для раздела "Спортивный отдел".
 - Экстренными контактами
 """
 
-import json
+import asyncio
 from pathlib import Path
+from typing import Optional
 
 from aiogram import Router, F
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import CallbackQuery, FSInputFile
 from aiogram.fsm.context import FSMContext
 
@@ -29,24 +31,333 @@ from keyboards.sport_kb import (
     get_back_to_injury
 )
 from states.menu_states import MenuStates
+from utils.json_loader import (
+    CONTENT_UNAVAILABLE_TEXT,
+    load_handler_content,
+    read_json_async,
+    render_content_entry
+)
 from utils.logger import logger
+from utils.message_parts import show_parts, split_message
 
 # Создаем router для этого модуля
 router = Router(name='sport')
 
+# Префиксы callback_data подразделов (sport_gen_<раздел> и т.д.)
+_GENERAL_PREFIX = "sport_gen_"
+_EQUIPMENT_PREFIX = "sport_equip_"
+_SAFETY_PREFIX = "sport_safety_"
+_INJURY_PREFIX = "sport_injury_"
+
 # Загружаем контент из JSON
 CONTENT_PATH = Path(__file__).parent.parent / "content" / "texts" / "sport.json"
 
-try:
-    with open(CONTENT_PATH, 'r', encoding='utf-8') as f:
-        CONTENT = json.load(f)
-    logger.info("✅ Контент sport.json загружен успешно")
-except FileNotFoundError:
-    logger.error(f"❌ Файл {CONTENT_PATH} не найден!")
-    CONTENT = {}
-except json.JSONDecodeError as e:
-    logger.error(f"❌ Ошибка парсинга JSON: {e}")
-    CONTENT = {}
+CONTENT = load_handler_content(CONTENT_PATH)
+
+VIDEOS_DIR = Path(__file__).parent.parent / "content" / "media" / "videos"
+
+# Код подраздела из callback_data -> ключ в sport.json
+_GENERAL_SECTIONS = {
+    "structure": "org_structure",
+    "appearance": "appearance",
+    "rules": "work_rules",
+    "physical": "physical_requirements",
+    "schedule": "schedule",
+    "chats": "chats"
+}
+
+_EQUIPMENT_TYPES = {
+    "trampoline": "trampoline",
+    "climbing": "climbing_wall",
+    "rope": "rope_park",
+    "games": "game_machines",
+    "labyrinth": "labyrinth"
+}
+
+_SAFETY_SECTIONS = {
+    "general": "general",
+    "prohibited": "prohibited",
+    "age": "age_restrictions",
+    "weight": "weight_limits"
+}
+
+_INJURY_TYPES = {
+    "kit": "first_aid_kit",
+    "minor": "minor_injuries",
+    "serious": "serious_injuries",
+    "cpr": "cpr",
+    "psych": "psychological_help"
+}
+
+# Списочные блоки инструкции по оборудованию в порядке вывода
+_EQUIPMENT_LIST_BLOCKS = (
+    "startup", "belay_system", "equipment", "instructor_training",
+    "rules", "instructor_actions"
+)
+
+_EQUIPMENT_MENU_TEXT = "<b>⚙️ Инструкции по оборудованию</b>\n\nВыберите аттракцион:"
+_SAFETY_MENU_TEXT = "<b>🛡️ Правила безопасности</b>\n\nВыберите раздел:"
+_INJURY_MENU_TEXT = "<b>🏥 Действия при травмах</b>\n\nВыберите раздел:"
+
+
+def _build_sport_menu_text(content: dict) -> str:
+    """Текст главного меню раздела"""
+    main_menu_text = content.get("main_menu", {})
+    return (
+        f"<b>{main_menu_text.get('title', '🟡 Спортивный отдел')}</b>\n\n"
+        f"{main_menu_text.get('description', 'Выберите интересующий раздел:')}"
+    )
+
+
+def _build_general_menu_text(content: dict) -> str:
+    """Текст меню общей информации об отделе"""
+    general_info = content.get("general_info", {})
+    return (
+        f"<b>{general_info.get('title', '📋 Общая информация')}</b>\n\n"
+        "Выберите интересующий подраздел:"
+    )
+
+
+def _build_position_text(position: dict) -> str:
+    """Карточка одной должности в оргструктуре"""
+    text = f"<b>{position.get('role')}</b>\n"
+    if 'name' in position:
+        text += f"👤 {position.get('name')}\n"
+    if 'count' in position:
+        text += f"👥 {position.get('count')}\n"
+    if 'phone' in position:
+        text += f"📱 <a href='tel:{position.get('phone')}'>{position.get('phone')}</a>\n"
+    text += f"\n📋 <b>Обязанности:</b>\n{position.get('responsibilities', '')}\n\n"
+    return text + "─────────\n\n"
+
+
+def _build_chat_text(chat: dict) -> str:
+    """Карточка одного рабочего чата"""
+    text = (
+        f"<b>{chat.get('name')}</b>\n"
+        f"🔗 {chat.get('link')}\n"
+        f"📋 <b>Назначение:</b> {chat.get('purpose')}\n\n"
+    )
+    if 'rules' in chat:
+        text += "<b>Правила:</b>\n"
+        text += "\n".join(chat.get('rules'))
+        text += "\n\n"
+    return text + "─────────\n\n"
+
+
+def _build_general_section_text(section: str, section_data: dict) -> str:
+    """Текст подраздела общей информации (structure, appearance, ...)"""
+    parts = [f"<b>{section_data.get('title', '')}</b>\n\n"]
+
+    if section == "structure":
+        parts.extend(_build_position_text(position) for position in section_data.get("positions", []))
+        parts.append(f"<b>Иерархия:</b>\n{section_data.get('hierarchy', '')}")
+
+    elif section == "appearance":
+        dress_code = section_data.get("dress_code", {})
+        parts += [
+            f"<b>{dress_code.get('title', '')}</b>\n\n",
+            "\n".join(dress_code.get("requirements", [])),
+            "\n\n<b>❌ Недопустимо:</b>\n",
+            "\n".join(dress_code.get("forbidden", [])),
+            f"\n\n{section_data.get('safety_gear', '')}",
+            f"\n\n{section_data.get('hygiene', '')}",
+        ]
+
+    elif section == "rules":
+        parts += [
+            "<b>📥 Приход на работу:</b>\n",
+            "\n".join(section_data.get("arrival", [])),
+            "\n\n<b>⚙️ Во время смены:</b>\n",
+            "\n".join(section_data.get("during_shift", [])),
+            "\n\n<b>📤 Уход с работы:</b>\n",
+            "\n".join(section_data.get("departure", [])),
+        ]
+
+    elif section == "physical":
+        parts += [
+            "<b>Требования:</b>\n",
+            "\n".join(section_data.get("requirements", [])),
+            f"\n\n{section_data.get('medical', '')}",
+        ]
+
+    elif section == "schedule":
+        parts += [
+            f"{section_data.get('description', '')}\n\n",
+            "\n".join(section_data.get("shifts", [])),
+            f"\n\n<b>🔗 Ссылка на график:</b>\n{section_data.get('link', '')}",
+        ]
+
+    elif section == "chats":
+        parts.extend(_build_chat_text(chat) for chat in section_data.get("list", []))
+
+    return "".join(parts)
+
+
+def _build_general_parts(content: dict, section: str, section_key: str) -> list[str]:
+    """Подраздел общей информации, разбитый на части"""
+    general_info = content.get("general_info", {})
+    return split_message(_build_general_section_text(section, general_info.get(section_key, {})))
+
+
+def _build_equipment_text(equip_info: dict) -> str:
+    """Текст инструкции по одному аттракциону"""
+    parts = [f"<b>{equip_info.get('title', '')}</b>\n\n"]
+    for block in _EQUIPMENT_LIST_BLOCKS:
+        if block in equip_info:
+            parts += ["\n".join(equip_info[block]), "\n\n"]
+
+    if 'rescue' in equip_info:
+        parts += ["<b>🚁 Спасение застрявшего:</b>\n", "\n".join(equip_info['rescue']), "\n\n"]
+
+    if 'emergency' in equip_info:
+        parts.append(f"{equip_info['emergency']}\n\n")
+
+    if 'common_issues' in equip_info:
+        parts += ["\n".join(equip_info['common_issues']), "\n\n"]
+
+    if 'max_weight' in equip_info:
+        parts.append(f"{equip_info['max_weight']}\n\n")
+
+    if 'lost_child' in equip_info:
+        parts.append("\n".join(equip_info['lost_child']))
+    return "".join(parts)
+
+
+def _build_equipment_parts(content: dict, equipment_type: str, equip_key: str) -> list[str]:
+    """Инструкция по одному аттракциону, разбитая на части"""
+    equipment_data = content.get("equipment", {})
+    return split_message(_build_equipment_text(equipment_data.get(equip_key, {})))
+
+
+def _build_safety_parts(content: dict, safety_type: str, safety_key: str) -> list[str]:
+    """Один раздел правил безопасности, разбитый на части"""
+    safety_data = content.get("safety_rules", {})
+    title = f"<b>{safety_data.get('title', '🛡️ Правила безопасности')}</b>\n\n"
+    return split_message(title + "\n".join(safety_data.get(safety_key, [])))
+
+
+def _build_injury_parts(content: dict, injury_type: str, injury_key: str) -> list[str]:
+    """Одна инструкция при травмах, разбитая на части"""
+    injury_data = content.get("injury_response", {})
+    title = f"<b>{injury_data.get('title', '🏥 Действия при травмах')}</b>\n\n"
+    return split_message(title + "\n".join(injury_data.get(injury_key, [])))
+
+
+def _build_contacts_text(content: dict) -> str:
+    """Текст экстренных контактов"""
+    contacts_data = content.get("emergency_contacts", {})
+    text = f"<b>{contacts_data.get('title', '📞 Экстренные контакты')}</b>\n\n"
+    return text + "\n".join(contacts_data.get("services", []))
+
+
+def _build_equipment_video(
+    content: dict, equipment_type: str, equip_key: str
+) -> Optional[tuple[FSInputFile, str]]:
+    """
+    Видео-инструкция аттракциона: (FSInputFile, подпись).
+
+    PERF: Наличие файла проверяется один раз, а не stat() на каждое нажатие.
+    Без видео или при отсутствующем файле - None.
+    """
+    equip_info = content.get("equipment", {}).get(equip_key, {})
+    video_file = equip_info.get("video_instruction")
+    if not video_file:
+        return None
+    video_path = VIDEOS_DIR / video_file
+    if not video_path.exists():
+        return None
+    return FSInputFile(video_path), f"🎬 Видео-инструкция: {equip_info.get('title')}"
+
+
+def _render_sections(render, content: dict, sections: dict, prefix: str, errors) -> dict:
+    """
+    Рендерит render(content, код, ключ в sport.json) для каждого подраздела
+    по callback_data (prefix + код).
+
+    Подразделы с некорректными данными в словарь не попадают -
+    хендлер ответит "Раздел не найден".
+    """
+    rendered = {}
+    for code, key in sections.items():
+        value = render_content_entry(
+            render, content, code, key, name=f"{prefix}{code}", errors=errors
+        )
+        if value:
+            rendered[f"{prefix}{code}"] = value
+    return rendered
+
+
+def _build_equipment_videos(content: dict, errors: Optional[list[str]] = None) -> dict:
+    """Видео-инструкции по callback_data (аттракционы без видео не попадают)"""
+    return _render_sections(_build_equipment_video, content, _EQUIPMENT_TYPES, _EQUIPMENT_PREFIX, errors)
+
+
+def _render_texts(content: dict, errors: Optional[list[str]] = None) -> tuple:
+    """
+    Рендерит все тексты раздела. Длинные тексты сразу разбиты на части
+    под лимит Telegram.
+
+    Ошибка в одной записи контента не прерывает рендеринг: текст меню
+    заменяется заглушкой, подраздел пропускается.
+    """
+    def text(render, name: str) -> str:
+        return render_content_entry(
+            render, content, name=name, default=CONTENT_UNAVAILABLE_TEXT, errors=errors
+        )
+
+    return (
+        text(_build_sport_menu_text, "main_menu"),
+        text(_build_general_menu_text, "general_info"),
+        text(_build_contacts_text, "emergency_contacts"),
+        _render_sections(_build_general_parts, content, _GENERAL_SECTIONS, _GENERAL_PREFIX, errors),
+        _render_sections(_build_equipment_parts, content, _EQUIPMENT_TYPES, _EQUIPMENT_PREFIX, errors),
+        _render_sections(_build_safety_parts, content, _SAFETY_SECTIONS, _SAFETY_PREFIX, errors),
+        _render_sections(_build_injury_parts, content, _INJURY_TYPES, _INJURY_PREFIX, errors),
+        _build_equipment_videos(content, errors),
+    )
+
+
+def check_content(content: dict) -> list[str]:
+    """Ошибки рендеринга нового контента (проверка правки из админки до записи файла)"""
+    errors: list[str] = []
+    _render_texts(content, errors)
+    return errors
+
+
+def _precompute_texts(content: dict) -> None:
+    """
+    PERF: Рендерит все тексты раздела один раз - при импорте и перезагрузке
+    sport.json. Глобальные переменные присваиваются разом после построения
+    всех текстов.
+    """
+    global _SPORT_MENU_TEXT, _GENERAL_MENU_TEXT, _CONTACTS_TEXT
+    global _GENERAL_PARTS, _EQUIPMENT_PARTS, _SAFETY_PARTS, _INJURY_PARTS
+    global _EQUIPMENT_VIDEOS, _VIDEO_FILE_IDS
+
+    (
+        _SPORT_MENU_TEXT, _GENERAL_MENU_TEXT, _CONTACTS_TEXT,
+        _GENERAL_PARTS, _EQUIPMENT_PARTS, _SAFETY_PARTS, _INJURY_PARTS,
+        _EQUIPMENT_VIDEOS
+    ) = _render_texts(content)
+    # file_id привязан к загруженному файлу - после перезагрузки сбрасываем
+    _VIDEO_FILE_IDS = {}
+
+
+_precompute_texts(CONTENT)
+
+_reload_lock = asyncio.Lock()
+
+
+async def reload_content() -> None:
+    """Перечитывает sport.json без блокировки event loop и обновляет тексты"""
+    global CONTENT
+
+    async with _reload_lock:
+        content = await read_json_async(CONTENT_PATH)
+        _precompute_texts(content)
+        CONTENT = content
+    logger.info("✅ Контент sport.json перезагружен")
 
 
 # ========== ГЛАВНОЕ МЕНЮ РАЗДЕЛА ==========
@@ -61,15 +372,9 @@ async def show_sport_menu(callback: CallbackQuery, state: FSMContext):
     # Правильное состояние: MenuStates.sport_department (определено в states/menu_states.py:85)
     await state.set_state(MenuStates.sport_department)
 
-    main_menu_text = CONTENT.get("main_menu", {})
-    text = (
-        f"<b>{main_menu_text.get('title', '🟡 Спортивный отдел')}</b>\n\n"
-        f"{main_menu_text.get('description', 'Выберите интересующий раздел:')}"
-    )
-
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_SPORT_MENU_TEXT,
             reply_markup=get_sport_menu()
         )
         await callback.answer()
@@ -85,16 +390,9 @@ async def show_sport_menu(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == "sport_general")
 async def show_sport_general_menu(callback: CallbackQuery):
     """Показывает меню общей информации об отделе."""
-    general_info = CONTENT.get("general_info", {})
-    
-    text = (
-        f"<b>{general_info.get('title', '📋 Общая информация')}</b>\n\n"
-        "Выберите интересующий подраздел:"
-    )
-    
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_GENERAL_MENU_TEXT,
             reply_markup=get_sport_general_menu()
         )
         await callback.answer()
@@ -103,101 +401,21 @@ async def show_sport_general_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sport_gen_"))
+@router.callback_query(F.data.startswith(_GENERAL_PREFIX))
 async def show_general_info(callback: CallbackQuery):
     """Показывает подразделы общей информации."""
-    section = callback.data.replace("sport_gen_", "")
-    
-    general_info = CONTENT.get("general_info", {})
-    
-    section_mapping = {
-        "structure": "org_structure",
-        "appearance": "appearance",
-        "rules": "work_rules",
-        "physical": "physical_requirements",
-        "schedule": "schedule",
-        "chats": "chats"
-    }
-    
-    section_key = section_mapping.get(section)
-    if not section_key:
+    parts = _GENERAL_PARTS.get(callback.data)
+    if not parts:
         await callback.answer("Раздел не найден", show_alert=True)
         return
-    
-    section_data = general_info.get(section_key, {})
-    text = f"<b>{section_data.get('title', '')}</b>\n\n"
-    
-    # Формирование текста в зависимости от раздела
-    if section == "structure":
-        for position in section_data.get("positions", []):
-            text += f"<b>{position.get('role')}</b>\n"
-            if 'name' in position:
-                text += f"👤 {position.get('name')}\n"
-            if 'count' in position:
-                text += f"👥 {position.get('count')}\n"
-            if 'phone' in position:
-                text += f"📱 <a href='tel:{position.get('phone')}'>{position.get('phone')}</a>\n"
-            text += f"\n📋 <b>Обязанности:</b>\n{position.get('responsibilities', '')}\n\n"
-            text += "─────────\n\n"
-        text += f"<b>Иерархия:</b>\n{section_data.get('hierarchy', '')}"
-    
-    elif section == "appearance":
-        dress_code = section_data.get("dress_code", {})
-        text += f"<b>{dress_code.get('title', '')}</b>\n\n"
-        text += "\n".join(dress_code.get("requirements", []))
-        text += "\n\n<b>❌ Недопустимо:</b>\n"
-        text += "\n".join(dress_code.get("forbidden", []))
-        text += f"\n\n{section_data.get('safety_gear', '')}"
-        text += f"\n\n{section_data.get('hygiene', '')}"
-    
-    elif section == "rules":
-        text += "<b>📥 Приход на работу:</b>\n"
-        text += "\n".join(section_data.get("arrival", []))
-        text += "\n\n<b>⚙️ Во время смены:</b>\n"
-        text += "\n".join(section_data.get("during_shift", []))
-        text += "\n\n<b>📤 Уход с работы:</b>\n"
-        text += "\n".join(section_data.get("departure", []))
-    
-    elif section == "physical":
-        text += "<b>Требования:</b>\n"
-        text += "\n".join(section_data.get("requirements", []))
-        text += f"\n\n{section_data.get('medical', '')}"
-    
-    elif section == "schedule":
-        text += f"{section_data.get('description', '')}\n\n"
-        text += "\n".join(section_data.get("shifts", []))
-        text += f"\n\n<b>🔗 Ссылка на график:</b>\n{section_data.get('link', '')}"
-    
-    elif section == "chats":
-        for chat in section_data.get("list", []):
-            text += f"<b>{chat.get('name')}</b>\n"
-            text += f"🔗 {chat.get('link')}\n"
-            text += f"📋 <b>Назначение:</b> {chat.get('purpose')}\n\n"
-            if 'rules' in chat:
-                text += "<b>Правила:</b>\n"
-                text += "\n".join(chat.get('rules'))
-                text += "\n\n"
-            text += "─────────\n\n"
-    
+
     try:
-        if len(text) > 4000:
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_back_to_sport_general()
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_back_to_sport_general(),
-                disable_web_page_preview=True
-            )
-        await callback.answer()
+        await show_parts(
+            callback,
+            parts,
+            get_back_to_sport_general(),
+            disable_web_page_preview=True
+        )
     except Exception as e:
         logger.error(f"Ошибка в show_general_info: {e}")
         await callback.answer("Ошибка загрузки")
@@ -208,11 +426,9 @@ async def show_general_info(callback: CallbackQuery):
 @router.callback_query(F.data == "sport_equipment")
 async def show_equipment_menu(callback: CallbackQuery):
     """Показывает меню инструкций по оборудованию."""
-    text = "<b>⚙️ Инструкции по оборудованию</b>\n\nВыберите аттракцион:"
-    
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_EQUIPMENT_MENU_TEXT,
             reply_markup=get_equipment_menu()
         )
         await callback.answer()
@@ -221,104 +437,39 @@ async def show_equipment_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sport_equip_"))
+@router.callback_query(F.data.startswith(_EQUIPMENT_PREFIX))
 async def show_equipment_instructions(callback: CallbackQuery):
     """Показывает инструкции по конкретному оборудованию."""
-    equipment_type = callback.data.replace("sport_equip_", "")
-    
-    equipment_data = CONTENT.get("equipment", {})
-    
-    type_mapping = {
-        "trampoline": "trampoline",
-        "climbing": "climbing_wall",
-        "rope": "rope_park",
-        "games": "game_machines",
-        "labyrinth": "labyrinth"
-    }
-    
-    equip_key = type_mapping.get(equipment_type)
-    if not equip_key:
+    parts = _EQUIPMENT_PARTS.get(callback.data)
+    if not parts:
         await callback.answer("Раздел не найден", show_alert=True)
         return
-    
-    equip_info = equipment_data.get(equip_key, {})
-    
-    text = f"<b>{equip_info.get('title', '')}</b>\n\n"
-    
+
     # Отправляем видео если есть
-    video_file = equip_info.get("video_instruction")
-    if video_file:
-        video_path = Path(__file__).parent.parent / "content" / "media" / "videos" / video_file
+    video = _EQUIPMENT_VIDEOS.get(callback.data)
+    if video:
+        video_file, caption = video
+        # PERF: после первой загрузки шлем file_id - файл не загружается повторно
+        file_id = _VIDEO_FILE_IDS.get(callback.data)
         try:
-            if video_path.exists():
-                await callback.message.answer_video(
-                    video=FSInputFile(video_path),
-                    caption=f"🎬 Видео-инструкция: {equip_info.get('title')}"
-                )
+            if file_id:
+                try:
+                    await callback.message.answer_video(video=file_id, caption=caption)
+                except TelegramBadRequest as e:
+                    # file_id больше не принимается - загружаем файл заново
+                    logger.warning(f"file_id видео {callback.data} отклонен: {e}")
+                    _VIDEO_FILE_IDS.pop(callback.data, None)
+                    file_id = None
+
+            if not file_id:
+                message = await callback.message.answer_video(video=video_file, caption=caption)
+                if message.video:
+                    _VIDEO_FILE_IDS[callback.data] = message.video.file_id
         except Exception as e:
             logger.warning(f"Не удалось отправить видео: {e}")
-    
-    # Формируем текст инструкции
-    if 'startup' in equip_info:
-        text += "\n".join(equip_info['startup'])
-        text += "\n\n"
-    
-    if 'belay_system' in equip_info:
-        text += "\n".join(equip_info['belay_system'])
-        text += "\n\n"
-    
-    if 'equipment' in equip_info:
-        text += "\n".join(equip_info['equipment'])
-        text += "\n\n"
-    
-    if 'instructor_training' in equip_info:
-        text += "\n".join(equip_info['instructor_training'])
-        text += "\n\n"
-    
-    if 'rules' in equip_info:
-        text += "\n".join(equip_info['rules'])
-        text += "\n\n"
-    
-    if 'instructor_actions' in equip_info:
-        text += "\n".join(equip_info['instructor_actions'])
-        text += "\n\n"
-    
-    if 'rescue' in equip_info:
-        text += "<b>🚁 Спасение застрявшего:</b>\n"
-        text += "\n".join(equip_info['rescue'])
-        text += "\n\n"
-    
-    if 'emergency' in equip_info:
-        text += f"{equip_info['emergency']}\n\n"
-    
-    if 'common_issues' in equip_info:
-        text += "\n".join(equip_info['common_issues'])
-        text += "\n\n"
-    
-    if 'max_weight' in equip_info:
-        text += f"{equip_info['max_weight']}\n\n"
-    
-    if 'lost_child' in equip_info:
-        text += "\n".join(equip_info['lost_child'])
-    
+
     try:
-        if len(text) > 4000:
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_back_to_equipment()
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_back_to_equipment()
-            )
-        await callback.answer()
+        await show_parts(callback, parts, get_back_to_equipment())
     except Exception as e:
         logger.error(f"Ошибка в show_equipment_instructions: {e}")
         await callback.answer("Ошибка загрузки")
@@ -329,11 +480,9 @@ async def show_equipment_instructions(callback: CallbackQuery):
 @router.callback_query(F.data == "sport_safety")
 async def show_safety_menu(callback: CallbackQuery):
     """Показывает меню правил безопасности."""
-    text = "<b>🛡️ Правила безопасности</b>\n\nВыберите раздел:"
-    
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_SAFETY_MENU_TEXT,
             reply_markup=get_safety_menu()
         )
         await callback.answer()
@@ -342,42 +491,16 @@ async def show_safety_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sport_safety_"))
+@router.callback_query(F.data.startswith(_SAFETY_PREFIX))
 async def show_safety_rules(callback: CallbackQuery):
     """Показывает правила безопасности."""
-    safety_type = callback.data.replace("sport_safety_", "")
-    
-    safety_data = CONTENT.get("safety_rules", {})
-    
-    text = f"<b>{safety_data.get('title', '🛡️ Правила безопасности')}</b>\n\n"
-    
-    if safety_type == "general":
-        text += "\n".join(safety_data.get("general", []))
-    elif safety_type == "prohibited":
-        text += "\n".join(safety_data.get("prohibited", []))
-    elif safety_type == "age":
-        text += "\n".join(safety_data.get("age_restrictions", []))
-    elif safety_type == "weight":
-        text += "\n".join(safety_data.get("weight_limits", []))
-    
+    parts = _SAFETY_PARTS.get(callback.data)
+    if not parts:
+        await callback.answer("Раздел не найден", show_alert=True)
+        return
+
     try:
-        if len(text) > 4000:
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_back_to_safety()
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_back_to_safety()
-            )
-        await callback.answer()
+        await show_parts(callback, parts, get_back_to_safety())
     except Exception as e:
         logger.error(f"Ошибка в show_safety_rules: {e}")
         await callback.answer("Ошибка загрузки")
@@ -388,11 +511,9 @@ async def show_safety_rules(callback: CallbackQuery):
 @router.callback_query(F.data == "sport_injury")
 async def show_injury_menu(callback: CallbackQuery):
     """Показывает меню действий при травмах."""
-    text = "<b>🏥 Действия при травмах</b>\n\nВыберите раздел:"
-    
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_INJURY_MENU_TEXT,
             reply_markup=get_injury_menu()
         )
         await callback.answer()
@@ -401,47 +522,16 @@ async def show_injury_menu(callback: CallbackQuery):
         await callback.answer("Ошибка загрузки меню")
 
 
-@router.callback_query(F.data.startswith("sport_injury_"))
+@router.callback_query(F.data.startswith(_INJURY_PREFIX))
 async def show_injury_instructions(callback: CallbackQuery):
     """Показывает инструкции по оказанию помощи."""
-    injury_type = callback.data.replace("sport_injury_", "")
-    
-    injury_data = CONTENT.get("injury_response", {})
-    
-    type_mapping = {
-        "kit": "first_aid_kit",
-        "minor": "minor_injuries",
-        "serious": "serious_injuries",
-        "cpr": "cpr",
-        "psych": "psychological_help"
-    }
-    
-    injury_key = type_mapping.get(injury_type)
-    if not injury_key:
+    parts = _INJURY_PARTS.get(callback.data)
+    if not parts:
         await callback.answer("Раздел не найден", show_alert=True)
         return
-    
-    text = f"<b>{injury_data.get('title', '🏥 Действия при травмах')}</b>\n\n"
-    text += "\n".join(injury_data.get(injury_key, []))
-    
+
     try:
-        if len(text) > 4000:
-            parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:
-                    await callback.message.answer(
-                        text=part,
-                        reply_markup=get_back_to_injury()
-                    )
-                else:
-                    await callback.message.answer(text=part)
-            await callback.message.delete()
-        else:
-            await callback.message.edit_text(
-                text=text,
-                reply_markup=get_back_to_injury()
-            )
-        await callback.answer()
+        await show_parts(callback, parts, get_back_to_injury())
     except Exception as e:
         logger.error(f"Ошибка в show_injury_instructions: {e}")
         await callback.answer("Ошибка загрузки")
@@ -452,14 +542,9 @@ async def show_injury_instructions(callback: CallbackQuery):
 @router.callback_query(F.data == "sport_contacts")
 async def show_emergency_contacts(callback: CallbackQuery):
     """Показывает экстренные контакты."""
-    contacts_data = CONTENT.get("emergency_contacts", {})
-    
-    text = f"<b>{contacts_data.get('title', '📞 Экстренные контакты')}</b>\n\n"
-    text += "\n".join(contacts_data.get("services", []))
-    
     try:
         await callback.message.edit_text(
-            text=text,
+            text=_CONTACTS_TEXT,
             reply_markup=get_back_to_sport(),
             disable_web_page_preview=True
         )
@@ -7,6 +7,9 @@
 - Статистики
 - Управления пользователями
 - Рассылки сообщений
+
+Фабрики без аргументов должны оставаться чистыми: handlers.admin
+строит такие клавиатуры один раз при импорте и переиспользует их.
 """
 
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
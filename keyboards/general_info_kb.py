@@ -5,8 +5,13 @@
 - Главного меню раздела
 - Выбора парков (адреса, телефоны)
 - Подразделов (внештатные ситуации, зарплата, приказы, скидки)
+
+PERF: Клавиатура парка кэшируется по коду парка (парков всего несколько).
+Статические клавиатуры один раз собирает handlers/general_info.py.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
@@ -263,6 +268,7 @@ def get_back_to_general_info() -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=8)
 def get_park_address_detail_keyboard(park_code: str) -> InlineKeyboardMarkup:
     """
     Клавиатура для детального просмотра адреса парка с навигацией.
@@ -0,0 +1,108 @@
+"""
+Callback Dedup Middleware - схлопывает повторные нажатия одной кнопки
+
+PERF: Пока callback с теми же данными на том же сообщении еще обрабатывается,
+а также в течение короткого окна после обработки, повторные нажатия
+(двойной клик, "долбежка" по кнопке) не запускают handler заново - они лишь
+отвечают на callback, чтобы снять "часики" в клиенте. Так одно нажатие дает
+один edit_text вместо нескольких одинаковых, которые расходуют лимиты
+Telegram и возвращают 429 или "message is not modified".
+
+В отличие от throttling, задержек и блокировок нет: разные кнопки проходят
+как обычно. Middleware регистрируется снаружи ErrorHandlingMiddleware, поэтому
+нажатие с ошибкой в handler тоже считается обработанным и окно действует.
+Ключ освобождается без окна, только если исключение дошло до этого middleware
+(таймаут, ошибка в Auth или InputSanitizer до ErrorHandlingMiddleware).
+
+Usage:
+    from middlewares.callback_dedup import CallbackDedupMiddleware
+
+    dp.callback_query.middleware(CallbackDedupMiddleware(window=0.5))
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, TelegramObject
+
+from utils.logger import logger
+
+
+CallbackKey = Tuple[int, int, str]
+
+
+class CallbackDedupMiddleware(BaseMiddleware):
+    """
+    Пропускает в handler только первый из одинаковых callback'ов.
+
+    Ключ - (chat_id, message_id, callback.data). Event loop однопоточный,
+    поэтому блокировки не нужны. Недавно обработанные ключи хранятся с
+    временем истечения в ограниченном словаре (max_size).
+    """
+
+    def __init__(self, window: float = 0.5, max_size: int = 10_000):
+        """
+        Args:
+            window: Сколько секунд после обработки считать нажатие дублем
+            max_size: Максимум недавно обработанных ключей в памяти
+        """
+        super().__init__()
+        self.window = window
+        self.max_size = max_size
+        self._in_flight: Set[CallbackKey] = set()
+        self._recent: Dict[CallbackKey, float] = {}
+        self.stats = {"dropped": 0}
+
+    def _is_duplicate(self, key: CallbackKey, now: float) -> bool:
+        if key in self._in_flight:
+            return True
+        expires_at = self._recent.get(key)
+        if expires_at is None:
+            return False
+        if expires_at > now:
+            return True
+        del self._recent[key]
+        return False
+
+    def _remember(self, key: CallbackKey, now: float) -> None:
+        # Перевставка переносит ключ в конец - порядок словаря = порядок истечения
+        self._recent.pop(key, None)
+        self._recent[key] = now + self.window
+
+        if len(self._recent) > self.max_size:
+            # Сначала выбрасываем истекшие ключи, затем самые старые
+            for old_key, expires_at in list(self._recent.items()):
+                if expires_at > now and len(self._recent) <= self.max_size:
+                    break
+                del self._recent[old_key]
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        if not isinstance(event, CallbackQuery) or event.message is None:
+            return await handler(event, data)
+
+        key = (event.message.chat.id, event.message.message_id, event.data)
+        if self._is_duplicate(key, time.monotonic()):
+            self.stats["dropped"] += 1
+            logger.debug("Повторный callback {} отброшен", event.data)
+            try:
+                await event.answer()
+            except Exception as e:
+                # Ответ на дубль не критичен - первый callback ответит сам
+                logger.debug("Не удалось ответить на повторный callback: {}", e)
+            return None
+
+        self._in_flight.add(key)
+        try:
+            result = await handler(event, data)
+        finally:
+            self._in_flight.discard(key)
+
+        if self.window > 0:
+            self._remember(key, time.monotonic())
+        return result
@@ -76,28 +76,30 @@ class ErrorHandlingMiddleware(BaseMiddleware):
 
         except TelegramBadRequest as e:
             # Некорректный запрос к API
-            logger.error(f"❌ Telegram Bad Request: {e}")
-
-            # Специальная обработка для распространенных ошибок
             error_text = str(e).lower()
 
+            # Специальная обработка для распространенных ошибок - до logger.error,
+            # чтобы штатные ситуации не засоряли лог ошибок
             if "message is not modified" in error_text:
-                # Попытка отредактировать сообщение тем же текстом - игнорируем
+                # Повторное нажатие той же кнопки - текст не изменился, это не ошибка.
+                # Закрываем "часики" на кнопке, иначе клиент ждет ответа до таймаута
                 logger.debug("Попытка редактирования без изменений - игнорируется")
+                await self._answer_callback(event)
                 return None
 
             elif "message to edit not found" in error_text:
                 # Сообщение для редактирования не найдено
-                logger.warning("Сообщение для редактирования не найдено")
+                logger.warning(f"Сообщение для редактирования не найдено: {e}")
                 return None
 
             elif "message can't be deleted" in error_text:
                 # Нельзя удалить сообщение
-                logger.warning("Невозможно удалить сообщение")
+                logger.warning(f"Невозможно удалить сообщение: {e}")
                 return None
 
             else:
                 # Другие Bad Request ошибки
+                logger.error(f"❌ Telegram Bad Request: {e}")
                 await self._send_error_message(
                     event,
                     "❌ Произошла ошибка при обработке запроса. Попробуйте еще раз."
@@ -180,6 +182,15 @@ class ErrorHandlingMiddleware(BaseMiddleware):
 
             return None
 
+    async def _answer_callback(self, event: TelegramObject) -> None:
+        """Молча отвечает на callback (если хендлер не успел ответить сам)"""
+        if isinstance(event, CallbackQuery):
+            try:
+                await event.answer()
+            except TelegramBadRequest:
+                # Уже отвечен или устарел
+                pass
+
     async def _send_error_message(
         self,
         event: TelegramObject,
@@ -44,6 +44,26 @@ CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_username
 ON users (username)
 WHERE username IS NOT NULL;
 
+-- Admin user search: case-insensitive username and name substring
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_lower
+ON users (lower(username));
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_first_name_trgm
+ON users USING gin (first_name gin_trgm_ops);
+
+-- Broadcast recipients: telegram_id of non-blocked users (index-only scan)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_broadcast_recipients
+ON users (telegram_id)
+WHERE is_blocked = false;
+
+-- Admin lists "Active today" / "New users" (range scan instead of full fetch)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_last_activity
+ON users (last_activity DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_registration_date
+ON users (registration_date DESC);
+
 -- Position-based queries
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_position
 ON users (position, department);
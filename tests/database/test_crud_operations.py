@@ -178,6 +178,29 @@ class TestUserCRUDCore:
         # Verify None returned
         assert user is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_search_user(self, test_session):
+        """Test single-query search by telegram_id, username and first name"""
+        await UserCRUD.get_or_create_user(test_session, telegram_id=111, username="Alice", first_name="Алиса")
+        await UserCRUD.get_or_create_user(test_session, telegram_id=222, username="bob", first_name="Иван")
+
+        assert (await UserCRUD.search_user(test_session, "222")).telegram_id == 222
+        assert (await UserCRUD.search_user(test_session, "@alice")).telegram_id == 111
+        assert (await UserCRUD.search_user(test_session, "иван")).telegram_id == 222
+        assert await UserCRUD.search_user(test_session, "nobody") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_search_user_wildcards_literal(self, test_session):
+        """Test "%" and "_" in the query match literally, ties resolve by id"""
+        await UserCRUD.get_or_create_user(test_session, telegram_id=111, first_name="Johnxdoe")
+        await UserCRUD.get_or_create_user(test_session, telegram_id=222, first_name="John_doe")
+        await UserCRUD.get_or_create_user(test_session, telegram_id=333, first_name="John_doe")
+
+        assert (await UserCRUD.search_user(test_session, "john_doe")).telegram_id == 222
+        assert await UserCRUD.search_user(test_session, "%") is None
+
     @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_block_user_success(self, test_session):
@@ -0,0 +1,42 @@
+"""
+Tests for DatabaseManager connection pool reporting (ARCH-003).
+
+Tests:
+- NullPool (SQLite) reports no pool stats
+- QueuePool reports size / checked out connections
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from database.database import DatabaseManager
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_sqlite_null_pool():
+    """SQLite uses NullPool, so there are no pool stats to report"""
+    manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    await manager.init()
+    try:
+        assert manager.get_pool_stats() == {}
+    finally:
+        await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_queue_pool():
+    """Pooled engines report checked out connections from the shared pool"""
+    manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    manager.engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5
+    )
+    try:
+        async with manager.engine.connect():
+            stats = manager.get_pool_stats()
+            assert stats["size"] == 5
+            assert stats["checked_out"] == 1
+    finally:
+        await manager.close()
@@ -0,0 +1,87 @@
+"""
+Tests for admin broadcast sending.
+
+Tests:
+- Batched concurrent delivery with success/failure counting
+- Flood control retry (TelegramRetryAfter)
+- Mutually exclusive send/target callback filters
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+from aiogram.types import CallbackQuery, User
+
+import handlers.admin as admin
+
+
+@pytest.fixture(autouse=True)
+def fast_batches(monkeypatch):
+    """Disable per-batch pacing to keep tests fast"""
+    monkeypatch.setattr(admin, "BROADCAST_BATCH_INTERVAL", 0)
+
+
+@pytest.mark.asyncio
+async def test_send_broadcast_counts_results():
+    """All recipients are sent to; failures are counted, not raised"""
+    bot = AsyncMock()
+
+    async def send_message(chat_id, text, **kwargs):
+        if chat_id % 10 == 0:
+            raise RuntimeError("chat not found")
+
+    bot.send_message.side_effect = send_message
+    chat_ids = list(range(1, 71))
+
+    success, failed = await admin._send_broadcast(bot, chat_ids, "hello")
+
+    assert bot.send_message.await_count == 70
+    assert (success, failed) == (63, 7)
+    sent = bot.send_message.await_args.kwargs
+    assert sent["disable_notification"] is admin.BROADCAST_SILENT
+    assert sent["link_preview_options"].is_disabled is True
+
+
+@pytest.mark.asyncio
+async def test_send_broadcast_retries_after_flood_control():
+    """TelegramRetryAfter is retried once after the requested delay"""
+    bot = AsyncMock()
+    bot.send_message.side_effect = [
+        TelegramRetryAfter(
+            method=SendMessage(chat_id=1, text="hello"),
+            message="Flood control exceeded",
+            retry_after=0
+        ),
+        None
+    ]
+
+    success, failed = await admin._send_broadcast(bot, [1], "hello")
+
+    assert (success, failed) == (1, 0)
+    assert bot.send_message.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data, expected", [
+    ("broadcast_send_all", "send_broadcast"),
+    ("broadcast_all", "process_broadcast_target"),
+    ("broadcast_history", "process_broadcast_target"),
+])
+async def test_broadcast_callbacks_do_not_overlap(data, expected):
+    """Exactly one broadcast handler matches, regardless of registration order"""
+    callback = CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="Admin"),
+        chat_instance="1",
+        data=data
+    )
+    matched = [
+        handler.callback.__name__
+        for handler in admin.router.callback_query.handlers
+        if handler.callback.__name__ in ("send_broadcast", "process_broadcast_target")
+        and (await handler.check(callback))[0]
+    ]
+
+    assert matched == [expected]
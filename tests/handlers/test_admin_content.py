@@ -0,0 +1,74 @@
+"""
+Tests for content editing from the admin panel.
+
+Tests:
+- An edit the section cannot render is rejected before the file is written
+- A failed reload is reported instead of a success message
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import handlers.admin as admin
+
+
+@pytest.fixture
+def content_file(monkeypatch, tmp_path):
+    """sport.json in a temporary content/texts directory"""
+    monkeypatch.chdir(tmp_path)
+    texts_dir = tmp_path / "content" / "texts"
+    texts_dir.mkdir(parents=True)
+    path = texts_dir / "sport.json"
+    path.write_text(json.dumps({"general_info": {}}), encoding="utf-8")
+    return path
+
+
+def _edit(value: str):
+    message = MagicMock()
+    message.text = value
+    message.from_user.id = 1
+    message.answer = AsyncMock()
+    state = MagicMock()
+    state.get_data = AsyncMock(return_value={
+        "editing_key": "general_info",
+        "editing_section": "sport",
+        "current_file": "sport.json",
+        "content_data": {"general_info": {}},
+    })
+    state.set_state = AsyncMock()
+    return message, state
+
+
+@pytest.mark.asyncio
+async def test_unrenderable_edit_rejected(content_file, monkeypatch):
+    """The file stays untouched and the admin can send the value again"""
+    reload = AsyncMock()
+    monkeypatch.setitem(admin._CONTENT_RELOADERS, "sport", reload)
+    message, state = _edit('"строка"')
+
+    await admin.handle_new_content(message, state)
+
+    assert json.loads(content_file.read_text(encoding="utf-8")) == {"general_info": {}}
+    assert not (content_file.parent / "sport.json.backup").exists()
+    reload.assert_not_awaited()
+    state.set_state.assert_not_awaited()
+    assert "НЕ сохранены" in message.answer.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_reload_failure_reported(content_file, monkeypatch):
+    """A saved edit that failed to reload is not reported as applied"""
+    monkeypatch.setitem(
+        admin._CONTENT_RELOADERS, "sport", AsyncMock(side_effect=OSError("disk"))
+    )
+    message, state = _edit('{"structure": {"title": "Новое"}}')
+
+    await admin.handle_new_content(message, state)
+
+    saved = json.loads(content_file.read_text(encoding="utf-8"))
+    assert saved["general_info"]["structure"]["title"] == "Новое"
+    text = message.answer.await_args.kwargs["text"]
+    assert "перезагрузить раздел не удалось" in text
+    assert "уже действуют" not in text
@@ -0,0 +1,56 @@
+"""
+Tests for paginated admin user lists (blocked / active / new).
+
+Tests:
+- Page number parsing from callback data
+- COUNT(*) first, rows only for non-empty lists
+- Stale pages past the end are clamped to the last page
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from handlers.admin import LIST_PAGE_SIZE, _fetch_list_page, _parse_list_page
+
+
+def test_parse_list_page():
+    """Plain callback opens the first page, *_page_N opens page N"""
+    assert _parse_list_page("users_blocked") == 1
+    assert _parse_list_page("users_blocked_page_3") == 3
+    assert _parse_list_page("users_new_page_0") == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_list_page_empty_skips_rows():
+    """An empty COUNT(*) short-circuits without loading rows"""
+    fetch = AsyncMock()
+    count = AsyncMock(return_value=0)
+
+    rows, total, page = await _fetch_list_page(fetch, count, 1)
+
+    fetch.assert_not_awaited()
+    assert (rows, total, page) == ([], 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_list_page_offset():
+    """Page N is fetched at offset (N - 1) * LIST_PAGE_SIZE"""
+    fetch = AsyncMock(return_value=[{"telegram_id": i} for i in range(LIST_PAGE_SIZE)])
+    count = AsyncMock(return_value=120)
+
+    rows, total, page = await _fetch_list_page(fetch, count, 2)
+
+    fetch.assert_awaited_once_with(LIST_PAGE_SIZE)
+    assert (len(rows), total, page) == (LIST_PAGE_SIZE, 120, 2)
+
+
+@pytest.mark.asyncio
+async def test_fetch_list_page_clamped_to_last_page():
+    """A stale page past the end shows the last page instead of an empty list"""
+    fetch = AsyncMock(return_value=[{"telegram_id": 1}])
+    count = AsyncMock(return_value=LIST_PAGE_SIZE + 1)
+
+    rows, total, page = await _fetch_list_page(fetch, count, 5)
+
+    fetch.assert_awaited_once_with(LIST_PAGE_SIZE)
+    assert page == 2
@@ -0,0 +1,53 @@
+"""
+Tests for pre-rendered bar section texts.
+
+Tests:
+- One rendered text per drinks category code
+- Category missing from JSON is reported without rendering
+- A malformed category is skipped instead of failing the import
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import handlers.bar as bar
+
+
+def test_drinks_texts_per_category():
+    """Every known category from bar_menu.json is indexed and rendered once at import"""
+    categories = {
+        cat["name"]: cat for cat in bar.CONTENT["drinks"]["categories"]
+    }
+
+    assert bar._DRINKS_INDEX.keys() == bar._DRINK_CATEGORY_NAMES.keys()
+    for code, name in bar._DRINK_CATEGORY_NAMES.items():
+        assert bar._DRINKS_INDEX[code] is categories[name]
+        text = bar._DRINKS_TEXTS[f"bar_drinks_{code}"]
+        assert text.startswith(f"<b>{name}</b>")
+        for item in categories[name]["items"]:
+            assert f"<b>{item['name']}</b> — {item['price']}" in text
+
+
+def test_drinks_texts_skip_malformed_category():
+    """A category with a broken item is left out, the others still render"""
+    texts = bar._build_drinks_texts({
+        "hot": {"name": "☕ Горячие напитки", "items": [{"name": "Чай"}]},
+        "cold": {"name": "🧊 Холодные напитки", "items": []},
+    })
+
+    assert list(texts) == ["bar_drinks_cold"]
+
+
+@pytest.mark.asyncio
+async def test_show_drinks_by_category_missing(monkeypatch):
+    """A category button without JSON content answers with an alert"""
+    monkeypatch.setattr(bar, "_DRINKS_TEXTS", {})
+    callback = MagicMock()
+    callback.data = "bar_drinks_hot"
+    callback.answer = AsyncMock()
+    callback.message.edit_text = AsyncMock()
+
+    await bar.show_drinks_by_category(callback)
+
+    callback.message.edit_text.assert_not_awaited()
+    callback.answer.assert_awaited_once_with("Категория не найдена", show_alert=True)
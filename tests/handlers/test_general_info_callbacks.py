@@ -0,0 +1,240 @@
+"""
+Tests for general info callback routing.
+
+Tests:
+- Every per-park / per-item button is matched by exactly one handler
+- Pre-rendered park cards, pre-chunked emergency instructions
+- Order documents from the startup scan, Telegram file_id reuse
+- Hot reload of the JSON content
+- Malformed content entries are skipped instead of failing the import
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, FSInputFile, User
+
+import handlers.general_info as general_info
+from keyboards.general_info_kb import (
+    get_discounts_parks_menu,
+    get_emergency_menu,
+    get_orders_menu,
+    get_park_address_detail_keyboard,
+    get_parks_addresses_menu,
+    get_parks_phones_menu,
+)
+from utils.message_parts import MESSAGE_CHUNK_SIZE
+
+
+def _callback(data: str) -> CallbackQuery:
+    return CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="User"),
+        chat_instance="1",
+        data=data
+    )
+
+
+def _button_data(*keyboards):
+    return [
+        button.callback_data
+        for keyboard in keyboards
+        for row in keyboard.inline_keyboard
+        for button in row
+    ]
+
+
+ITEM_CALLBACKS = [
+    data
+    for data in _button_data(
+        get_parks_addresses_menu(),
+        get_parks_phones_menu(),
+        get_emergency_menu(),
+        get_orders_menu(),
+        get_discounts_parks_menu(),
+        get_park_address_detail_keyboard("zeleno"),
+    )
+    if data.split("_")[0] in ("addr", "phone", "emergency", "order", "discount", "nav")
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data", ITEM_CALLBACKS)
+async def test_item_callbacks_match_one_handler(data):
+    """Exact-match filters cover every button emitted by the keyboards"""
+    callback = _callback(data)
+    matched = [
+        handler.callback.__name__
+        for handler in general_info.router.callback_query.handlers
+        if (await handler.check(callback))[0]
+    ]
+
+    assert len(matched) == 1
+
+
+def test_emergency_parts_prerendered():
+    """Every situation from general_info.json is rendered and chunked once at import"""
+    situations = general_info.CONTENT["emergency_situations"]
+
+    for situation_type in general_info._EMERGENCY_TYPES:
+        title = situations[situation_type]["title"]
+        parts = general_info._EMERGENCY_PARTS[situation_type]
+        assert parts[0].startswith(f"<b>{title}</b>")
+        assert all(len(part) <= MESSAGE_CHUNK_SIZE for part in parts)
+
+
+@pytest.fixture
+def order_file(monkeypatch, tmp_path):
+    """One scanned order PDF, file_id storage patched out"""
+    document = FSInputFile(tmp_path / "order_001.pdf")
+    monkeypatch.setattr(general_info, "_ORDER_FILES", {"001": (document, "order_001:1:1")})
+    monkeypatch.setattr(general_info, "_ORDER_FILE_IDS", {})
+    monkeypatch.setattr(general_info, "get_media_file_id", AsyncMock(return_value=None))
+    monkeypatch.setattr(general_info, "set_media_file_id", AsyncMock())
+    return document
+
+
+def _order_callback(data: str) -> MagicMock:
+    callback = MagicMock()
+    callback.data = data
+    callback.answer = AsyncMock()
+    callback.message.answer_document = AsyncMock(
+        return_value=MagicMock(document=MagicMock(file_id="FILE_ID"))
+    )
+    return callback
+
+
+@pytest.mark.asyncio
+async def test_send_order_document_missing_file(order_file):
+    """Orders without a scanned PDF answer with an alert"""
+    callback = _order_callback("order_002")
+
+    await general_info.send_order_document(callback)
+
+    callback.message.answer_document.assert_not_awaited()
+    assert callback.answer.await_args.kwargs["show_alert"] is True
+
+
+@pytest.mark.asyncio
+async def test_send_order_document_reuses_file_id(order_file):
+    """The first send uploads the PDF, later sends pass the stored file_id"""
+    callback = _order_callback("order_001")
+
+    await general_info.send_order_document(callback)
+    await general_info.send_order_document(callback)
+
+    sent = [call.kwargs["document"] for call in callback.message.answer_document.await_args_list]
+    assert sent == [order_file, "FILE_ID"]
+    general_info.set_media_file_id.assert_awaited_once()
+    assert general_info.set_media_file_id.await_args.kwargs["media_file_id"] == "FILE_ID"
+
+
+@pytest.mark.asyncio
+async def test_send_order_document_rejected_file_id(order_file):
+    """A file_id rejected by Telegram is dropped and the PDF is uploaded again"""
+    general_info.get_media_file_id.return_value = "STALE"
+    callback = _order_callback("order_001")
+    callback.message.answer_document.side_effect = [
+        TelegramBadRequest(method=MagicMock(), message="wrong file identifier"),
+        MagicMock(document=MagicMock(file_id="FILE_ID")),
+    ]
+
+    await general_info.send_order_document(callback)
+
+    sent = [call.kwargs["document"] for call in callback.message.answer_document.await_args_list]
+    assert sent == ["STALE", order_file]
+    assert general_info._ORDER_FILE_IDS == {"001": "FILE_ID"}
+
+
+@pytest.mark.asyncio
+async def test_send_order_document_replaced_file(monkeypatch, tmp_path):
+    """A PDF replaced on disk is uploaded again after the next scan"""
+    stored = {}
+
+    async def get_media_file_id(key):
+        return stored.get(key)
+
+    async def set_media_file_id(key, media_file_id, **kwargs):
+        stored[key] = media_file_id
+
+    monkeypatch.setattr(general_info, "get_media_file_id", get_media_file_id)
+    monkeypatch.setattr(general_info, "set_media_file_id", set_media_file_id)
+    path = tmp_path / "order_001.pdf"
+    callback = _order_callback("order_001")
+
+    path.write_bytes(b"%PDF old")
+    monkeypatch.setattr(general_info, "_ORDER_FILES", general_info._scan_order_files(tmp_path))
+    monkeypatch.setattr(general_info, "_ORDER_FILE_IDS", {})
+    await general_info.send_order_document(callback)
+    await general_info.send_order_document(callback)
+
+    # Replace the file and "restart": rescan, empty in-memory cache
+    path.write_bytes(b"%PDF new version")
+    monkeypatch.setattr(general_info, "_ORDER_FILES", general_info._scan_order_files(tmp_path))
+    monkeypatch.setattr(general_info, "_ORDER_FILE_IDS", {})
+    await general_info.send_order_document(callback)
+
+    sent = [call.kwargs["document"] for call in callback.message.answer_document.await_args_list]
+    assert sent[1] == "FILE_ID"
+    assert isinstance(sent[0], FSInputFile) and isinstance(sent[2], FSInputFile)
+    assert len(stored) == 2
+
+
+@pytest.mark.asyncio
+async def test_reload_content_swaps_texts(monkeypatch, tmp_path):
+    """reload_content re-reads the JSON and re-renders the cached texts"""
+    original = general_info.CONTENT
+    path = tmp_path / "general_info.json"
+    path.write_text('{"salary_info": {"title": "Новая зарплата"}}', encoding="utf-8")
+    monkeypatch.setattr(general_info, "CONTENT_PATH", path)
+
+    try:
+        await general_info.reload_content()
+
+        assert general_info.CONTENT == {"salary_info": {"title": "Новая зарплата"}}
+        assert general_info._SALARY_TEXT.startswith("<b>Новая зарплата</b>")
+        assert general_info._EMERGENCY_PARTS == {}
+    finally:
+        general_info._precompute_texts(original)
+        general_info.CONTENT = original
+
+
+@pytest.mark.parametrize("content, broken", [
+    ({"addresses": "строка"}, "addresses.zeleno"),
+    ({"salary_info": {"delays": "x"}}, "salary_info"),
+])
+def test_render_texts_malformed_content(content, broken):
+    """Broken entries are reported and left out, the rest still renders"""
+    errors = []
+    texts = general_info._render_texts(content, errors)
+    main_menu, _, salary, *_, addresses, _, _ = texts
+
+    assert any(error.startswith(broken) for error in errors)
+    assert main_menu.startswith("<b>🟢 Общая информация</b>")
+    assert addresses == {}
+    if broken == "salary_info":
+        assert salary == general_info.CONTENT_UNAVAILABLE_TEXT
+
+
+def test_park_texts_prerendered():
+    """Address, phone and navigation texts are rendered once per park code"""
+    for park_code in general_info._PARK_CODES:
+        address = general_info.CONTENT["addresses"][park_code]
+        phones = general_info.CONTENT["phones"][park_code]
+
+        assert general_info._ADDRESS_TEXTS[park_code].startswith(f"<b>🏢 {address['name']}</b>")
+        assert f"tel:{phones['admin']['phone']}" in general_info._PHONE_TEXTS[park_code]
+
+        if "indoor_navigation" in address:
+            parts = general_info._NAVIGATION_PARTS[park_code]
+            assert f"<b>🏢 Парк:</b> {address['name']}" in parts[0]
+
+
+def test_park_keyboard_cached_per_park():
+    """The park keyboard is built once per park code and reused"""
+    zeleno = get_park_address_detail_keyboard("zeleno")
+
+    assert get_park_address_detail_keyboard("zeleno") is zeleno
+    assert get_park_address_detail_keyboard("kashir") is not zeleno
+    assert zeleno.inline_keyboard[0][0].callback_data == "nav_zeleno"
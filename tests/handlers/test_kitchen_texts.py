@@ -0,0 +1,67 @@
+"""
+Tests for pre-rendered kitchen section texts.
+
+Tests:
+- One rendered text per menu category code
+- Category missing from JSON is reported without rendering
+- Malformed category is skipped, dishes without optional fields render
+- Section buttons map to static screens
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import handlers.kitchen as kitchen
+
+
+def test_category_texts_per_code():
+    """Every category from kitchen_menu.json is rendered once at import"""
+    categories = {
+        cat["name"]: cat for cat in kitchen.CONTENT["menu"]["categories"]
+    }
+
+    assert kitchen._CATEGORY_TEXTS.keys() == kitchen._CATEGORY_CALLBACKS
+    for code, name in kitchen._CATEGORY_NAMES.items():
+        text = kitchen._CATEGORY_TEXTS[f"kitchen_cat_{code}"]
+        assert text.startswith(f"<b>{name}</b>")
+        for item in categories[name]["items"]:
+            assert f"<b>{item['name']}</b> — {item['price']}" in text
+
+
+def test_category_texts_skip_malformed_category():
+    """A broken category is left out; a dish missing price/weight still renders"""
+    texts = kitchen._build_category_texts({
+        "🍕 Пицца": {"items": [{"name": "Маргарита"}]},
+        "🍰 Десерты": {"items": "строка"},
+    })
+
+    assert list(texts) == ["kitchen_cat_pizza"]
+    assert "<b>Маргарита</b>" in texts["kitchen_cat_pizza"]
+
+
+@pytest.mark.asyncio
+async def test_show_menu_by_category_unknown(monkeypatch):
+    """A category button without JSON content answers with an alert"""
+    monkeypatch.setattr(kitchen, "_CATEGORY_TEXTS", {})
+    callback = MagicMock()
+    callback.data = "kitchen_cat_pizza"
+    callback.answer = AsyncMock()
+    callback.message.edit_text = AsyncMock()
+
+    await kitchen.show_menu_by_category(callback)
+
+    callback.message.edit_text.assert_not_awaited()
+    callback.answer.assert_awaited_once_with("Категория не найдена", show_alert=True)
+
+
+def test_kitchen_menu_buttons_have_screens():
+    """Every section button of the kitchen menu maps to a pre-rendered screen"""
+    buttons = [
+        button.callback_data
+        for row in kitchen.get_kitchen_menu().inline_keyboard
+        for button in row
+        if button.callback_data != "back_to_main"
+    ]
+
+    assert set(buttons) == kitchen._SECTION_SCREENS.keys()
+    assert all(text for text, _ in kitchen._SECTION_SCREENS.values())
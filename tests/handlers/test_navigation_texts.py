@@ -0,0 +1,53 @@
+"""
+Tests for pre-rendered park navigation texts.
+
+Tests:
+- One rendered text per park with a menu button
+- main_menu and unknown keys are never rendered as parks
+- Malformed park is skipped, zones without optional fields render
+- Menu buttons resolve to park codes by exact match
+"""
+
+import handlers.navigation as navigation
+
+
+def test_park_texts_per_code():
+    """Each park from navigation.json is rendered once with its zones"""
+    assert set(navigation._PARK_TEXTS) == set(navigation._PARK_CODES)
+
+    for park_code, text in navigation._PARK_TEXTS.items():
+        park_info = navigation.CONTENT[park_code]
+        assert text.startswith(f"<b>🗺️ {park_info['name']}</b>")
+        for zone in park_info["zones"]:
+            assert f"<b>{zone['name']}</b>" in text
+
+
+def test_non_park_keys_not_rendered():
+    """The main_menu block of navigation.json is not a park"""
+    texts = navigation._build_park_texts({"main_menu": {"title": "x"}})
+
+    assert texts == {}
+
+
+def test_park_texts_skip_malformed_park():
+    """A broken park is left out; a zone missing landmarks still renders"""
+    texts = navigation._build_park_texts({
+        "kashirskaya": {"name": "Каширская", "zones": [{"name": "Батуты"}]},
+        "columbus": {"name": "Коламбус", "zones": "строка"},
+    })
+
+    assert list(texts) == ["kashirskaya"]
+    assert "<b>Батуты</b>" in texts["kashirskaya"]
+
+
+def test_menu_buttons_match_park_filter():
+    """Every park button of the navigation menu passes the exact-match filter"""
+    buttons = [
+        button.callback_data
+        for row in navigation.get_navigation_menu().inline_keyboard
+        for button in row
+        if button.callback_data != "back_to_main"
+    ]
+
+    assert buttons
+    assert all(navigation._PARK_CALLBACKS[data] in navigation._PARK_TEXTS for data in buttons)
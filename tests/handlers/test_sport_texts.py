@@ -0,0 +1,141 @@
+"""
+Tests for pre-rendered sport section texts.
+
+Tests:
+- Every section button has pre-rendered parts within Telegram limit
+- Reloaded content replaces the rendered texts
+- Equipment videos are resolved once and re-sent by file_id
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramBadRequest
+
+import handlers.sport as sport
+from utils.message_parts import MESSAGE_CHUNK_SIZE
+
+
+def _buttons(markup):
+    return [
+        button.callback_data
+        for row in markup.inline_keyboard
+        for button in row
+        if button.callback_data not in ("sport", "main_menu")
+    ]
+
+
+@pytest.mark.parametrize("markup, parts_name", [
+    (sport.get_sport_general_menu(), "_GENERAL_PARTS"),
+    (sport.get_equipment_menu(), "_EQUIPMENT_PARTS"),
+    (sport.get_safety_menu(), "_SAFETY_PARTS"),
+    (sport.get_injury_menu(), "_INJURY_PARTS"),
+])
+def test_section_buttons_have_parts(markup, parts_name):
+    """Every section button maps to non-empty parts under the chunk size"""
+    rendered = getattr(sport, parts_name)
+
+    for callback_data in _buttons(markup):
+        parts = rendered[callback_data]
+        assert parts
+        assert all(len(part) <= MESSAGE_CHUNK_SIZE for part in parts)
+
+
+def test_precompute_texts_on_reload(monkeypatch):
+    """_precompute_texts swaps all rendered texts for the new content"""
+    for name in (
+        "_SPORT_MENU_TEXT", "_GENERAL_MENU_TEXT", "_CONTACTS_TEXT",
+        "_GENERAL_PARTS", "_EQUIPMENT_PARTS", "_SAFETY_PARTS", "_INJURY_PARTS",
+        "_EQUIPMENT_VIDEOS", "_VIDEO_FILE_IDS",
+    ):
+        monkeypatch.setattr(sport, name, getattr(sport, name))
+
+    old_equipment = sport._EQUIPMENT_PARTS
+
+    sport._precompute_texts({
+        "main_menu": {"title": "Спорт", "description": "Новое описание"},
+    })
+
+    assert "Новое описание" in sport._SPORT_MENU_TEXT
+    assert sport._EQUIPMENT_PARTS is not old_equipment
+    assert sport._EQUIPMENT_PARTS.keys() == old_equipment.keys()
+
+
+@pytest.mark.asyncio
+async def test_malformed_section_skipped(monkeypatch):
+    """A broken general_info section is left out instead of failing the reload"""
+    for name in (
+        "_SPORT_MENU_TEXT", "_GENERAL_MENU_TEXT", "_CONTACTS_TEXT",
+        "_GENERAL_PARTS", "_EQUIPMENT_PARTS", "_SAFETY_PARTS", "_INJURY_PARTS",
+        "_EQUIPMENT_VIDEOS", "_VIDEO_FILE_IDS",
+    ):
+        monkeypatch.setattr(sport, name, getattr(sport, name))
+
+    content = {**sport.CONTENT, "general_info": "строка"}
+    assert sport.check_content(content)
+
+    sport._precompute_texts(content)
+
+    assert sport._GENERAL_PARTS == {}
+    assert sport._SAFETY_PARTS.keys() == sport._render_texts(sport.CONTENT)[5].keys()
+
+    callback = _equipment_callback()
+    callback.data = "sport_gen_rules"
+    await sport.show_general_info(callback)
+    callback.answer.assert_awaited_once_with("Раздел не найден", show_alert=True)
+
+
+@pytest.fixture
+def trampoline_video(monkeypatch, tmp_path):
+    """One existing equipment video, empty file_id cache"""
+    (tmp_path / "trampoline_safety.mp4").write_bytes(b"video")
+    monkeypatch.setattr(sport, "VIDEOS_DIR", tmp_path)
+    monkeypatch.setattr(sport, "_VIDEO_FILE_IDS", {})
+    videos = sport._build_equipment_videos(sport.CONTENT)
+    monkeypatch.setattr(sport, "_EQUIPMENT_VIDEOS", videos)
+    return videos
+
+
+def _equipment_callback() -> MagicMock:
+    callback = MagicMock()
+    callback.data = "sport_equip_trampoline"
+    callback.answer = AsyncMock()
+    callback.message.edit_text = AsyncMock()
+    callback.message.answer = AsyncMock()
+    callback.message.delete = AsyncMock()
+    callback.message.answer_video = AsyncMock(
+        return_value=MagicMock(video=MagicMock(file_id="FILE_ID"))
+    )
+    return callback
+
+
+@pytest.mark.asyncio
+async def test_equipment_video_sent_by_file_id(trampoline_video):
+    """Only existing videos are cached; repeat sends reuse the file_id"""
+    assert list(trampoline_video) == ["sport_equip_trampoline"]
+
+    callback = _equipment_callback()
+
+    await sport.show_equipment_instructions(callback)
+    await sport.show_equipment_instructions(callback)
+
+    first, second = callback.message.answer_video.await_args_list
+    assert first.kwargs["video"] is trampoline_video["sport_equip_trampoline"][0]
+    assert second.kwargs["video"] == "FILE_ID"
+
+
+@pytest.mark.asyncio
+async def test_equipment_video_rejected_file_id(trampoline_video):
+    """A file_id rejected by Telegram is dropped and the video is uploaded again"""
+    sport._VIDEO_FILE_IDS["sport_equip_trampoline"] = "STALE"
+    callback = _equipment_callback()
+    callback.message.answer_video.side_effect = [
+        TelegramBadRequest(method=MagicMock(), message="wrong file identifier"),
+        MagicMock(video=MagicMock(file_id="FILE_ID")),
+    ]
+
+    await sport.show_equipment_instructions(callback)
+
+    sent = [call.kwargs["video"] for call in callback.message.answer_video.await_args_list]
+    assert sent == ["STALE", trampoline_video["sport_equip_trampoline"][0]]
+    assert sport._VIDEO_FILE_IDS == {"sport_equip_trampoline": "FILE_ID"}
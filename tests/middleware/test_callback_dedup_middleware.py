@@ -0,0 +1,110 @@
+"""
+Unit tests for CallbackDedupMiddleware
+
+- Concurrent identical callbacks reach the handler once
+- Repeats within the window after success are dropped, later ones pass
+- Different buttons are not affected
+- An exception reaching the middleware releases the button without a window
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiogram.types import CallbackQuery
+
+from middlewares.callback_dedup import CallbackDedupMiddleware
+
+
+def _callback(data: str, message_id: int = 1) -> MagicMock:
+    callback = MagicMock(spec=CallbackQuery)
+    callback.data = data
+    callback.message = MagicMock()
+    callback.message.chat.id = 100
+    callback.message.message_id = message_id
+    callback.answer = AsyncMock()
+    return callback
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_concurrent_duplicates_dropped():
+    """A second press of the same button while the first runs is only answered"""
+    middleware = CallbackDedupMiddleware()
+    release = asyncio.Event()
+
+    async def wait_release(event, data):
+        await release.wait()
+
+    handler = AsyncMock(side_effect=wait_release)
+
+    first = asyncio.create_task(middleware(handler, _callback("gen_salary"), {}))
+    await asyncio.sleep(0)
+    duplicate = _callback("gen_salary")
+    await middleware(handler, duplicate, {})
+    release.set()
+    await first
+
+    assert handler.await_count == 1
+    duplicate.answer.assert_awaited_once_with()
+    assert middleware.stats["dropped"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_distinct_and_sequential_callbacks_pass():
+    """Other buttons, other messages and later presses all reach the handler"""
+    middleware = CallbackDedupMiddleware(window=0)
+    handler = AsyncMock(return_value="ok")
+
+    for callback in (
+        _callback("gen_salary"),
+        _callback("gen_salary"),
+        _callback("gen_orders"),
+        _callback("gen_salary", message_id=2),
+    ):
+        assert await middleware(handler, callback, {}) == "ok"
+
+    assert handler.await_count == 4
+    assert middleware.stats["dropped"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_key_released_after_handler_error():
+    """An exception propagating through the middleware does not leave the button locked"""
+    middleware = CallbackDedupMiddleware()
+    handler = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+
+    with pytest.raises(RuntimeError):
+        await middleware(handler, _callback("gen_salary"), {})
+
+    assert await middleware(handler, _callback("gen_salary"), {}) == "ok"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_repeat_within_window_dropped():
+    """A double tap right after success is dropped until the window expires"""
+    middleware = CallbackDedupMiddleware(window=0.5)
+    handler = AsyncMock(return_value="ok")
+
+    with patch("middlewares.callback_dedup.time.monotonic", side_effect=[10.0, 10.0, 10.2, 10.6, 10.6]):
+        await middleware(handler, _callback("gen_salary"), {})
+        duplicate = _callback("gen_salary")
+        assert await middleware(handler, duplicate, {}) is None
+        await middleware(handler, _callback("gen_salary"), {})
+
+    assert handler.await_count == 2
+    duplicate.answer.assert_awaited_once_with()
+
+
+def test_recent_keys_bounded():
+    """The recent-key store never grows past max_size"""
+    middleware = CallbackDedupMiddleware(window=60, max_size=3)
+
+    for message_id in range(10):
+        middleware._remember((100, message_id, "gen_salary"), now=float(message_id))
+
+    assert list(middleware._recent) == [(100, 7, "gen_salary"), (100, 8, "gen_salary"), (100, 9, "gen_salary")]
@@ -0,0 +1,57 @@
+"""
+Unit tests for ErrorHandlingMiddleware
+
+Tests:
+- "message is not modified" is swallowed without error logs or user messages
+- Other Bad Request errors are reported to the user
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, User
+
+from middlewares.errors import ErrorHandlingMiddleware
+
+
+def _callback() -> CallbackQuery:
+    return CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="User"),
+        chat_instance="1",
+        data="bar"
+    )
+
+
+def _bad_request(message: str) -> AsyncMock:
+    return AsyncMock(side_effect=TelegramBadRequest(method=MagicMock(), message=message))
+
+
+@pytest.mark.asyncio
+async def test_message_not_modified_is_silent():
+    """Identical edit only closes the button spinner"""
+    middleware = ErrorHandlingMiddleware()
+    handler = _bad_request("Bad Request: message is not modified")
+
+    with patch.object(CallbackQuery, "answer", new_callable=AsyncMock) as answer, \
+            patch("middlewares.errors.logger") as mock_logger:
+        result = await middleware(handler, _callback(), {})
+
+    assert result is None
+    answer.assert_awaited_once_with()
+    mock_logger.error.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_other_bad_request_is_reported():
+    """Unexpected Bad Request errors are logged and shown to the user"""
+    middleware = ErrorHandlingMiddleware()
+    handler = _bad_request("Bad Request: can't parse entities")
+
+    with patch.object(CallbackQuery, "answer", new_callable=AsyncMock) as answer, \
+            patch("middlewares.errors.logger") as mock_logger:
+        await middleware(handler, _callback(), {})
+
+    mock_logger.error.assert_called()
+    assert answer.await_args.kwargs["show_alert"] is True
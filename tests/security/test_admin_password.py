@@ -0,0 +1,42 @@
+"""
+Security tests for admin password verification.
+
+Tests SEC-001: bcrypt verification with legacy SHA-256 fallback.
+
+Tests:
+- bcrypt hash verification
+- Legacy SHA-256 digest comparison
+- Malformed hash handling
+"""
+
+import hashlib
+
+import bcrypt
+import pytest
+
+from handlers.admin import check_password
+
+
+class TestCheckPassword:
+    """Test suite for check_password"""
+
+    @pytest.mark.security
+    def test_bcrypt_hash(self):
+        """bcrypt hashes are verified with bcrypt.checkpw"""
+        password_hash = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode()
+
+        assert check_password("s3cret", password_hash) is True
+        assert check_password("wrong", password_hash) is False
+
+    @pytest.mark.security
+    def test_legacy_sha256_hash(self):
+        """Legacy SHA-256 hex hashes are compared as raw digests"""
+        password_hash = hashlib.sha256(b"admin123").hexdigest()
+
+        assert check_password("admin123", password_hash) is True
+        assert check_password("admin124", password_hash) is False
+
+    @pytest.mark.security
+    def test_malformed_legacy_hash(self):
+        """Non-hex legacy hashes never match"""
+        assert check_password("admin123", "not-a-hex-digest") is False
@@ -184,6 +184,22 @@ class TestBruteForceProtection:
         is_blocked, _ = await auth.is_user_blocked(user_id)
         assert is_blocked is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.security
+    async def test_concurrent_attempts_counted_exactly(self, mock_redis):
+        """Test concurrent attempts are not lost (Redis INCR is atomic, no lock needed)"""
+        auth = AuthSecurity(mock_redis)
+        user_id = 12345
+
+        results = await asyncio.gather(*[
+            auth.increment_password_attempts(user_id)
+            for _ in range(10)
+        ])
+
+        counts = sorted(attempts for attempts, _ in results)
+        assert counts == list(range(1, 11))
+        assert int(await mock_redis.get(f"admin:password_attempts:{user_id}")) == 10
+
     @pytest.mark.asyncio
     @pytest.mark.security
     async def test_failed_attempts_not_user_blocked(self, mock_redis):
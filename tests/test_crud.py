@@ -6,11 +6,16 @@ Run with: pytest tests/test_crud.py -v
 
 import pytest
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from database.models import Base, User, UserActivity
-from database.crud import UserCRUD, ActivityCRUD
+from database.crud import (
+    UserCRUD, ActivityCRUD, get_all_users_page, get_users_count,
+    get_users_active_since, count_users_active_since, get_broadcast_recipients,
+    get_active_users_count_cached, invalidate_users_count_cache,
+    get_media_file_id, set_media_file_id
+)
 
 
 # Fixture for test database
@@ -42,6 +47,16 @@ async def db_session():
     await engine.dispose()
 
 
+@pytest.fixture
+def wrapper_session(db_session, monkeypatch):
+    """Route compatibility wrappers (get_db_session) to the test session"""
+    async def _get_db_session():
+        yield db_session
+
+    monkeypatch.setattr("database.crud.get_db_session", _get_db_session)
+    return db_session
+
+
 @pytest.mark.asyncio
 async def test_create_user(db_session):
     """Test creating a new user"""
@@ -174,6 +189,85 @@ async def test_get_users_count(db_session):
     assert count == 5
 
 
+@pytest.mark.asyncio
+async def test_get_all_users_page(wrapper_session):
+    """Test paginated users wrapper returns only the requested page"""
+    for i in range(1, 13):
+        await UserCRUD.get_or_create_user(
+            session=wrapper_session,
+            telegram_id=i,
+            username=f"user_{i}"
+        )
+
+    assert await get_users_count() == 12
+
+    first_page = await get_all_users_page(offset=0, limit=10)
+    second_page = await get_all_users_page(offset=10, limit=10)
+
+    assert len(first_page) == 10
+    assert len(second_page) == 2
+    ids = {u.telegram_id for u in first_page} | {u.telegram_id for u in second_page}
+    assert ids == set(range(1, 13))
+
+
+@pytest.mark.asyncio
+async def test_get_users_active_since(wrapper_session):
+    """Test date filter runs in SQL and respects limit"""
+    now = datetime.utcnow()
+    for i in range(1, 6):
+        user = await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=i)
+        user.last_activity = now - timedelta(days=i - 1)
+    await wrapper_session.commit()
+
+    since = now - timedelta(days=2, hours=1)
+    recent = await get_users_active_since(since, limit=2)
+
+    assert [telegram_id for _, _, telegram_id, _ in recent] == [1, 2]
+    assert await count_users_active_since(since) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_broadcast_recipients(wrapper_session):
+    """Test broadcast recipients exclude blocked users and return plain IDs"""
+    for i in range(1, 5):
+        await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=i)
+    await UserCRUD.block_user(wrapper_session, 2)
+    inactive = await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=3)
+    inactive.is_active = False
+    await wrapper_session.commit()
+
+    assert sorted(await get_broadcast_recipients()) == [1, 3, 4]
+    assert sorted(await get_broadcast_recipients(active_only=True)) == [1, 4]
+
+
+@pytest.mark.asyncio
+async def test_active_users_count_cached(wrapper_session):
+    """Test cached count is reused within TTL and refreshed after invalidation"""
+    invalidate_users_count_cache()
+    await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=1)
+    assert await get_active_users_count_cached() == 1
+
+    await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=2)
+    assert await get_active_users_count_cached() == 1
+    assert await get_active_users_count_cached(ttl=0) == 2
+
+    await UserCRUD.get_or_create_user(session=wrapper_session, telegram_id=3)
+    invalidate_users_count_cache()
+    assert await get_active_users_count_cached() == 3
+
+
+@pytest.mark.asyncio
+async def test_media_file_id_roundtrip(wrapper_session):
+    """Test Telegram file_id is stored per content key and can be reset"""
+    assert await get_media_file_id("order_001") is None
+
+    await set_media_file_id("order_001", "orders", "FILE_ID", media_type="document")
+    assert await get_media_file_id("order_001") == "FILE_ID"
+
+    await set_media_file_id("order_001", "orders", None)
+    assert await get_media_file_id("order_001") is None
+
+
 @pytest.mark.asyncio
 async def test_user_full_name_property():
     """Test User model full_name property"""
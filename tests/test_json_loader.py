@@ -6,10 +6,13 @@ Run with: pytest tests/test_json_loader.py -v
 
 import pytest
 import json
+import os
 from pathlib import Path
 
 from utils.json_loader import (
     load_json_content,
+    load_handler_content,
+    render_content_entry,
     validate_json_structure,
     SafeDict,
     ContentSection,
@@ -76,6 +79,37 @@ def test_load_json_content_invalid_json(invalid_json_file):
         load_json_content(str(invalid_json_file), validate=False)
 
 
+def test_load_handler_content_cached_by_mtime(tmp_path):
+    """Unchanged files are parsed once, edited files are parsed again"""
+    json_file = tmp_path / "handler.json"
+    json_file.write_text('{"title": "one"}', encoding='utf-8')
+
+    first = load_handler_content(json_file)
+    assert load_handler_content(json_file) is first
+
+    json_file.write_text('{"title": "two"}', encoding='utf-8')
+    stat = json_file.stat()
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_handler_content(json_file) == {"title": "two"}
+
+
+def test_load_handler_content_errors(tmp_path, invalid_json_file):
+    """Missing or malformed files yield an empty dict instead of raising"""
+    assert load_handler_content(tmp_path / "missing.json") == {}
+    assert load_handler_content(invalid_json_file) == {}
+
+
+def test_render_content_entry_errors():
+    """A failing renderer yields the default and reports the entry instead of raising"""
+    errors = []
+
+    assert render_content_entry(str.upper, "ok", name="ok", errors=errors) == "OK"
+    assert render_content_entry(lambda data: data["missing"], {}, name="broken", default="-", errors=errors) == "-"
+    assert render_content_entry(lambda data: data.get("x"), "строка", name="typed") is None
+    assert errors == ["broken: KeyError('missing')"]
+
+
 def test_safe_dict_get():
     """Test SafeDict.get() method"""
     data = SafeDict({
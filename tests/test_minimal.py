@@ -108,8 +108,13 @@ def test_async_support():
     async def dummy():
         return 42
 
-    # Запускаем async функцию
-    result = asyncio.run(dummy())
+    # Запускаем async функцию в отдельном loop: asyncio.run() сбрасывает
+    # текущий event loop, и async-тесты после этого модуля падают
+    loop = asyncio.new_event_loop()
+    try:
+        result = loop.run_until_complete(dummy())
+    finally:
+        loop.close()
     assert result == 42, f"Async failed, got {result}"
     print("✓ Asyncio support works")
 
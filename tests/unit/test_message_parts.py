@@ -0,0 +1,62 @@
+"""
+Unit tests for utils.message_parts.
+
+Tests:
+- Short texts stay whole, long texts are cut into limit-sized parts
+- Multi-part text edits the first message and sends the rest in order
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from utils.message_parts import MESSAGE_CHUNK_SIZE, show_parts, split_message
+
+
+def _callback() -> MagicMock:
+    callback = MagicMock()
+    callback.answer = AsyncMock()
+    callback.message.edit_text = AsyncMock()
+    callback.message.answer = AsyncMock()
+    callback.message.delete = AsyncMock()
+    return callback
+
+
+@pytest.mark.unit
+def test_split_message():
+    """Short texts stay whole, long texts are cut into limit-sized parts"""
+    size = MESSAGE_CHUNK_SIZE
+
+    assert split_message("short") == ["short"]
+    assert split_message("x" * (size * 2 + 1)) == ["x" * size, "x" * size, "x"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_show_parts_single():
+    """A single part replaces the message together with the keyboard"""
+    callback = _callback()
+    markup = object()
+
+    await show_parts(callback, ["a"], markup, disable_web_page_preview=True)
+
+    callback.message.edit_text.assert_awaited_once_with(
+        text="a", reply_markup=markup, disable_web_page_preview=True
+    )
+    callback.message.answer.assert_not_awaited()
+    callback.answer.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_show_parts_keeps_order():
+    """The first part replaces the message, the rest follow in order"""
+    callback = _callback()
+    markup = object()
+
+    await show_parts(callback, ["a", "b", "c"], markup)
+
+    callback.message.edit_text.assert_awaited_once_with(text="a")
+    sent = [call.kwargs for call in callback.message.answer.await_args_list]
+    assert sent == [{"text": "b"}, {"text": "c", "reply_markup": markup}]
+    callback.message.delete.assert_not_called()
+    callback.answer.assert_awaited_once_with()
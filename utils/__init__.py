@@ -7,13 +7,20 @@
 """
 
 from utils.logger import logger, setup_logger, log_user_action
-from utils.json_loader import load_json_content, validate_json_structure, clear_json_cache, SafeDict
+from utils.json_loader import (
+    load_json_content, load_handler_content, read_json_async, render_content_entry,
+    CONTENT_UNAVAILABLE_TEXT, validate_json_structure, clear_json_cache, SafeDict
+)
 
 __all__ = [
     'logger',
     'setup_logger',
     'log_user_action',
     'load_json_content',
+    'load_handler_content',
+    'read_json_async',
+    'render_content_entry',
+    'CONTENT_UNAVAILABLE_TEXT',
     'validate_json_structure',
     'clear_json_cache',
     'SafeDict',
@@ -8,9 +8,11 @@ clear error messages when validation fails.
 
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, TypeVar
 from functools import lru_cache
 
+import aiofiles
+import orjson
 from pydantic import BaseModel, Field, validator
 from utils.logger import logger
 
@@ -167,15 +169,110 @@ def validate_json_structure(data: Dict[str, Any], required_keys: List[str]) -> b
     return True
 
 
+@lru_cache(maxsize=32)
+def _read_json_file(file_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file; cached per (path, mtime), so unchanged files are parsed once"""
+    return orjson.loads(Path(file_path).read_bytes())
+
+
+def load_handler_content(file_path: Path) -> Dict[str, Any]:
+    """
+    Load a handler content file (content/texts/*.json) at import time.
+
+    Shared replacement for the per-handler try/except load blocks: a missing
+    or malformed file is logged and yields an empty dict, so the bot still
+    starts. Parsed data is cached by (path, mtime) - repeated loads of an
+    unchanged file are free, an edited file is parsed again. The returned
+    dict is shared between callers and must not be mutated.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Dict with file content, or {} on error
+    """
+    try:
+        data = _read_json_file(str(file_path), file_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        logger.error(f"❌ Файл {file_path} не найден!")
+        return {}
+    except orjson.JSONDecodeError as e:
+        logger.error(f"❌ Ошибка парсинга JSON {file_path.name}: {e}")
+        return {}
+
+    logger.info(f"✅ Контент {file_path.name} загружен успешно")
+    return data
+
+
+T = TypeVar("T")
+
+# Подставляется вместо текста, который не удалось отрендерить из контента
+CONTENT_UNAVAILABLE_TEXT = "⚠️ Информация временно недоступна. Обратитесь к администратору."
+
+
+def render_content_entry(
+    render: Callable[..., T],
+    *args: Any,
+    name: str,
+    default: Optional[T] = None,
+    errors: Optional[List[str]] = None
+) -> Optional[T]:
+    """
+    Render one entry of handler content (a text, a park card, a section).
+
+    Handlers pre-render content at import and on reload. Like
+    load_handler_content, this never raises: a malformed entry (wrong type,
+    missing key - e.g. after an edit in the admin content editor) is logged
+    and yields default, so one bad value cannot stop the module from
+    importing. Handlers answer "не найдено" for entries left out.
+
+    Args:
+        render: Renderer, called as render(*args)
+        name: Entry name for the log and errors
+        default: Value returned when rendering fails
+        errors: If given, a "name: error" line is appended on failure
+
+    Returns:
+        Rendered entry, or default on error
+    """
+    try:
+        return render(*args)
+    except Exception as e:
+        logger.error(f"❌ Ошибка рендеринга контента '{name}': {e!r}")
+        if errors is not None:
+            errors.append(f"{name}: {e!r}")
+        return default
+
+
+async def read_json_async(file_path: Path) -> Dict[str, Any]:
+    """
+    Read a JSON file without blocking the event loop.
+
+    Used for hot-reloading handler content after it is edited at runtime.
+
+    Raises:
+        FileNotFoundError: If JSON file doesn't exist
+        orjson.JSONDecodeError: If JSON is malformed (subclass of json.JSONDecodeError)
+    """
+    async with aiofiles.open(file_path, "rb") as f:
+        data = await f.read()
+    return orjson.loads(data)
+
+
 # Clear cache function for reloading JSON during development
 def clear_json_cache():
     """Clear the LRU cache to force reload of JSON files"""
     load_json_content.cache_clear()
+    _read_json_file.cache_clear()
     logger.info("JSON content cache cleared")
 
 
 __all__ = [
     "load_json_content",
+    "load_handler_content",
+    "read_json_async",
+    "render_content_entry",
+    "CONTENT_UNAVAILABLE_TEXT",
     "validate_json_structure",
     "clear_json_cache",
     "SafeDict",
@@ -101,13 +101,10 @@ def setup_logger(
             enqueue=True
         )
     
+    # PERF: Все sinks с enqueue=True - запись идет в фоновом потоке, handler
+    # только кладет запись в очередь. Вызовы ниже log_level отсекаются loguru
+    # сразу, без создания записи
     logger.info(f"Система логирования инициализирована. Уровень: {log_level}")
-    
-    # Добавляем перехват стандартных логгеров Python
-    logger.add(
-        lambda msg: None,  # Пустой обработчик для перехвата
-        filter=lambda record: record["level"].no >= logger.level(log_level).no
-    )
 
 
 def log_user_action(
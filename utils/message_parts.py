@@ -0,0 +1,49 @@
+"""
+Длинные тексты разделов: разбиение под лимит Telegram и показ по частям.
+
+Общие для handlers/general_info.py и handlers/sport.py, чтобы длинные
+инструкции во всех разделах выглядели одинаково.
+"""
+
+from typing import Any
+
+from aiogram.types import CallbackQuery
+
+
+# Telegram ограничивает длину сообщения 4096 символов - берем с запасом
+MESSAGE_CHUNK_SIZE = 4000
+
+
+def split_message(text: str) -> list[str]:
+    """Разбивает текст на части не длиннее MESSAGE_CHUNK_SIZE"""
+    if len(text) <= MESSAGE_CHUNK_SIZE:
+        return [text]
+    return [
+        text[i:i + MESSAGE_CHUNK_SIZE]
+        for i in range(0, len(text), MESSAGE_CHUNK_SIZE)
+    ]
+
+
+async def show_parts(callback: CallbackQuery, parts: list[str], reply_markup, **send_kwargs: Any) -> None:
+    """
+    Показывает текст из одной или нескольких частей (см. split_message)
+    и отвечает на callback.
+
+    PERF: Первая часть заменяет исходное сообщение через edit_text, остальные
+    досылаются следом - без лишнего удаления старого сообщения. Части идут
+    строго последовательно: это шаги инструкций, а параллельные sendMessage
+    Telegram может доставить вразнобой. Кнопки - только у последней части.
+
+    Args:
+        send_kwargs: Доп. параметры каждой отправки (например, disable_web_page_preview)
+    """
+    if len(parts) == 1:
+        await callback.message.edit_text(text=parts[0], reply_markup=reply_markup, **send_kwargs)
+        await callback.answer()
+        return
+
+    await callback.message.edit_text(text=parts[0], **send_kwargs)
+    for part in parts[1:-1]:
+        await callback.message.answer(text=part, **send_kwargs)
+    await callback.message.answer(text=parts[-1], reply_markup=reply_markup, **send_kwargs)
+    await callback.answer()
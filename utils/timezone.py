@@ -14,6 +14,7 @@
 from datetime import datetime
 from typing import Optional, Any
 import sys
+import time
 
 
 # Попытка использовать zoneinfo (Python 3.9+) с fallback на pytz
@@ -172,3 +173,30 @@ def get_msk_now() -> datetime:
     else:  # pytz
         # pytz рекомендует использовать normalize для текущего времени
         return MOSCOW_TZ.normalize(datetime.now(MOSCOW_TZ))
+
+
+# PERF: Кеш отформатированного текущего времени МСК: формат -> (секунда, строка)
+_msk_now_cache: dict = {}
+
+
+def format_msk_now(fmt: str = "%d.%m.%Y %H:%M:%S") -> str:
+    """
+    Форматирует текущее московское время в строку.
+
+    Результат кешируется в пределах одной секунды для каждого формата:
+    запросы, пришедшие в ту же секунду, не повторяют strftime.
+
+    Args:
+        fmt: Формат строки (по умолчанию "DD.MM.YYYY HH:MM:SS")
+
+    Returns:
+        Отформатированная строка с текущим временем по МСК
+    """
+    now_second = int(time.time())
+    cached = _msk_now_cache.get(fmt)
+    if cached is not None and cached[0] == now_second:
+        return cached[1]
+
+    formatted = datetime.fromtimestamp(now_second, MOSCOW_TZ).strftime(fmt)
+    _msk_now_cache[fmt] = (now_second, formatted)
+    return formatted